@@ -7,13 +7,20 @@
 
 """Main copyright checker with auto-insertion functionality"""
 
+import functools
+import hashlib
+import json
 import logging
 import os
 import re
+import shutil
 import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 try:
     import pathspec
@@ -22,8 +29,159 @@ try:
 except ImportError:
     HAS_PATHSPEC = False
 
+try:
+    from rapidfuzz.distance import LCSseq
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 from .copyright_template_parser import CopyrightTemplate, CopyrightTemplateParser
 
+# Workers check_files uses by default. Kept small because pre-commit already
+# runs one hook process per CPU, and every worker queries the same git repository
+DEFAULT_MAX_WORKERS = 4
+
+# Replace mode spends most of its time in pure-Python similarity scoring, which
+# threads cannot parallelize; batches at least this large go to worker processes
+PROCESS_POOL_MIN_FILES = 32
+
+# Minimum token overlap between two author entities for their copyrights to be
+# considered for replacement. This prevents replacing "NSCE" with "SCDE" or
+# "Haptic Europe" with "R&D Center".
+ENTITY_MATCH_THRESHOLD = 0.7
+
+# An existing header notice is only looked for in this many leading lines, so
+# the cost of the search does not grow with the size of the file
+HEADER_SCAN_LINES = 100
+
+# Patterns used on every checked file, compiled once at import
+_COMMENT_PREFIX_RE = re.compile(r"^(\s*[#/\-*]+\s*)")
+_AUTHOR_LINE_RE = re.compile(r"author\s*:\s*([^\n]+)", re.IGNORECASE)
+# The unit part of an author line ends at the first comma, "Laboratory" or
+# company name, whichever comes first
+_ENTITY_PREFIX_RE = re.compile(
+    r"(.*?)(?:,|\s+laboratory|\s*sony\s+group\s+corporation|$)", re.IGNORECASE
+)
+_NON_ENTITY_CHARS_RE = re.compile(r"[^\w\s&]")
+# Years are ASCII digits; re.ASCII lets the engine skip Unicode class lookups
+# for \b and \d at every position of the scanned text
+_YEAR_RANGE_RE = re.compile(r"\b\d{4}(-\d{4})?\b", re.ASCII)
+_COPYRIGHT_SYMBOL_RE = re.compile(r"[©Ⓒⓒ(c)(C)]", re.IGNORECASE)
+_COPYRIGHT_KEYWORD_RE = re.compile(
+    r"\b(copyright|author|license|spdx-license-identifier)\s*:?\s*", re.IGNORECASE
+)
+_NON_TEXT_CHARS_RE = re.compile(r"[^\w\s.,&-]")
+# An escaped character, a triple quote or a single quote, in that order
+_QUOTE_TOKEN_RE = re.compile(r"\\.|\"{3}|'{3}|[\"']")
+_GENERAL_YEAR_RE = re.compile(r"\b(\d{4})(?:\s*[-\u2013]\s*(\d{4}))?\b", re.ASCII)
+
+
+@functools.lru_cache(maxsize=256)
+def _entity_from_author_line(author_line: str) -> Optional[str]:
+    """
+    Reduce an Author: line to its organizational unit identifier.
+
+    :param author_line: Text after "Author:", stripped
+    :return: Key entity identifier or None
+    """
+    # Extract the first significant part before comma or "Laboratory" or company name
+    # This captures the unit/department identifier
+    # Examples:
+    #   "R&D Center Europe Brussels Laboratory" -> "r&d center europe"
+    #   "Haptic Europe, Brussels Laboratory" -> "haptic europe"
+    #   "NSCE, Brussels Laboratory" -> "nsce"
+
+    # Drop the company name and take the part before "Laboratory" or the
+    # first comma, in a single match
+    entity = _ENTITY_PREFIX_RE.match(author_line).group(1).strip()
+    # Normalize: lowercase, keep &, normalize whitespace
+    # Preserve & as it's important for "R&D"
+    entity = _NON_ENTITY_CHARS_RE.sub(" ", entity)
+    entity = " ".join(entity.split()).lower()
+    return entity if entity else None
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_similarity_text(text: str) -> str:
+    """
+    Normalize copyright text for similarity comparison.
+
+    :param text: Copyright text to normalize
+    :return: Normalized text for comparison
+    """
+    # Remove years (4-digit numbers and year ranges)
+    text = _YEAR_RANGE_RE.sub("", text)
+
+    # Remove common copyright symbols and markers
+    text = _COPYRIGHT_SYMBOL_RE.sub("", text)
+
+    # Remove common prefixes/keywords to focus on entity
+    text = _COPYRIGHT_KEYWORD_RE.sub("", text)
+
+    # Normalize whitespace (split/join runs in C, no regex needed)
+    text = " ".join(text.split())
+
+    # Remove special characters except basic punctuation
+    text = _NON_TEXT_CHARS_RE.sub("", text)
+
+    # Convert to lowercase for case-insensitive comparison
+    text = text.lower().strip()
+
+    return text
+
+
+@functools.lru_cache(maxsize=256)
+def _char_ngrams(text: str, n: int) -> FrozenSet[str]:
+    """
+    Extract the character n-grams of a text.
+
+    Every file in a run is scored against the same few template texts, so
+    their n-grams are computed once and reused.
+
+    :param text: Normalized text
+    :param n: Size of n-grams
+    :return: Set of n-grams (the text itself if shorter than n)
+    """
+    if len(text) < n:
+        return frozenset((text,))
+    return frozenset(text[i : i + n] for i in range(len(text) - n + 1))
+
+
+@functools.lru_cache(maxsize=256)
+def _word_tokens(text: str) -> FrozenSet[str]:
+    """
+    Split a text into its set of whitespace-separated tokens.
+
+    Tokens are interned: the same few words recur in every notice, so set
+    intersections mostly compare them by identity.
+
+    :param text: Normalized text
+    :return: Set of tokens
+    """
+    return frozenset(map(sys.intern, text.split()))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_template_file(
+    template_path: str, data: bytes
+) -> Dict[str, CopyrightTemplate]:
+    """
+    Parse a template file's content, reusing the result while it is unchanged.
+
+    The file's raw content is part of the cache key, so an edited template is
+    parsed again even when its size and modification time stay the same (a
+    rewrite within one coarse mtime tick, or a copy that preserves times).
+    Templates are small, so reading and hashing them on every load is cheap.
+    Callers must not mutate the returned dictionary.
+
+    :param template_path: Absolute path to the template file, for error messages
+    :param data: Content of the template file
+    :return: Dictionary mapping file extensions to CopyrightTemplate objects
+    :raises ValueError: If the content is not UTF-8 or not a valid template
+    """
+    return CopyrightTemplateParser.parse_string(data.decode("utf-8"), template_path)
+
 
 class CopyrightChecker:
     """Copyright checker with support for multiple file formats and auto-insertion"""
@@ -37,6 +195,8 @@ class CopyrightChecker:
         hierarchical: bool = False,
         replace_mode: bool = False,
         per_file_years: bool = False,
+        templates: Optional[Dict[str, CopyrightTemplate]] = None,
+        cache_file: Optional[str] = None,
     ):
         """
         Initialize the copyright checker.
@@ -48,6 +208,8 @@ class CopyrightChecker:
         :param hierarchical: If True, look for template_path in each directory hierarchy (default: False)
         :param replace_mode: If True, replace similar existing copyrights (default: False)
         :param per_file_years: If True, use individual file creation years; if False, use project inception year (default: False)
+        :param templates: Already parsed templates to use instead of parsing template_path (ignored in hierarchical mode)
+        :param cache_file: Path to a JSON file remembering files that already had a valid notice (default: None, no cache)
         """
         self.template_path = template_path
         self.templates: Dict[str, CopyrightTemplate] = {}
@@ -61,9 +223,23 @@ class CopyrightChecker:
         self.template_cache: Dict[str, Optional[Dict[str, CopyrightTemplate]]] = {}
         # Cache for project creation year
         self._repo_year_cache: Optional[int] = None
+        # Cache for template author entities: template lines -> entity
+        self._template_entity_cache: Dict[Tuple[str, ...], Optional[str]] = {}
+        # Cache for similarity scores: (text1, text2, threshold) -> score
+        self._similarity_cache: Dict[Tuple[str, str, Optional[float]], float] = {}
+        # Cache for template fingerprints: template lines -> digest
+        self._template_digest_cache: Dict[Tuple[str, ...], str] = {}
+        # Files known to carry a valid notice: abs path -> [mtime_ns, size, digest]
+        self.cache_file = cache_file
+        self._valid_files: Optional[Dict[str, list]] = None
+        if cache_file:
+            self._valid_files = self._load_cache(cache_file)
 
         if not hierarchical:
-            self.templates = self._load_templates()
+            if templates is not None:
+                self.templates = templates
+            else:
+                self.templates = self._load_templates()
         else:
             logging.info(
                 f"Hierarchical mode enabled: looking for '{template_path}' in directory tree"
@@ -71,6 +247,61 @@ class CopyrightChecker:
 
         self._load_ignore_patterns(ignore_file)
 
+    @classmethod
+    def from_string(
+        cls, template_text: str, template_path: str = "<string>", **kwargs
+    ) -> "CopyrightChecker":
+        """
+        Create a checker from in-memory template text instead of a template file.
+
+        :param template_text: Copyright template content
+        :param template_path: Name reported for the template in logs and errors
+        :param kwargs: Other CopyrightChecker options (hierarchical mode is not supported)
+        :return: Configured CopyrightChecker
+        :raises ValueError: If the template text is invalid or hierarchical is requested
+        """
+        if kwargs.get("hierarchical"):
+            raise ValueError("Hierarchical mode requires a template file name")
+        try:
+            templates = CopyrightTemplateParser.parse_string(
+                template_text, template_path
+            )
+        except ValueError as e:
+            raise ValueError(f"Failed to parse copyright template: {e}")
+        return cls(template_path, templates=templates, **kwargs)
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle the checker for a worker process without its memoized scores.
+
+        The similarity, entity and digest caches only help the process that
+        filled them and can grow with every file checked, so workers start
+        with them empty instead of receiving a copy at start-up. The
+        valid-notice cache is kept so workers can skip cached files; the
+        entries they add are sent back by _check_in_process.
+
+        :return: Instance state to pickle
+        """
+        state = self.__dict__.copy()
+        state["_similarity_cache"] = {}
+        state["_template_entity_cache"] = {}
+        state["_template_digest_cache"] = {}
+        return state
+
+    def reset_state(self) -> None:
+        """
+        Forget everything learned from the files checked so far.
+
+        Clears the memoized scores, the hierarchical template lookups and the
+        repository creation year while keeping the parsed templates, so one
+        checker can be reused for unrelated runs.
+        """
+        self.template_cache.clear()
+        self._repo_year_cache = None
+        self._template_entity_cache.clear()
+        self._similarity_cache.clear()
+        self._template_digest_cache.clear()
+
     def _load_templates(
         self, template_file: Optional[str] = None
     ) -> Dict[str, CopyrightTemplate]:
@@ -81,7 +312,9 @@ class CopyrightChecker:
         """
         template_file = template_file or self.template_path
         try:
-            templates = CopyrightTemplateParser.parse(template_file)
+            with open(template_file, "rb") as f:
+                data = f.read()
+            templates = dict(_parse_template_file(os.path.abspath(template_file), data))
             logging.debug(
                 f"Loaded {len(templates)} copyright templates from {template_file} "
                 f"for extensions: {', '.join(templates.keys())}"
@@ -99,6 +332,51 @@ class CopyrightChecker:
             logging.warning(f"Failed to parse {template_file}: {e}")
             return {}
 
+    def _load_cache(self, cache_file: str) -> Dict[str, list]:
+        """
+        Load the valid-notice cache, starting empty if it is missing or unreadable.
+
+        :param cache_file: Path to the JSON cache file
+        :return: Dictionary mapping absolute file paths to [mtime_ns, size, digest]
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                entries = json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return {}
+        if not isinstance(entries, dict):
+            logging.warning(f"Ignoring malformed cache file: {cache_file}")
+            return {}
+        logging.debug(f"Loaded {len(entries)} cached results from {cache_file}")
+        return entries
+
+    def save_cache(self) -> None:
+        """Write the valid-notice cache back to cache_file, if one is configured."""
+        if self._valid_files is None:
+            return
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(self._valid_files, f, separators=(",", ":"))
+        except OSError as e:
+            logging.warning(f"Failed to write cache file {self.cache_file}: {e}")
+
+    def _get_template_digest(self, template: CopyrightTemplate) -> str:
+        """
+        Get a fingerprint of a template, so that cached results expire when it changes.
+
+        :param template: Copyright template
+        :return: Hex digest of the template lines
+        """
+        key = template.lines
+        if key not in self._template_digest_cache:
+            self._template_digest_cache[key] = hashlib.blake2b(
+                "\n".join(key).encode("utf-8"), digest_size=16
+            ).hexdigest()
+        return self._template_digest_cache[key]
+
     def _find_copyright_file(self, directory: str) -> Optional[str]:
         """
         Find the nearest copyright template file by traversing up the directory tree.
@@ -212,7 +490,8 @@ class CopyrightChecker:
                     line = line.strip()
                     # Skip empty lines and comments
                     if line and not line.startswith("#"):
-                        patterns.append(line)
+                        # Interned so repeated patterns share one string object
+                        patterns.append(sys.intern(line))
         except Exception as e:
             logging.warning(f"Failed to read ignore file {filepath}: {e}")
         return patterns
@@ -254,7 +533,7 @@ class CopyrightChecker:
                 return False
 
         # Normalize path separators for matching
-        filepath = filepath.replace("\\", "/")
+        filepath = sys.intern(filepath.replace("\\", "/"))
 
         is_ignored = self.ignore_spec.match_file(filepath)
         if is_ignored:
@@ -270,7 +549,9 @@ class CopyrightChecker:
         :return: Tuple of (has_valid_notice, was_modified)
         :raises FileNotFoundError: If the file doesn't exist
         """
-        if not os.path.exists(filepath):
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Source file not found: {filepath}")
 
         # Get file extension
@@ -296,11 +577,29 @@ class CopyrightChecker:
 
         template = templates[file_ext]
 
-        # Read file content (preserve line endings for later)
+        # A file seen with a valid notice is skipped while it and its template
+        # are unchanged
+        cache_entry = None
+        if self._valid_files is not None:
+            cache_key = os.path.abspath(filepath)
+            cache_entry = [
+                st.st_mtime_ns,
+                st.st_size,
+                self._get_template_digest(template),
+            ]
+            if self._valid_files.get(cache_key) == cache_entry:
+                logging.debug(f"Valid copyright notice cached for: {filepath}")
+                return True, False
+
+        # Read file content (preserve line endings for later). The raw bytes
+        # are not kept alive next to the decoded text, which keeps the peak
+        # footprint of large files at one copy while they are scanned.
+        # The whole file is needed even when the notice is at the top: a
+        # duplicate notice may appear anywhere, and undecodable (binary)
+        # files are recognised by decoding all of it.
         try:
             with open(filepath, "rb") as f:
-                raw_content = f.read()
-            content = raw_content.decode("utf-8")
+                content = f.read().decode("utf-8")
         except UnicodeDecodeError:
             # Try with different encoding or skip binary files
             logging.warning(f"Cannot read file (binary or encoding issue): {filepath}")
@@ -309,10 +608,12 @@ class CopyrightChecker:
         # Detect line ending style
         line_ending = self._detect_line_ending(content)
 
-        # Check if copyright notice exists and matches template
-        if template.matches(content):
+        # Check if copyright notice exists and matches template; one scan
+        # finds both the notice and any duplicates of it
+        match_positions = template.find_all_matches(content)
+        if match_positions:
             # Check for duplicate copyright notices (exact matches)
-            if template.has_duplicates(content):
+            if len(match_positions) > 1:
                 logging.warning(f"Multiple copyright notices detected in: {filepath}")
                 if auto_fix:
                     logging.info(
@@ -320,7 +621,7 @@ class CopyrightChecker:
                     )
                     try:
                         self._remove_duplicate_copyrights(
-                            filepath, template, content, line_ending
+                            filepath, template, content, line_ending, match_positions
                         )
                         return True, True
                     except Exception as e:
@@ -366,6 +667,8 @@ class CopyrightChecker:
                     return False, False
 
             logging.debug(f"Valid copyright notice found in: {filepath}")
+            if cache_entry is not None:
+                self._valid_files[cache_key] = cache_entry
             return True, False
 
         # Copyright notice doesn't match template exactly
@@ -377,9 +680,7 @@ class CopyrightChecker:
             copyright_text, _, _ = existing_copyright
 
             # Check if it's from our business unit or a different one
-            template_entity = self._extract_author_entity(
-                template.get_notice_with_year("2024")
-            )
+            template_entity = self._get_template_entity(template)
             existing_entity = self._extract_author_entity(copyright_text)
 
             is_same_business_unit = (
@@ -396,7 +697,11 @@ class CopyrightChecker:
                     )
                     try:
                         was_replaced = self._replace_copyright_notice(
-                            filepath, template, content, line_ending
+                            filepath,
+                            template,
+                            content,
+                            line_ending,
+                            existing_copyright,
                         )
                         if was_replaced:
                             return True, True
@@ -418,14 +723,24 @@ class CopyrightChecker:
             elif self.replace_mode:
                 # Replace mode enabled - try to replace if similar enough
                 # If similarity is too low, _replace_copyright_notice returns False
-                # and we'll fall through to add our copyright instead
-                if auto_fix:
+                # and we'll fall through to add our copyright instead.
+                # A different business unit can never be similar enough, so
+                # skip the similarity scoring for it altogether.
+                if not self._entities_compatible(existing_entity, template_entity):
+                    logging.debug(
+                        f"Copyright in {filepath} is from a different entity, will add our copyright instead"
+                    )
+                elif auto_fix:
                     logging.info(
                         f"Replace mode enabled, attempting to replace copyright in: {filepath}..."
                     )
                     try:
                         was_replaced = self._replace_copyright_notice(
-                            filepath, template, content, line_ending
+                            filepath,
+                            template,
+                            content,
+                            line_ending,
+                            existing_copyright,
                         )
                         if was_replaced:
                             return True, True
@@ -556,69 +871,75 @@ class CopyrightChecker:
         :param line_number: The line number to check (0-indexed)
         :return: True if the line is inside a string literal
         """
+        return self._string_literal_states(lines, line_number)[line_number]
+
+    def _string_literal_states(self, lines: List[str], last_line: int) -> List[bool]:
+        """
+        Track multi-line string literals through the leading lines in one pass.
+
+        Lines that cannot change the state (no quote outside a string, no
+        closing delimiter inside one) are skipped without a character scan.
+
+        :param lines: All lines in the file
+        :param last_line: Last line number to report on (0-indexed)
+        :return: For each line up to last_line, whether it ends inside a string literal
+        """
+        states = []
         in_multiline_string = False
         multiline_delimiter = None
 
-        for i in range(line_number + 1):
-            line = lines[i]
+        for line in lines[: last_line + 1]:
+            if in_multiline_string:
+                if multiline_delimiter not in line:
+                    states.append(True)
+                    continue
+            elif '"' not in line and "'" not in line:
+                states.append(False)
+                continue
 
             # Track single-line string state to avoid false positives
-            # We need to ignore """ or ''' that appear inside regular strings
+            # We need to ignore """ or ''' that appear inside regular strings.
+            # Only escapes and quotes can change the state, so the regex jumps
+            # from one to the next instead of stepping through every character.
             in_single_string = False
             single_string_char = None
-            escaped = False
-
-            j = 0
-            while j < len(line):
-                char = line[j]
 
-                if escaped:
-                    escaped = False
-                    j += 1
-                    continue
+            pos = 0
+            while True:
+                match = _QUOTE_TOKEN_RE.search(line, pos)
+                if not match:
+                    break
+                token = match.group()
+                pos = match.end()
 
-                if char == "\\":
-                    escaped = True
-                    j += 1
+                if token[0] == "\\":
+                    # Escaped character
                     continue
 
                 # If we're in a multi-line string, just check for its closing delimiter
                 if in_multiline_string:
-                    if j + 2 < len(line) and line[j : j + 3] == multiline_delimiter:
+                    if token == multiline_delimiter:
                         in_multiline_string = False
                         multiline_delimiter = None
-                        j += 3
-                        continue
-                    j += 1
                     continue
 
                 # Track single-line strings
-                if char in ('"', "'"):
-                    if not in_single_string:
-                        # Check for triple quote
-                        if j + 2 < len(line) and line[j : j + 3] in ('"""', "'''"):
-                            in_multiline_string = True
-                            multiline_delimiter = line[j : j + 3]
-                            j += 3
-                            continue
-                        else:
-                            in_single_string = True
-                            single_string_char = char
-                            j += 1
-                            continue
-                    elif char == single_string_char:
+                if in_single_string:
+                    if token[0] == single_string_char:
                         in_single_string = False
                         single_string_char = None
-                        j += 1
-                        continue
-
-                j += 1
+                        # Only the first quote closes the string
+                        pos = match.start() + 1
+                elif len(token) == 3:
+                    in_multiline_string = True
+                    multiline_delimiter = token
+                else:
+                    in_single_string = True
+                    single_string_char = token
 
-            # If we've reached the target line, return the multi-line string state
-            if i == line_number:
-                return in_multiline_string
+            states.append(in_multiline_string)
 
-        return in_multiline_string
+        return states
 
     def _remove_duplicate_copyrights(
         self,
@@ -626,6 +947,7 @@ class CopyrightChecker:
         template: CopyrightTemplate,
         content: str,
         line_ending: str = "\n",
+        all_match_positions: Optional[List[int]] = None,
     ) -> None:
         """
         Remove duplicate copyright notices, keeping only the first (most recent) one.
@@ -637,20 +959,26 @@ class CopyrightChecker:
         :param template: Copyright template to match
         :param content: Current file content
         :param line_ending: Line ending style to use ("\r\n" or "\n")
+        :param all_match_positions: Notice positions already found in content
+            by template.find_all_matches (found here if None)
         """
         # Normalize content to LF for processing
         normalized_content = content.replace("\r\n", "\n")
         lines = normalized_content.split("\n")
 
-        # Find all copyright notice positions in the entire file
-        all_match_positions = template.find_all_matches(normalized_content)
+        # Find all copyright notice positions in the entire file. Template
+        # lines match up to trailing whitespace, so dropping the \r of CRLF
+        # line endings does not move them.
+        if all_match_positions is None:
+            all_match_positions = template.find_all_matches(normalized_content)
 
         # Filter out matches that are inside string literals
-        match_positions = [
-            pos
-            for pos in all_match_positions
-            if not self._is_inside_string_literal(lines, pos)
-        ]
+        in_string = (
+            self._string_literal_states(lines, all_match_positions[-1])
+            if all_match_positions
+            else []
+        )
+        match_positions = [pos for pos in all_match_positions if not in_string[pos]]
 
         if len(match_positions) <= 1:
             # No duplicates to remove
@@ -709,7 +1037,7 @@ class CopyrightChecker:
             return []
 
         first_template_line = template.lines[0]
-        comment_prefix_match = re.match(r"^(\s*[#/\-*]+\s*)", first_template_line)
+        comment_prefix_match = _COMMENT_PREFIX_RE.match(first_template_line)
         if not comment_prefix_match:
             return []
 
@@ -831,43 +1159,132 @@ class CopyrightChecker:
         )
 
     def check_files(
-        self, filepaths: List[str], auto_fix: bool = True
+        self,
+        filepaths: List[str],
+        auto_fix: bool = True,
+        max_workers: Optional[int] = None,
     ) -> Tuple[List[str], List[str], List[str]]:
         """
         Check multiple files for copyright notices.
 
+        Files are checked concurrently on a thread pool so that file reads,
+        writes and git queries overlap; results keep the input order.
+        In replace mode, batches of at least PROCESS_POOL_MIN_FILES files are
+        checked on a process pool instead, because similarity scoring is
+        CPU-bound. Paths naming the same file (e.g. "a.py" and "./a.py") are
+        checked once, under the first spelling given, so two workers never
+        rewrite one file. The returned lists therefore hold each file once
+        and can be shorter than filepaths.
+
         :param filepaths: List of file paths to check
         :param auto_fix: If True, automatically add missing copyright notices
+        :param max_workers: Maximum number of worker threads or processes
+            (default: DEFAULT_MAX_WORKERS); 1 checks the files one by one
         :return: Tuple of (passed_files, failed_files, modified_files)
         """
-        passed = []
-        failed = []
-        modified = []
-
+        first_spellings: Dict[str, str] = {}
         for filepath in filepaths:
-            # Skip ignored files
-            if self.should_ignore(filepath):
-                logging.debug(f"Skipping ignored file: {filepath}")
-                passed.append(filepath)  # Consider ignored files as "passed"
-                continue
+            first_spellings.setdefault(
+                os.path.normcase(os.path.abspath(filepath)), filepath
+            )
+        unique_paths = list(first_spellings.values())
+        if (
+            self.replace_mode
+            and len(unique_paths) >= PROCESS_POOL_MIN_FILES
+            and max_workers != 1
+        ):
+            outcomes = self._check_in_processes(unique_paths, auto_fix, max_workers)
+        elif len(unique_paths) > 1 and max_workers != 1:
+            with ThreadPoolExecutor(
+                max_workers=max_workers or DEFAULT_MAX_WORKERS
+            ) as executor:
+                outcomes = list(
+                    executor.map(
+                        lambda filepath: self._check_one(filepath, auto_fix),
+                        unique_paths,
+                    )
+                )
+        else:
+            outcomes = [
+                self._check_one(filepath, auto_fix) for filepath in unique_paths
+            ]
 
-            try:
-                has_notice, was_modified = self.check_file(filepath, auto_fix)
-                if has_notice:
-                    passed.append(filepath)
-                    if was_modified:
-                        modified.append(filepath)
-                else:
-                    failed.append(filepath)
-            except FileNotFoundError:
-                logging.error(f"File not found: {filepath}")
-                failed.append(filepath)
-            except Exception as e:
-                logging.error(f"Error checking {filepath}: {e}")
-                failed.append(filepath)
+        # Paths and outcomes are parallel lists; each result list is one filter
+        passed = [p for p, o in zip(unique_paths, outcomes) if o != "failed"]
+        failed = [p for p, o in zip(unique_paths, outcomes) if o == "failed"]
+        modified = [p for p, o in zip(unique_paths, outcomes) if o == "modified"]
 
         return passed, failed, modified
 
+    def _check_in_processes(
+        self, filepaths: List[str], auto_fix: bool, max_workers: Optional[int]
+    ) -> List[str]:
+        """
+        Check files on a process pool on behalf of check_files.
+
+        Each worker receives a copy of this checker once, at start-up, so
+        caches filled in the workers (e.g. the repository creation year) are
+        not shared back. The valid-notice cache entries a worker records are
+        the exception: they come back with each outcome and are merged into
+        this checker, so save_cache() sees them. Workers also receive the
+        root logger's level and format, because under the spawn and
+        forkserver start methods they do not inherit the logging
+        configuration of this process.
+
+        :param filepaths: Unique file paths to check
+        :param auto_fix: If True, automatically add missing copyright notices
+        :param max_workers: Maximum number of worker processes (default:
+            DEFAULT_MAX_WORKERS, not the CPU count, since pre-commit already
+            runs one hook process per CPU)
+        :return: Outcome of _check_one for each path, in input order
+        """
+        workers = max_workers or DEFAULT_MAX_WORKERS
+        chunksize = max(1, len(filepaths) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_process_worker,
+            initargs=(self, _root_logging_config()),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _check_in_process,
+                    filepaths,
+                    [auto_fix] * len(filepaths),
+                    chunksize=chunksize,
+                )
+            )
+
+        if self._valid_files is not None:
+            for filepath, (_, cache_entry) in zip(filepaths, results):
+                if cache_entry is not None:
+                    self._valid_files[os.path.abspath(filepath)] = cache_entry
+        return [outcome for outcome, _ in results]
+
+    def _check_one(self, filepath: str, auto_fix: bool) -> str:
+        """
+        Check a single file on behalf of check_files.
+
+        :param filepath: Path to the file to check
+        :param auto_fix: If True, automatically add missing copyright notices
+        :return: "passed", "modified" or "failed"
+        """
+        # Skip ignored files
+        if self.should_ignore(filepath):
+            logging.debug(f"Skipping ignored file: {filepath}")
+            return "passed"  # Consider ignored files as "passed"
+
+        try:
+            has_notice, was_modified = self.check_file(filepath, auto_fix)
+            if not has_notice:
+                return "failed"
+            return "modified" if was_modified else "passed"
+        except FileNotFoundError:
+            logging.error(f"File not found: {filepath}")
+            return "failed"
+        except Exception as e:
+            logging.error(f"Error checking {filepath}: {e}")
+            return "failed"
+
     def get_supported_extensions(self) -> Set[str]:
         """
         Get the set of supported file extensions.
@@ -1182,38 +1599,58 @@ class CopyrightChecker:
         :return: Key entity identifier or None
         """
         # Look for Author: line
-        author_match = re.search(r"author\s*:\s*([^\n]+)", text, re.IGNORECASE)
+        author_match = _AUTHOR_LINE_RE.search(text)
         if not author_match:
             return None
 
-        author_line = author_match.group(1).strip()
+        # The same few author lines recur across files, so their entity is cached
+        return _entity_from_author_line(author_match.group(1).strip())
 
-        # Extract the first significant part before comma or "Laboratory" or company name
-        # This captures the unit/department identifier
-        # Examples:
-        #   "R&D Center Europe Brussels Laboratory" -> "r&d center europe"
-        #   "Haptic Europe, Brussels Laboratory" -> "haptic europe"
-        #   "NSCE, Brussels Laboratory" -> "nsce"
+    def _get_template_entity(self, template: CopyrightTemplate) -> Optional[str]:
+        """
+        Get the author entity of a template, extracting it once per template.
 
-        # Remove company name to focus on the unit
-        author_line = re.sub(
-            r",?\s*sony\s+group\s+corporation.*", "", author_line, flags=re.IGNORECASE
-        )
+        :param template: Copyright template
+        :return: Key entity identifier or None
+        """
+        key = template.lines
+        if key not in self._template_entity_cache:
+            self._template_entity_cache[key] = self._extract_author_entity(
+                template.get_notice_with_year("2024")
+            )
+        return self._template_entity_cache[key]
 
-        # Take the part before "Laboratory" or first comma
-        parts = re.split(
-            r",|\s+laboratory", author_line, maxsplit=1, flags=re.IGNORECASE
-        )
-        if parts:
-            entity = parts[0].strip()
-            # Normalize: lowercase, keep &, normalize whitespace
-            # Preserve & as it's important for "R&D"
-            entity = re.sub(r"[^\w\s&]", " ", entity)
-            entity = re.sub(r"\s+", " ", entity)
-            entity = entity.lower().strip()
-            return entity if entity else None
+    def _entities_compatible(
+        self, entity1: Optional[str], entity2: Optional[str]
+    ) -> bool:
+        """
+        Check whether two author entities may belong to the same business unit.
 
-        return None
+        :param entity1: First entity identifier (or None if unknown)
+        :param entity2: Second entity identifier (or None if unknown)
+        :return: False only if both entities are known and their tokens overlap
+                 less than ENTITY_MATCH_THRESHOLD
+        """
+        if not entity1 or not entity2:
+            return True
+
+        # Calculate entity similarity using token-based comparison
+        entity_tokens1 = set(entity1.split())
+        entity_tokens2 = set(entity2.split())
+        if not entity_tokens1 or not entity_tokens2:
+            return True
+
+        entity_intersection = entity_tokens1.intersection(entity_tokens2)
+        entity_union = entity_tokens1.union(entity_tokens2)
+        entity_similarity = len(entity_intersection) / len(entity_union)
+
+        if entity_similarity < ENTITY_MATCH_THRESHOLD:
+            logging.debug(
+                f"  Entity mismatch: {entity_similarity:.2f} < {ENTITY_MATCH_THRESHOLD} "
+                f"('{entity1}' vs '{entity2}') - preventing replacement"
+            )
+            return False
+        return True
 
     def _normalize_copyright_text(self, text: str) -> str:
         """
@@ -1225,30 +1662,8 @@ class CopyrightChecker:
         :param text: Copyright text to normalize
         :return: Normalized text for comparison
         """
-        # Remove years (4-digit numbers and year ranges)
-        text = re.sub(r"\b\d{4}(-\d{4})?\b", "", text)
-
-        # Remove common copyright symbols and markers
-        text = re.sub(r"[©Ⓒⓒ(c)(C)]", "", text, flags=re.IGNORECASE)
-
-        # Remove common prefixes/keywords to focus on entity
-        text = re.sub(
-            r"\b(copyright|author|license|spdx-license-identifier)\s*:?\s*",
-            "",
-            text,
-            flags=re.IGNORECASE,
-        )
-
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove special characters except basic punctuation
-        text = re.sub(r"[^\w\s.,&-]", "", text)
-
-        # Convert to lowercase for case-insensitive comparison
-        text = text.lower().strip()
-
-        return text
+        # The template side of each comparison repeats, so results are cached
+        return _normalize_similarity_text(text)
 
     def _calculate_ngram_similarity(self, text1: str, text2: str, n: int = 3) -> float:
         """
@@ -1259,28 +1674,26 @@ class CopyrightChecker:
         :param n: Size of n-grams (default: 3 for trigrams)
         :return: Similarity score between 0.0 and 1.0
         """
+        if text1 == text2:
+            return 1.0
 
-        def get_ngrams(text: str, n: int) -> set:
-            """Extract n-grams from text"""
-            if len(text) < n:
-                return {text}
-            return {text[i : i + n] for i in range(len(text) - n + 1)}
-
-        ngrams1 = get_ngrams(text1, n)
-        ngrams2 = get_ngrams(text2, n)
+        ngrams1 = _char_ngrams(text1, n)
+        ngrams2 = _char_ngrams(text2, n)
 
         if not ngrams1 or not ngrams2:
             return 0.0
 
-        intersection = ngrams1.intersection(ngrams2)
-        union = ngrams1.union(ngrams2)
-
-        return len(intersection) / len(union) if union else 0.0
+        # |A | B| = |A| + |B| - |A & B|, so the union set is never built
+        shared = len(ngrams1 & ngrams2)
+        return shared / (len(ngrams1) + len(ngrams2) - shared)
 
     def _calculate_sequence_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate sequence similarity using longest common subsequence ratio.
 
+        Uses RapidFuzz's C++ LCS when installed and a pure-Python dynamic
+        programming fallback otherwise; both give the same score.
+
         :param text1: First text
         :param text2: Second text
         :return: Similarity score between 0.0 and 1.0
@@ -1306,10 +1719,15 @@ class CopyrightChecker:
 
             return prev[n]
 
-        lcs_len = lcs_length(text1, text2)
-        max_len = max(len(text1), len(text2))
+        if text1 == text2:
+            return 1.0 if text1 else 0.0
+
+        if HAS_RAPIDFUZZ:
+            # Bit-parallel LCS normalized by the longer text, as below
+            return LCSseq.normalized_similarity(text1, text2)
 
-        return lcs_len / max_len if max_len > 0 else 0.0
+        max_len = max(len(text1), len(text2))
+        return lcs_length(text1, text2) / max_len if max_len > 0 else 0.0
 
     def _calculate_token_similarity(self, text1: str, text2: str) -> float:
         """
@@ -1319,18 +1737,42 @@ class CopyrightChecker:
         :param text2: Second text
         :return: Similarity score between 0.0 and 1.0
         """
-        tokens1 = set(text1.split())
-        tokens2 = set(text2.split())
+        tokens1 = _word_tokens(text1)
+        tokens2 = _word_tokens(text2)
 
         if not tokens1 or not tokens2:
             return 0.0
+        if text1 == text2:
+            return 1.0
+
+        # |A | B| = |A| + |B| - |A & B|, so the union set is never built
+        shared = len(tokens1 & tokens2)
+        return shared / (len(tokens1) + len(tokens2) - shared)
+
+    def _calculate_copyright_similarity(
+        self, text1: str, text2: str, threshold: Optional[float] = None
+    ) -> float:
+        """
+        Calculate similarity score between two copyright texts, reusing earlier scores.
 
-        intersection = tokens1.intersection(tokens2)
-        union = tokens1.union(tokens2)
+        Files copied from a common source carry the same notice, so each
+        distinct pair of texts is scored once per checker.
 
-        return len(intersection) / len(union) if union else 0.0
+        :param text1: First copyright text
+        :param text2: Second copyright text
+        :param threshold: Score the caller compares against (default: None, always compute the full score)
+        :return: Similarity score between 0.0 and 1.0
+        """
+        key = (text1, text2, threshold)
+        similarity = self._similarity_cache.get(key)
+        if similarity is None:
+            similarity = self._compute_copyright_similarity(text1, text2, threshold)
+            self._similarity_cache[key] = similarity
+        return similarity
 
-    def _calculate_copyright_similarity(self, text1: str, text2: str) -> float:
+    def _compute_copyright_similarity(
+        self, text1: str, text2: str, threshold: Optional[float] = None
+    ) -> float:
         """
         Calculate similarity score between two copyright texts using multiple methods.
 
@@ -1343,8 +1785,14 @@ class CopyrightChecker:
         - Sequence similarity (LCS ratio): Considers structural similarity
         - Author entity matching: CRITICAL check to prevent cross-unit replacement
 
+        When a threshold is given, the quadratic sequence similarity is skipped
+        if the two linear-time metrics alone already decide whether the score
+        reaches it; the returned score is then the lower bound without the
+        sequence term, which falls on the same side of the threshold.
+
         :param text1: First copyright text
         :param text2: Second copyright text
+        :param threshold: Score the caller compares against (default: None, always compute the full score)
         :return: Similarity score between 0.0 and 1.0
         """
         # CRITICAL: Extract and compare author entities first
@@ -1356,30 +1804,8 @@ class CopyrightChecker:
         logging.debug(f"  Entity2 (template): {entity2}")
 
         # If both have author entities specified, they must match closely
-        if entity1 and entity2:
-            # Calculate entity similarity using token-based comparison
-            entity_tokens1 = set(entity1.split())
-            entity_tokens2 = set(entity2.split())
-
-            if entity_tokens1 and entity_tokens2:
-                entity_intersection = entity_tokens1.intersection(entity_tokens2)
-                entity_union = entity_tokens1.union(entity_tokens2)
-                entity_similarity = (
-                    len(entity_intersection) / len(entity_union)
-                    if entity_union
-                    else 0.0
-                )
-
-                # Require at least 70% entity match to proceed
-                # This prevents replacing "NSCE" with "SCDE" or "Haptic Europe" with "R&D Center"
-                ENTITY_MATCH_THRESHOLD = 0.7
-
-                if entity_similarity < ENTITY_MATCH_THRESHOLD:
-                    logging.debug(
-                        f"  Entity mismatch: {entity_similarity:.2f} < {ENTITY_MATCH_THRESHOLD} "
-                        f"('{entity1}' vs '{entity2}') - preventing replacement"
-                    )
-                    return 0.0  # Return 0 to prevent replacement
+        if not self._entities_compatible(entity1, entity2):
+            return 0.0  # Return 0 to prevent replacement
 
         norm1 = self._normalize_copyright_text(text1)
         norm2 = self._normalize_copyright_text(text2)
@@ -1387,9 +1813,27 @@ class CopyrightChecker:
         if not norm1 or not norm2:
             return 0.0
 
+        # Every metric scores identical texts 1.0, e.g. a notice that only
+        # differs from the template in its years
+        if norm1 == norm2:
+            logging.debug("Copyright similarity: 1.00 (identical normalized text)")
+            return 1.0
+
         # Calculate multiple similarity metrics
         token_sim = self._calculate_token_similarity(norm1, norm2)
         ngram_sim = self._calculate_ngram_similarity(norm1, norm2, n=3)
+
+        # The sequence term adds between 0.0 and 0.2 to this lower bound
+        lower_bound = (0.4 * token_sim) + (0.4 * ngram_sim)
+        if threshold is not None and (
+            lower_bound >= threshold or lower_bound + 0.2 < threshold
+        ):
+            logging.debug(
+                f"Copyright similarity bound: {lower_bound:.2f} (token={token_sim:.2f}, ngram={ngram_sim:.2f}) "
+                f"decides threshold {threshold}"
+            )
+            return lower_bound
+
         sequence_sim = self._calculate_sequence_similarity(norm1, norm2)
 
         # Weighted combination:
@@ -1412,11 +1856,15 @@ class CopyrightChecker:
         """
         Extract existing copyright block from file content.
 
+        Only the first HEADER_SCAN_LINES lines are searched.
+
         :param content: File content
         :param template: Copyright template for the file type
         :return: Tuple of (copyright_text, start_line, end_line) or None if not found
         """
-        content_lines = content.split("\n")
+        # Split off only the header lines; the remainder stays one unsplit string
+        parts = content.split("\n", HEADER_SCAN_LINES)
+        content_lines = parts[:HEADER_SCAN_LINES]
 
         # Get the comment prefix from the template
         if not template.lines:
@@ -1424,7 +1872,7 @@ class CopyrightChecker:
 
         first_template_line = template.lines[0]
         # Extract comment prefix (e.g., "# ", "// ", "-- ")
-        comment_prefix_match = re.match(r"^(\s*[#/\-*]+\s*)", first_template_line)
+        comment_prefix_match = _COMMENT_PREFIX_RE.match(first_template_line)
         if not comment_prefix_match:
             return None
 
@@ -1434,6 +1882,15 @@ class CopyrightChecker:
         # Look for lines that start with the comment prefix and contain copyright-related keywords
         copyright_keywords = ["copyright", "©", "(c)", "author", "license", "spdx"]
 
+        # Files still waiting for a notice usually have no keyword anywhere in
+        # the header; reject them with one search instead of a per-line scan
+        header = content
+        if len(parts) > HEADER_SCAN_LINES:
+            header = content[: len(content) - len(parts[HEADER_SCAN_LINES])]
+        header = header.lower()
+        if not any(keyword in header for keyword in copyright_keywords):
+            return None
+
         start_line = None
         end_line = None
 
@@ -1466,6 +1923,42 @@ class CopyrightChecker:
 
         return None
 
+    def _write_changed_content(
+        self, filepath: str, old_content: str, new_content: str
+    ) -> None:
+        """
+        Write new file content atomically.
+
+        The content goes to a temporary file in the same directory, which then
+        replaces the original in one step, so a hook killed mid-write or a full
+        disk leaves the original file intact. A symlink keeps pointing at the
+        rewritten file and the file keeps its permissions. Identical content
+        is not written at all.
+
+        :param filepath: Path to the file
+        :param old_content: Content currently in the file
+        :param new_content: Content to write
+        """
+        if new_content == old_content:
+            logging.debug(f"Content unchanged, not rewriting {filepath}")
+            return
+
+        target = os.path.realpath(filepath)
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target), prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(new_content.encode("utf-8"))
+            shutil.copymode(target, temp_path)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
     def _merge_year_ranges(
         self, existing_years: Tuple[int, Optional[int]], new_start: int, new_end: int
     ) -> str:
@@ -1496,17 +1989,14 @@ class CopyrightChecker:
         :param text: Text to extract years from
         :return: Tuple of (start_year, end_year) or None
         """
-        # Look for year patterns: YYYY or YYYY-YYYY
+        # Look for year patterns: YYYY or YYYY-YYYY (hyphen or en dash)
         # Also handle (c), ©, and other copyright markers before the year
-        year_pattern = r"\b(\d{4})(?:\s*-\s*(\d{4}))?\b"
+        # Only the first match is used (usually the copyright year)
+        first_match = _GENERAL_YEAR_RE.search(text)
 
-        matches = re.findall(year_pattern, text)
-
-        if matches:
-            # Take the first match (usually the copyright year)
-            first_match = matches[0]
-            start_year = int(first_match[0])
-            end_year = int(first_match[1]) if first_match[1] else None
+        if first_match:
+            start_year = int(first_match.group(1))
+            end_year = int(first_match.group(2)) if first_match.group(2) else None
 
             logging.debug(
                 f"General year extraction found: {start_year}-{end_year if end_year else start_year}"
@@ -1521,6 +2011,7 @@ class CopyrightChecker:
         template: CopyrightTemplate,
         content: str,
         line_ending: str = "\n",
+        copyright_info: Optional[Tuple[str, int, int]] = None,
     ) -> bool:
         """
         Replace an existing similar copyright notice with the template notice.
@@ -1529,10 +2020,13 @@ class CopyrightChecker:
         :param template: Copyright template to use
         :param content: Current file content
         :param line_ending: Line ending style to use
+        :param copyright_info: Block already returned by _extract_copyright_block
+            for this content; extracted here when not given
         :return: True if replacement was made, False otherwise
         """
-        # Extract existing copyright block
-        copyright_info = self._extract_copyright_block(content, template)
+        # Extract existing copyright block unless the caller already did
+        if copyright_info is None:
+            copyright_info = self._extract_copyright_block(content, template)
 
         if not copyright_info:
             logging.debug(f"No existing copyright block found in {filepath}")
@@ -1543,15 +2037,15 @@ class CopyrightChecker:
         # Generate template copyright text for comparison (without year)
         template_text = template.get_notice_with_year("YEAR")
 
-        # Calculate similarity
-        similarity = self._calculate_copyright_similarity(
-            existing_copyright, template_text
-        )
-
         # Use a threshold of 0.4 (40% similarity) to determine if copyrights are related
         # This allows for variations in author, license details, etc.
         SIMILARITY_THRESHOLD = 0.4
 
+        # Calculate similarity
+        similarity = self._calculate_copyright_similarity(
+            existing_copyright, template_text, threshold=SIMILARITY_THRESHOLD
+        )
+
         if similarity < SIMILARITY_THRESHOLD:
             logging.debug(
                 f"Copyright similarity {similarity:.2f} below threshold {SIMILARITY_THRESHOLD}, "
@@ -1621,8 +2115,16 @@ class CopyrightChecker:
         # Generate new copyright notice with merged years
         new_copyright = template.get_notice_with_year(year_str)
 
-        # Replace the copyright block in content
-        content_lines = content.replace("\r\n", "\n").split("\n")
+        # Only the lines up to the one after the block are rebuilt; the rest
+        # of the file is carried over as a single string
+        head_parts = content.split("\n", end_line + 2)
+        tail = head_parts.pop() if len(head_parts) > end_line + 2 else None
+        head = "\n".join(head_parts)
+        if tail is not None:
+            head += "\n"
+        content_lines = head.replace("\r\n", "\n").split("\n")
+        if tail is not None:
+            content_lines.pop()
 
         # Remove old copyright lines
         new_lines = content_lines[:start_line] + content_lines[end_line + 1 :]
@@ -1632,36 +2134,107 @@ class CopyrightChecker:
         if new_lines and new_lines[0].startswith("#!"):
             insert_position = 1
 
-        # Insert new copyright
-        if insert_position == 0:
-            new_content = new_copyright + "\n\n" + "\n".join(new_lines)
-        else:
-            # After shebang
-            if insert_position < len(new_lines) and new_lines[insert_position].strip():
-                # Add spacing after shebang if needed
-                new_content = (
-                    new_lines[0]
-                    + "\n"
-                    + new_copyright
-                    + "\n\n"
-                    + "\n".join(new_lines[insert_position:])
-                )
-            else:
-                new_content = (
-                    new_lines[0]
-                    + "\n"
-                    + new_copyright
-                    + "\n\n"
-                    + "\n".join(new_lines[insert_position:])
-                )
+        # The notice goes back where it was: reuse its blank separator line
+        # instead of adding a second one below the new notice
+        if (
+            start_line == insert_position
+            and insert_position < len(new_lines)
+            and not new_lines[insert_position].strip()
+        ):
+            del new_lines[insert_position]
+
+        # Insert new copyright (after the shebang, if any), followed by a
+        # blank line
+        notice_lines = [new_copyright, ""]
+        if tail is None and insert_position == len(new_lines):
+            # Nothing follows the notice: still end it with a blank line
+            notice_lines.append("")
+        new_lines[insert_position:insert_position] = notice_lines
+        new_content = "\n".join(new_lines)
 
         # Convert to the original line ending style
         if line_ending == "\r\n":
             new_content = new_content.replace("\n", "\r\n")
 
-        # Write back to file
-        with open(filepath, "wb") as f:
-            f.write(new_content.encode("utf-8"))
+        if tail is not None:
+            # The tail gets the same line endings as the rebuilt head; it is
+            # only copied when it mixes styles
+            if line_ending == "\r\n":
+                if tail.count("\n") != tail.count("\r\n"):
+                    tail = tail.replace("\r\n", "\n").replace("\n", "\r\n")
+            else:
+                tail = tail.replace("\r\n", "\n")
+            new_content = new_content + line_ending + tail
+
+        self._write_changed_content(filepath, content, new_content)
 
         logging.info(f"Successfully replaced copyright notice in {filepath}")
         return True
+
+
+# Checker copy owned by each check_files worker process
+_process_checker: Optional[CopyrightChecker] = None
+
+
+def _root_logging_config() -> Tuple[int, Optional[str], str, Optional[str]]:
+    """
+    Describe the root logger's configuration for _init_process_worker.
+
+    Formatter has no public accessor for its format string, so it is taken
+    from the formatter's style object, which also tells which of the "%",
+    "{" and "$" styles the format uses.
+
+    :return: Level, format (None if no handler has a formatter), style and
+        date format
+    """
+    root = logging.getLogger()
+    for handler in root.handlers:
+        formatter = handler.formatter
+        if formatter is None:
+            continue
+        if isinstance(formatter._style, logging.StringTemplateStyle):
+            style = "$"
+        elif isinstance(formatter._style, logging.StrFormatStyle):
+            style = "{"
+        else:
+            style = "%"
+        return root.level, formatter._style._fmt, style, formatter.datefmt
+    return root.level, None, "%", None
+
+
+def _init_process_worker(
+    checker: CopyrightChecker,
+    log_config: Tuple[int, Optional[str], str, Optional[str]],
+) -> None:
+    """
+    Set up a newly started worker process.
+
+    Stores the checker shipped to the worker and configures logging like the
+    parent process. A forked worker already has the parent's handlers, in
+    which case basicConfig leaves them alone.
+
+    :param checker: Checker to use for every file this worker handles
+    :param log_config: Parent's root logger configuration from _root_logging_config
+    """
+    global _process_checker
+    _process_checker = checker
+    log_level, log_format, log_style, log_datefmt = log_config
+    if log_format is not None:
+        logging.basicConfig(format=log_format, style=log_style, datefmt=log_datefmt)
+    logging.getLogger().setLevel(log_level)
+
+
+def _check_in_process(filepath: str, auto_fix: bool) -> Tuple[str, Optional[list]]:
+    """
+    Check one file inside a worker process.
+
+    :param filepath: Path to the file to check
+    :param auto_fix: If True, automatically add missing copyright notices
+    :return: "passed", "modified" or "failed", and the file's valid-notice
+        cache entry (None if there is none or no cache is configured)
+    """
+    outcome = _process_checker._check_one(filepath, auto_fix)
+    valid_files = _process_checker._valid_files
+    if valid_files is None:
+        return outcome, None
+    return outcome, valid_files.get(os.path.abspath(filepath))
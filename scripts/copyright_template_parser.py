@@ -7,18 +7,277 @@
 
 """Parser for multi-format copyright template file with regex support"""
 
+import functools
+import io
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Pattern, Tuple
+from dataclasses import dataclass, field, fields
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+
+# Section header [.ext] or [.ext1, .ext2, .ext3]
+_SECTION_HEADER_RE = re.compile(r"^\[((?:\.\w+)(?:\s*,\s*\.\w+)*)\]$")
+
+_PLACEHOLDER_START = "{regex:"
+
+# Braces, for finding the end of a placeholder whose regex has its own
+_BRACE_RE = re.compile(r"[{}]")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(pattern_src: str, flags: int = 0) -> Pattern[str]:
+    """
+    Compile a template-derived pattern, reusing earlier compilations.
+
+    :param pattern_src: Regex source taken from or built from a template line
+    :param flags: re module flags
+    :return: Compiled pattern
+    """
+    return re.compile(pattern_src, flags)
+
+
+def _placeholder_span(template_line: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the first {regex:...} placeholder of a template line.
+
+    The placeholder ends at the brace closing its opening one, so regexes
+    with braces of their own, e.g. {regex:\\d{4}(-\\d{4})?}, stay whole.
+
+    :param template_line: Template line
+    :return: (start, end) offsets of the placeholder, end exclusive, or None
+             if the line has no placeholder or its braces are unmatched
+    """
+    start = template_line.find(_PLACEHOLDER_START)
+    if start == -1:
+        return None
+    depth = 0
+    for brace in _BRACE_RE.finditer(template_line, start):
+        depth += 1 if brace.group() == "{" else -1
+        if depth == 0:
+            return start, brace.end()
+    return None
+
+
+def _build_line_pattern(template_line: str) -> Optional[Pattern[str]]:
+    """
+    Build the pattern matching a content line against a {regex:...} template line.
+
+    The text around the placeholder is escaped and the placeholder's regex is
+    captured as group 1.
+
+    :param template_line: Template line containing a {regex:...} placeholder
+    :return: Compiled pattern, or None if the line has no complete placeholder
+    """
+    span = _placeholder_span(template_line)
+    if span is None:
+        return None
+    start, end = span
+
+    # Build the pattern: escape the parts before and after, insert regex in between
+    before = re.escape(template_line[:start])
+    after = re.escape(template_line[end:])
+    regex_str = template_line[start + len(_PLACEHOLDER_START) : end - 1]
+    return _compile_regex(f"{before}({regex_str}){after}")
+
+
+def _lines_from(content: str, offset: int, count: int) -> List[str]:
+    """
+    Split up to count lines out of content, starting at a line start.
+
+    This gives the same lines as content.split("\\n") would from that point
+    without splitting the rest of the content.
+
+    :param content: Content to take the lines from
+    :param offset: Character offset of the first line
+    :param count: Maximum number of lines to return
+    :return: Lines without their newline characters
+    """
+    lines = []
+    while len(lines) < count and offset <= len(content):
+        end = content.find("\n", offset)
+        if end == -1:
+            end = len(content)
+        lines.append(content[offset:end])
+        offset = end + 1
+    return lines
+
+
+def _line_starts(
+    content: str, prefix: Optional[Pattern[str]]
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yield the number and offset of each line starting with a literal prefix.
+
+    :param content: Content to scan
+    :param prefix: ^-anchored MULTILINE pattern, or None for every line
+    :return: (line number, character offset) pairs, in increasing order
+    """
+    if prefix is None:
+        line_idx = 0
+        offset = 0
+        while True:
+            yield line_idx, offset
+            offset = content.find("\n", offset) + 1
+            if not offset:
+                return
+            line_idx += 1
+
+    line_idx = 0
+    last_pos = 0
+    for match in prefix.finditer(content):
+        line_idx += content.count("\n", last_pos, match.start())
+        last_pos = match.start()
+        yield line_idx, match.start()
+
+
+def _parse_years(year_str: str) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    Parse the text captured by a {regex:...} placeholder as a year or range.
+
+    :param year_str: Captured text, e.g. "2024" or "2020-2024"
+    :return: Tuple of (start_year, end_year) or None if it is not numeric
+    """
+    if "-" in year_str:
+        parts = year_str.split("-")
+        try:
+            return (int(parts[0]), int(parts[1]))
+        except (ValueError, IndexError):
+            return None
+    try:
+        return (int(year_str), None)
+    except ValueError:
+        return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CopyrightTemplate:
-    """Represents a copyright notice template for a specific file extension"""
+    """Represents a copyright notice template for a specific file extension
+
+    Templates are frozen because parsed templates are cached and shared
+    between checkers. Lists given for lines and regex_patterns are stored as
+    tuples, so templates are hashable.
+    """
 
     extension: str
-    lines: List[str]
-    regex_patterns: List[Optional[Pattern[str]]]
+    lines: Tuple[str, ...]
+    regex_patterns: Tuple[Optional[Pattern[str]], ...]
+    # Derived in __post_init__
+    _notice_parts: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _line_patterns: Tuple[Optional[Pattern[str]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _line_prefixes: Tuple[Optional[Pattern[str]], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _stripped_lines: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _block_start: Optional[Pattern[str]] = field(init=False, repr=False, compare=False)
+    _required_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "lines", tuple(self.lines))
+        object.__setattr__(self, "regex_patterns", tuple(self.regex_patterns))
+        # The notice text around the year placeholders never changes, so it is
+        # split once here and every rendering is a single join
+        object.__setattr__(self, "_notice_parts", self._split_notice())
+        # Full-line patterns for the lines with a {regex:...} placeholder,
+        # compiled once instead of rebuilt for every line of every file
+        object.__setattr__(
+            self,
+            "_line_patterns",
+            tuple(
+                _build_line_pattern(line) if regex_pattern else None
+                for line, regex_pattern in zip(self.lines, self.regex_patterns)
+            ),
+        )
+        # Lines without a placeholder must equal the content line exactly,
+        # up to trailing whitespace
+        object.__setattr__(
+            self, "_stripped_lines", tuple(line.rstrip() for line in self.lines)
+        )
+        # Literal text each matching content line starts with: the text up to
+        # the {regex:...} placeholder, or the whole line without one
+        line_prefixes = []
+        for line, stripped, line_pattern in zip(
+            self.lines, self._stripped_lines, self._line_patterns
+        ):
+            if line_pattern is not None:
+                literal = line[: line.find(_PLACEHOLDER_START)]
+            else:
+                literal = stripped
+            line_prefixes.append(
+                _compile_regex("^" + re.escape(literal), re.MULTILINE)
+                if literal
+                else None
+            )
+        object.__setattr__(self, "_line_prefixes", tuple(line_prefixes))
+        # The literal skeleton of the whole notice as one lookahead, so a
+        # single scan finds the lines where every template line lines up.
+        # Lines with a placeholder only need the literal text around it here;
+        # _matches_at_position still checks the placeholder itself.
+        skeleton = []
+        for line, stripped, line_pattern in zip(
+            self.lines, self._stripped_lines, self._line_patterns
+        ):
+            if line_pattern is not None:
+                start, end = _placeholder_span(line)
+                suffix = line[end:].rstrip()
+                skeleton.append(
+                    re.escape(line[:start])
+                    + "[^\n]*"
+                    + (re.escape(suffix) + "[^\n]*" if suffix else "")
+                )
+            else:
+                skeleton.append(re.escape(stripped) + r"[^\S\n]*$")
+        # Longest literal text every notice contains: a plain substring test
+        # for it rejects content without a notice much faster than the scan.
+        # The text on either side of a placeholder counts as well.
+        literals = []
+        for line, stripped, line_pattern in zip(
+            self.lines, self._stripped_lines, self._line_patterns
+        ):
+            if line_pattern is not None:
+                start, end = _placeholder_span(line)
+                literals.append(line[:start])
+                literals.append(line[end:].rstrip())
+            else:
+                literals.append(stripped)
+        object.__setattr__(self, "_required_text", max(literals, key=len, default=""))
+        object.__setattr__(
+            self,
+            "_block_start",
+            _compile_regex("^(?=" + "\n".join(skeleton) + ")", re.MULTILINE)
+            if skeleton
+            else None,
+        )
+
+    def _split_notice(self) -> Tuple[str, ...]:
+        """
+        Split the notice text at the first {regex:...} placeholder of each line.
+
+        :return: Text segments to be joined with the year
+        """
+        parts = []
+        current = []
+        for line in self.lines:
+            # The year goes where the {regex:...} placeholder is
+            span = _placeholder_span(line)
+            if span is not None:
+                current.append(line[: span[0]])
+                parts.append("\n".join(current))
+                current = [line[span[1] :]]
+            else:
+                current.append(line)
+        parts.append("\n".join(current))
+        return tuple(parts)
 
     def get_notice_with_year(self, year) -> str:
         """
@@ -28,33 +287,32 @@ class CopyrightTemplate:
                      Can be an int (e.g., 2024) or str (e.g., "2024" or "2020-2024")
         :return: Complete copyright notice as string
         """
-        # Convert year to string if it's an int
-        year_str = str(year)
+        return str(year).join(self._notice_parts)
 
-        result_lines = []
-        for line in self.lines:
-            # Replace {regex:...} with the actual year
-            # Handle nested braces properly
-            result_line = line
-            start = result_line.find("{regex:")
-            if start != -1:
-                # Find the matching closing brace
-                depth = 0
-                end = -1
-                for i in range(start, len(result_line)):
-                    if result_line[i] == "{":
-                        depth += 1
-                    elif result_line[i] == "}":
-                        depth -= 1
-                        if depth == 0:
-                            end = i
-                            break
-                if end != -1:
-                    result_line = (
-                        result_line[:start] + year_str + result_line[end + 1 :]
-                    )
-            result_lines.append(result_line)
-        return "\n".join(result_lines)
+    def _match_starts(self, content: str) -> Iterator[int]:
+        """
+        Yield the line numbers where the notice starts in content.
+
+        A notice can only start where the following lines carry the literal
+        text of every template line (up to its {regex:...} placeholder), so
+        one regex scan over the whole content finds the few positions worth
+        checking, and only the lines after each of them are split out.
+
+        :param content: Content to check
+        :return: Line numbers (0-indexed), in increasing order
+        """
+        if self._block_start is None:
+            # A template without lines matches at every line of the content
+            yield from range(content.count("\n") + 1)
+            return
+
+        if self._required_text not in content:
+            return
+        for line_idx, offset in _line_starts(content, self._block_start):
+            if self._matches_at_position(
+                _lines_from(content, offset, len(self.lines)), 0
+            ):
+                yield line_idx
 
     def matches(self, content: str) -> bool:
         """
@@ -63,13 +321,7 @@ class CopyrightTemplate:
         :param content: Content to check
         :return: True if content matches the template (with regex patterns)
         """
-        content_lines = content.split("\n")
-
-        # Try to find the template starting at different positions
-        for start_idx in range(len(content_lines)):
-            if self._matches_at_position(content_lines, start_idx):
-                return True
-        return False
+        return next(self._match_starts(content), None) is not None
 
     def find_all_matches(self, content: str) -> List[int]:
         """
@@ -78,18 +330,24 @@ class CopyrightTemplate:
         :param content: Content to check
         :return: List of line numbers (0-indexed) where copyright notices start
         """
-        content_lines = content.split("\n")
-        matches = []
+        return list(self._match_starts(content))
 
-        # Try to find the template starting at different positions
-        for start_idx in range(len(content_lines)):
-            if self._matches_at_position(content_lines, start_idx):
-                matches.append(start_idx)
-                # Skip lines that are part of this match to avoid overlapping detections
-                # Jump to the end of this match
-                start_idx += len(self.lines) - 1
+    def __getstate__(self) -> dict:
+        """
+        Pickle the template's fields, including the derived ones.
 
-        return matches
+        :return: Instance state to pickle
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore a pickled template.
+
+        :param state: Instance state from __getstate__
+        """
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def has_duplicates(self, content: str) -> bool:
         """
@@ -105,78 +363,38 @@ class CopyrightTemplate:
         """
         Extract the year or year range from the copyright notice in content.
 
+        The years come from the earliest template position at which any
+        {regex:...} line matches. Each such line is looked for with one scan
+        for its literal prefix rather than by trying every position in turn.
+
         :param content: Content to search for copyright year
         :return: Tuple of (start_year, end_year) or None if not found.
                  end_year is None for single year notices (e.g., "2024")
                  end_year is set for year ranges (e.g., "2020-2024")
         """
-        content_lines = content.split("\n")
-
-        # Try to find the template starting at different positions
-        for start_idx in range(len(content_lines)):
-            years = self._extract_years_at_position(content_lines, start_idx)
-            if years:
-                return years
-        return None
-
-    def _extract_years_at_position(
-        self, content_lines: List[str], start_idx: int
-    ) -> Optional[Tuple[int, Optional[int]]]:
-        """
-        Extract years from copyright notice at a specific position.
-
-        :param content_lines: Lines of content
-        :param start_idx: Starting line index
-        :return: Tuple of (start_year, end_year) or None
-        """
-        if start_idx + len(self.lines) > len(content_lines):
-            return None
+        last_start = content.count("\n") + 1 - len(self.lines)
+        best: Optional[Tuple[int, Tuple[int, Optional[int]]]] = None
 
-        for i, (template_line, regex_pattern) in enumerate(
-            zip(self.lines, self.regex_patterns)
+        for i, (line_pattern, prefix) in enumerate(
+            zip(self._line_patterns, self._line_prefixes)
         ):
-            content_line = content_lines[start_idx + i].rstrip()
-
-            if regex_pattern:
-                # Build pattern from template line
-                start_marker = "{regex:"
-                start_idx_marker = template_line.find(start_marker)
-
-                if start_idx_marker != -1:
-                    start_pos = start_idx_marker + len(start_marker)
-                    depth = 1
-                    current_pos = start_pos
-
-                    while current_pos < len(template_line) and depth > 0:
-                        if template_line[current_pos] == "{":
-                            depth += 1
-                        elif template_line[current_pos] == "}":
-                            depth -= 1
-                        current_pos += 1
-
-                    # Build the pattern
-                    before = re.escape(template_line[:start_idx_marker])
-                    after = re.escape(template_line[current_pos:])
-                    regex_str = template_line[start_pos : current_pos - 1]
-                    pattern_str = f"{before}({regex_str}){after}"
-
-                    match = re.match(pattern_str, content_line)
-                    if match:
-                        year_str = match.group(1)
-                        # Parse year or year range
-                        if "-" in year_str:
-                            parts = year_str.split("-")
-                            try:
-                                return (int(parts[0]), int(parts[1]))
-                            except (ValueError, IndexError):
-                                continue
-                        else:
-                            try:
-                                return (int(year_str), None)
-                            except ValueError:
-                                continue
-
-        return None
+            if line_pattern is None:
+                continue
+            for line_idx, offset in _line_starts(content, prefix):
+                start_idx = line_idx - i
+                if start_idx < 0:
+                    continue
+                # Positions only grow; an earlier line already won ties
+                if start_idx > last_start or (best and start_idx >= best[0]):
+                    break
+                line = _lines_from(content, offset, 1)[0]
+                match = line_pattern.match(line.rstrip())
+                years = _parse_years(match.group(1)) if match else None
+                if years:
+                    best = (start_idx, years)
+                    break
+
+        return best[1] if best else None
 
     def _matches_at_position(self, content_lines: List[str], start_idx: int) -> bool:
         """
@@ -189,45 +407,17 @@ class CopyrightTemplate:
         if start_idx + len(self.lines) > len(content_lines):
             return False
 
-        for i, (template_line, regex_pattern) in enumerate(
-            zip(self.lines, self.regex_patterns)
+        for i, (stripped, line_pattern) in enumerate(
+            zip(self._stripped_lines, self._line_patterns)
         ):
             content_line = content_lines[start_idx + i].rstrip()
 
-            if regex_pattern:
-                # Build pattern from template line by replacing {regex:...} with the regex
-                # Find the {regex:...} part and replace it
-                start_marker = "{regex:"
-                start_idx_marker = template_line.find(start_marker)
-
-                if start_idx_marker != -1:
-                    # Find the matching closing brace
-                    start_pos = start_idx_marker + len(start_marker)
-                    depth = 1
-                    end_idx_marker = start_pos
-
-                    while end_idx_marker < len(template_line) and depth > 0:
-                        if template_line[end_idx_marker] == "{":
-                            depth += 1
-                        elif template_line[end_idx_marker] == "}":
-                            depth -= 1
-                        end_idx_marker += 1
-
-                    # Build the pattern: escape the parts before and after, insert regex in between
-                    before = re.escape(template_line[:start_idx_marker])
-                    after = re.escape(template_line[end_idx_marker:])
-                    regex_str = template_line[start_pos : end_idx_marker - 1]
-                    pattern_str = f"{before}({regex_str}){after}"
-
-                    if not re.match(pattern_str, content_line):
-                        return False
-                else:
-                    # No {regex:} found but regex_pattern is set - shouldn't happen
-                    if content_line != template_line.rstrip():
-                        return False
+            if line_pattern is not None:
+                if not line_pattern.match(content_line):
+                    return False
             else:
                 # Exact match required
-                if content_line != template_line.rstrip():
+                if content_line != stripped:
                     return False
 
         return True
@@ -237,9 +427,9 @@ class CopyrightTemplateParser:
     """Parser for copyright template files with multiple sections"""
 
     @staticmethod
-    def parse(template_path: str) -> Dict[str, CopyrightTemplate]:
+    def parse(template_path: Union[str, IO[str]]) -> Dict[str, CopyrightTemplate]:
         """
-        Parse a copyright template file.
+        Parse a copyright template file or an open text stream.
 
         The template file should have sections like:
 
@@ -256,11 +446,50 @@ class CopyrightTemplateParser:
         -- Copyright {regex:\\d{4}(-\\d{4})?} {COMPANY}
         -- Author: ...
 
-        :param template_path: Path to the template file
+        :param template_path: Path to the template file, or a text stream
+            such as io.StringIO, which is read but not closed
         :return: Dictionary mapping file extensions to CopyrightTemplate objects
         :raises FileNotFoundError: If template file doesn't exist
         :raises ValueError: If template file format is invalid
         """
+        if hasattr(template_path, "read"):
+            source = getattr(template_path, "name", "<stream>")
+            return CopyrightTemplateParser._parse_lines(template_path, str(source))
+        with open(template_path, "r", encoding="utf-8") as f:
+            return CopyrightTemplateParser._parse_lines(f, template_path)
+
+    @staticmethod
+    def parse_string(
+        template_text: str, source: str = "<string>"
+    ) -> Dict[str, CopyrightTemplate]:
+        """
+        Parse copyright template text that is already in memory.
+
+        Accepts the same format as :meth:`parse`. Lines are split like a file
+        read in text mode (at \\n, \\r\\n and \\r only), so the same text
+        gives the same templates either way.
+
+        :param template_text: Template content
+        :param source: Name used for the template in error messages
+        :return: Dictionary mapping file extensions to CopyrightTemplate objects
+        :raises ValueError: If template format is invalid
+        """
+        return CopyrightTemplateParser._parse_lines(
+            io.StringIO(template_text, newline=None), source
+        )
+
+    @staticmethod
+    def _parse_lines(
+        lines: Iterable[str], template_path: str
+    ) -> Dict[str, CopyrightTemplate]:
+        """
+        Parse template lines into templates keyed by extension.
+
+        :param lines: Template lines, with or without trailing newlines
+        :param template_path: Template name used in error messages
+        :return: Dictionary mapping file extensions to CopyrightTemplate objects
+        :raises ValueError: If template format is invalid
+        """
         templates = {}
         variables = {}
         current_extension = None
@@ -268,89 +497,84 @@ class CopyrightTemplateParser:
         in_variables_section = False
         variables_section_processed = False  # Track if we've seen [VARIABLES] already
 
-        with open(template_path, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.rstrip("\n")
-
-                # Skip empty lines when not inside a section
-                if (
-                    not line.strip()
-                    and current_extension is None
-                    and not in_variables_section
-                ):
+        for line_num, line in enumerate(lines, 1):
+            line = line.rstrip("\n")
+            stripped = line.strip()
+
+            # Skip empty lines when not inside a section
+            if not stripped and current_extension is None and not in_variables_section:
+                continue
+
+            # Check for [VARIABLES] section - only process the first one
+            if stripped == "[VARIABLES]":
+                if not variables_section_processed:
+                    in_variables_section = True
+                    variables_section_processed = True
+                continue
+
+            # Parse variable definitions
+            if in_variables_section:
+                # Check if we hit a new section header
+                if stripped.startswith("[") and stripped.endswith("]"):
+                    in_variables_section = False
+                    # Continue to process this line as a section header below
+                elif "=" in line:
+                    # Parse variable: VAR_NAME = value
+                    key, value = line.split("=", 1)
+                    variables[key.strip()] = value.strip()
                     continue
-
-                # Check for [VARIABLES] section - only process the first one
-                if line.strip() == "[VARIABLES]":
-                    if not variables_section_processed:
-                        in_variables_section = True
-                        variables_section_processed = True
+                elif not stripped:
+                    # Empty line in variables section
                     continue
 
-                # Parse variable definitions
-                if in_variables_section:
-                    # Check if we hit a new section header
-                    if line.strip().startswith("[") and line.strip().endswith("]"):
-                        in_variables_section = False
-                        # Continue to process this line as a section header below
-                    elif "=" in line:
-                        # Parse variable: VAR_NAME = value
-                        key, value = line.split("=", 1)
-                        variables[key.strip()] = value.strip()
-                        continue
-                    elif not line.strip():
-                        # Empty line in variables section
-                        continue
-
-                # Check for section header [.ext] or [.ext1, .ext2, .ext3]
-                section_match = re.match(
-                    r"^\[((?:\.\w+)(?:\s*,\s*\.\w+)*)\]$", line.strip()
-                )
-                if section_match:
-                    # Exit variables section if we were in it
-                    in_variables_section = False
-
-                    # Save previous section if exists
-                    if current_extension is not None:
-                        # Remove trailing empty lines
-                        while current_lines and not current_lines[-1]:
-                            current_lines.pop()
+            # Check for section header [.ext] or [.ext1, .ext2, .ext3]; body
+            # lines rarely start with "[", so most skip the regex entirely
+            section_match = stripped.startswith("[") and _SECTION_HEADER_RE.match(
+                stripped
+            )
+            if section_match:
+                # Exit variables section if we were in it
+                in_variables_section = False
+
+                # Save previous section if exists
+                if current_extension is not None:
+                    # Remove trailing empty lines
+                    while current_lines and not current_lines[-1]:
+                        current_lines.pop()
+
+                    # Substitute variables in current_lines before creating template
+                    substituted_lines = CopyrightTemplateParser._substitute_variables(
+                        current_lines, variables
+                    )
 
-                        # Substitute variables in current_lines before creating template
-                        substituted_lines = (
-                            CopyrightTemplateParser._substitute_variables(
-                                current_lines, variables
-                            )
+                    # Handle both single extension and list of extensions
+                    if isinstance(current_extension, list):
+                        template = CopyrightTemplateParser._create_template(
+                            current_extension[0], substituted_lines
                         )
-
-                        # Handle both single extension and list of extensions
-                        if isinstance(current_extension, list):
-                            template = CopyrightTemplateParser._create_template(
-                                current_extension[0], substituted_lines
-                            )
-                            # Map all extensions to the same template
-                            for ext in current_extension:
-                                templates[ext] = template
-                        else:
-                            templates[current_extension] = (
-                                CopyrightTemplateParser._create_template(
-                                    current_extension, substituted_lines
-                                )
+                        # Map all extensions to the same template
+                        for ext in current_extension:
+                            templates[ext] = template
+                    else:
+                        templates[current_extension] = (
+                            CopyrightTemplateParser._create_template(
+                                current_extension, substituted_lines
                             )
+                        )
 
-                    # Parse extensions (can be comma-separated)
-                    extensions_str = section_match.group(1)
-                    extensions = [ext.strip() for ext in extensions_str.split(",")]
+                # Parse extensions (can be comma-separated)
+                extensions_str = section_match.group(1)
+                extensions = [ext.strip() for ext in extensions_str.split(",")]
 
-                    # Start new section with first extension as the key
-                    current_extension = (
-                        extensions[0] if len(extensions) == 1 else extensions
-                    )
-                    current_lines = []
-                elif current_extension is not None:
-                    # Add line to current section (including empty lines within section)
-                    if line or current_lines:  # Start collecting after first non-empty
-                        current_lines.append(line)
+                # Start new section with first extension as the key
+                current_extension = (
+                    extensions[0] if len(extensions) == 1 else extensions
+                )
+                current_lines = []
+            elif current_extension is not None:
+                # Add line to current section (including empty lines within section)
+                if line or current_lines:  # Start collecting after first non-empty
+                    current_lines.append(line)
 
         # Save last section
         if current_extension is not None:
@@ -397,12 +621,29 @@ class CopyrightTemplateParser:
         if not variables:
             return lines
 
+        placeholders = {"{" + name + "}": value for name, value in variables.items()}
+        placeholder_re = None
+        if not any("{" in name or "}" in name for name in variables):
+            placeholder_re = _compile_regex("|".join(map(re.escape, placeholders)))
+
         substituted_lines = []
         for line in lines:
+            if "{" not in line:
+                substituted_lines.append(line)
+                continue
+            # Replace every placeholder in one pass. A placeholder left over
+            # afterwards was formed by a substituted value, which only the
+            # in-order replacement below expands, so redo the line that way.
+            if placeholder_re is not None:
+                substituted_line = placeholder_re.sub(
+                    lambda m: placeholders[m.group()], line
+                )
+                if not placeholder_re.search(substituted_line):
+                    substituted_lines.append(substituted_line)
+                    continue
             substituted_line = line
             # Find all {VARIABLE_NAME} patterns (but not {regex:...})
-            for var_name, var_value in variables.items():
-                placeholder = "{" + var_name + "}"
+            for placeholder, var_value in placeholders.items():
                 substituted_line = substituted_line.replace(placeholder, var_value)
             substituted_lines.append(substituted_line)
 
@@ -421,35 +662,21 @@ class CopyrightTemplateParser:
 
         for line in lines:
             # Extract regex patterns from {regex:...}
-            # Handle nested braces by finding the matching closing brace
-            start_marker = "{regex:"
-            start_idx = line.find(start_marker)
-
-            if start_idx != -1:
-                # Find the matching closing brace
-                start_pos = start_idx + len(start_marker)
-                depth = 1
-                end_idx = start_pos
-
-                while end_idx < len(line) and depth > 0:
-                    if line[end_idx] == "{":
-                        depth += 1
-                    elif line[end_idx] == "}":
-                        depth -= 1
-                    end_idx += 1
-
-                if depth == 0:
-                    regex_str = line[start_pos : end_idx - 1]
-                    try:
-                        pattern = re.compile(regex_str)
-                        regex_patterns.append(pattern)
-                    except re.error as e:
-                        raise ValueError(f"Invalid regex pattern '{regex_str}': {e}")
-                else:
-                    raise ValueError(f"Unmatched braces in template line: {line}")
+            span = _placeholder_span(line)
+            if span is not None:
+                regex_str = line[span[0] + len(_PLACEHOLDER_START) : span[1] - 1]
+                try:
+                    pattern = _compile_regex(regex_str)
+                    regex_patterns.append(pattern)
+                except re.error as e:
+                    raise ValueError(f"Invalid regex pattern '{regex_str}': {e}")
+            elif _PLACEHOLDER_START in line:
+                raise ValueError(f"Unmatched braces in template line: {line}")
             else:
                 regex_patterns.append(None)
 
         return CopyrightTemplate(
-            extension=extension, lines=lines, regex_patterns=regex_patterns
+            extension=extension,
+            lines=tuple(lines),
+            regex_patterns=tuple(regex_patterns),
         )
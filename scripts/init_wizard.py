@@ -11,6 +11,10 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import yaml
 
+# Use the libyaml bindings when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 # Pre-built copyright templates for common scenarios
 COPYRIGHT_TEMPLATES = {
@@ -305,16 +309,17 @@ def generate_copyright_template(
 
 
 def create_or_update_precommit_config(
-    copyright_file: str, extensions: List[str]
+    copyright_file: str, extensions: List[str], cwd: Optional[Path] = None
 ) -> bool:
     """
     Create or update .pre-commit-config.yaml with sny-copyright-checker configuration.
 
     :param copyright_file: Path to the copyright template file
     :param extensions: List of file extensions to check
+    :param cwd: Directory containing the config file (default: current directory)
     :return: True if successful, False otherwise
     """
-    config_path = Path(".pre-commit-config.yaml")
+    config_path = Path(cwd or Path.cwd()) / ".pre-commit-config.yaml"
 
     # Build file pattern regex from extensions
     if extensions:
@@ -345,7 +350,7 @@ def create_or_update_precommit_config(
             # Load existing config
             with open(config_path, "r", encoding="utf-8") as f:
                 try:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=_YAML_LOADER) or {}
                 except yaml.YAMLError:
                     config = {}
 
@@ -369,7 +374,13 @@ def create_or_update_precommit_config(
 
             # Write back
             with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=_YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
             return True
         else:
@@ -377,7 +388,13 @@ def create_or_update_precommit_config(
             config = {"repos": [checker_config]}
 
             with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=_YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
             return True
     except Exception as e:
@@ -13,7 +13,7 @@ import sys
 from pathlib import Path
 from typing import Optional, Sequence
 
-from .copyright_checker import CopyrightChecker
+from .copyright_checker import DEFAULT_MAX_WORKERS, CopyrightChecker
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -149,6 +149,18 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         action="store_true",
         help="Replace existing similar copyright notices with the template notice (requires --fix)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of files checked concurrently (default: {DEFAULT_MAX_WORKERS}; use 1 to check them one by one)",
+    )
+    parser.add_argument(
+        "--cache-file",
+        default=None,
+        help="Remember files with a valid notice in this JSON file and skip them while unchanged (default: no cache)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -158,6 +170,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             "--replace requires auto-fix to be enabled. Remove --no-fix or don't use --replace."
         )
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
     if args.per_file_years and not args.git_aware:
         parser.error(
             "--per-file-years requires Git to be enabled. Remove --no-git-aware or don't use --per-file-years."
@@ -184,6 +199,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             hierarchical=args.hierarchical,
             replace_mode=args.replace,
             per_file_years=args.per_file_years,
+            cache_file=args.cache_file,
         )
 
         # Determine which files to check
@@ -209,7 +225,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         )
         logging.debug(f"Supported extensions: {checker.get_supported_extensions()}")
 
-        passed, failed, modified = checker.check_files(files_to_check, args.fix)
+        passed, failed, modified = checker.check_files(
+            files_to_check, args.fix, max_workers=args.jobs
+        )
+        checker.save_cache()
 
         # Print summary
         if modified:
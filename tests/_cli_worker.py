@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2026 Sony Group Corporation
+# Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
+# License: For licensing see the License.txt file
+
+"""CLI entry point run inside the integration tests' worker pool
+
+Children are forked from a server that has already imported ``scripts.main``,
+so each call pays neither interpreter start-up nor the package import.
+"""
+
+import io
+import logging
+import multiprocessing
+from contextlib import redirect_stderr, redirect_stdout
+
+from scripts.main import main
+
+
+def invoke(argv):
+    """
+    Run the CLI once with fresh logging and captured output.
+
+    :param argv: Command line arguments
+    :return: Tuple of (exit code, stdout, stderr)
+    """
+    out, err = io.StringIO(), io.StringIO()
+    # Drop handlers left by the previous call so basicConfig binds to ``err``
+    logging.getLogger().handlers = []
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            rc = main(argv)
+        except SystemExit as e:
+            rc = e.code if e.code is not None else 0
+    return rc, out.getvalue(), err.getvalue()
+
+
+def get_context():
+    """
+    Pick the cheapest start method that is safe to use from pytest.
+
+    ``forkserver`` forks children from a clean server with ``scripts.main``
+    preloaded instead of forking the (possibly threaded) test process.
+    Windows has no fork at all and falls back to ``spawn``.
+
+    :return: Multiprocessing context for the worker pool
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["scripts.main", __name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
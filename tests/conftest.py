@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2026 Sony Group Corporation
+# Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
+# License: For licensing see the License.txt file
+
+"""Shared pytest configuration"""
+
+import functools
+import hashlib
+import itertools
+import os
+import tempfile
+
+import pytest
+
+from scripts.copyright_template_parser import CopyrightTemplateParser
+
+# Opt-in: with PYTEST_TMPDIR_ON_TMPFS set to a RAM-backed mount (e.g.
+# /dev/shm), test scratch files go there. This reroutes every tempfile call in
+# the test process, library code included, so the mount needs room for the
+# whole run; Docker's default /dev/shm is only 64 MB. Unset, the system
+# default temp directory is used.
+_TMPFS_DIR = os.environ.get("PYTEST_TMPDIR_ON_TMPFS")
+if _TMPFS_DIR and os.path.isdir(_TMPFS_DIR) and os.access(_TMPFS_DIR, os.W_OK):
+    tempfile.tempdir = _TMPFS_DIR
+
+
+@pytest.fixture(scope="session")
+def parse_template():
+    """
+    Parse template text once per session, keyed by its content.
+
+    Templates are frozen, so each call only needs its own copy of the
+    extension -> template mapping.
+    """
+    parse = functools.lru_cache(maxsize=None)(CopyrightTemplateParser.parse_string)
+    return lambda content: dict(parse(content))
+
+
+@pytest.fixture(scope="session")
+def template_file(tmp_path_factory):
+    """
+    Write template text to a file once per session and return its path.
+
+    Files are named after a hash of their content, so tests asking for the
+    same template share one read-only file.
+    """
+    template_dir = tmp_path_factory.mktemp("templates")
+
+    @functools.lru_cache(maxsize=None)
+    def write(content):
+        data = content.encode("utf-8")
+        path = template_dir / f"{hashlib.sha1(data).hexdigest()}.txt"
+        path.write_bytes(data)
+        return str(path)
+
+    return write
+
+
+@pytest.fixture
+def write_temp_file(tmp_path):
+    """
+    Write content to a new file in the test's tmp_path and return its path.
+
+    Text is written as UTF-8 bytes, so line endings are kept exactly as given
+    on every platform.
+    """
+    counter = itertools.count()
+
+    def write(content, suffix=".txt"):
+        path = tmp_path / f"file{next(counter)}{suffix}"
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        path.write_bytes(content)
+        return str(path)
+
+    return write
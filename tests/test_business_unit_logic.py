@@ -22,17 +22,25 @@ class TestBusinessUnitLogic:
         """Create a temporary directory with git repo"""
         with tempfile.TemporaryDirectory() as tmpdir:
             # Initialize git repo
-            subprocess.run(["git", "init"], cwd=tmpdir, capture_output=True, check=True)
+            subprocess.run(
+                ["git", "init"],
+                cwd=tmpdir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
             subprocess.run(
                 ["git", "config", "user.email", "test@test.com"],
                 cwd=tmpdir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             subprocess.run(
                 ["git", "config", "user.name", "Test User"],
                 cwd=tmpdir,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
             yield tmpdir
@@ -86,13 +94,18 @@ def original_function():
 
         # Commit it (simulating we got it from another team)
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "Initial from Network Comm"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Now modify the file (simulating our changes)
@@ -162,20 +175,29 @@ original_code = True
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "From MSE"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify and stage
         with open(test_file, "a") as f:
             f.write("our_code = True\n")
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Check
@@ -213,13 +235,18 @@ def their_function():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "From Haptic"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Check without modifying
@@ -255,13 +282,18 @@ class TheirClass:
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "Library from SCDE"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         checker = CopyrightChecker(copyright_template)
@@ -293,13 +325,18 @@ def external_function():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "External library"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         checker = CopyrightChecker(copyright_template)
@@ -395,13 +432,18 @@ old_code = True
 
         # Commit it
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "Old file"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify it
@@ -491,13 +533,18 @@ def shared_function():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "Multi-unit file"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify it
@@ -682,13 +729,18 @@ print("script")
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "Tools script"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify
@@ -749,13 +801,18 @@ function original() {
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "Web code"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify
@@ -807,13 +864,18 @@ def code():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "long"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         checker = CopyrightChecker(copyright_template)
@@ -866,13 +928,18 @@ def code():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "special"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         with open(test_file, "a") as f:
@@ -976,13 +1043,18 @@ function code() {}
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "mixed"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         checker = CopyrightChecker(copyright_template)
@@ -1055,13 +1127,18 @@ def original():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "add"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify file
@@ -1098,13 +1175,18 @@ def original():
             f.write(content)
 
         subprocess.run(
-            ["git", "add", test_file], cwd=temp_dir, check=True, capture_output=True
+            ["git", "add", test_file],
+            cwd=temp_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         subprocess.run(
             ["git", "commit", "-m", "add"],
             cwd=temp_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Modify file
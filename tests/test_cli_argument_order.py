@@ -13,29 +13,29 @@ various argument orders and combinations work correctly.
 """
 
 import pytest
-import tempfile
 import subprocess
 import sys
-from pathlib import Path
+
+# Every test here spawns a fresh interpreter
+pytestmark = pytest.mark.cli
 
 
 @pytest.fixture
-def test_environment():
+def test_environment(tmp_path):
     """Create a test environment with files and copyright template."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project_dir = Path(tmpdir)
+    project_dir = tmp_path
 
-        # Create copyright template
-        template_content = """[.py]
+    # Create copyright template
+    template_content = """[.py]
 # Copyright {regex:\\d{4}(-\\d{4})?} Test Company
 """
-        (project_dir / "copyright.txt").write_text(template_content)
+    (project_dir / "copyright.txt").write_text(template_content)
 
-        # Create test file
-        (project_dir / "test.py").write_text("def hello():\n    pass\n")
-        (project_dir / "README.md").write_text("# README\n")
+    # Create test file
+    (project_dir / "test.py").write_text("def hello():\n    pass\n")
+    (project_dir / "README.md").write_text("# README\n")
 
-        yield project_dir
+    return project_dir
 
 
 class TestCLIArgumentOrder:
@@ -47,8 +47,8 @@ class TestCLIArgumentOrder:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -62,8 +62,8 @@ class TestCLIArgumentOrder:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", str(file_path), "--no-fix"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -78,8 +78,8 @@ class TestCLIArgumentOrder:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", str(file1), str(file2)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -92,8 +92,8 @@ class TestCLIArgumentOrder:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--no-fix", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -131,7 +131,8 @@ class TestCLIArgumentOrder:
                 str(output_path),
                 "--help",
             ],  # Should show init help, not try to process --help as file
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             cwd=test_environment,
         )
@@ -147,8 +148,8 @@ class TestCLIArgumentOrder:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", str(init_file)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -161,8 +162,8 @@ class TestCLIArgumentOrder:
         """Test with relative path as first argument."""
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "test.py"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -174,8 +175,8 @@ class TestCLIArgumentOrder:
         # Note: This tests shell expansion, not direct pattern matching
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "*.py"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
             shell=True,  # Shell will expand *.py
         )
@@ -190,7 +191,9 @@ class TestCLIEdgeCases:
     def test_empty_arguments(self):
         """Test with no arguments."""
         result = subprocess.run(
-            [sys.executable, "-m", "scripts.main"], capture_output=True, text=True
+            [sys.executable, "-m", "scripts.main"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Should succeed (no files to process)
@@ -200,8 +203,8 @@ class TestCLIEdgeCases:
         """Test with only flags, no files."""
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--verbose", "--no-fix"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         # Should succeed (no files to process)
@@ -213,8 +216,8 @@ class TestCLIEdgeCases:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -234,8 +237,8 @@ class TestCLIEdgeCases:
                 "--",  # Use -- to prevent misinterpretation
                 str(dash_file),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -252,7 +255,8 @@ class TestInitCommandEdgeCases:
         # Just verify the command is recognized
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "init", "--help"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
         )
 
@@ -269,7 +273,8 @@ class TestInitCommandEdgeCases:
                 "init",
                 "--help",
             ],  # Just check help works
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
         )
 
@@ -286,7 +291,8 @@ class TestInitCommandEdgeCases:
         # Using full path should NOT trigger init command
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", str(init_file)],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             cwd=test_environment,
         )
@@ -306,7 +312,8 @@ class TestInitCommandEdgeCases:
                 "--output",
                 str(test_environment),
             ],  # Directory, not file
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             input="1\n",  # Select MIT
             cwd=test_environment,
@@ -336,8 +343,8 @@ class TestAllFlagsIndividually:
                 str(custom_template),
                 str(file_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -357,8 +364,8 @@ class TestAllFlagsIndividually:
                 "nonexistent.txt",
                 str(file_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -370,7 +377,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--verbose", str(file_path)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -384,7 +392,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "-v", str(file_path)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -395,7 +404,12 @@ class TestAllFlagsIndividually:
     def test_changed_only_flag(self, test_environment):
         """Test --changed-only flag (requires git repo)."""
         # Initialize git repo
-        subprocess.run(["git", "init"], cwd=test_environment, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=test_environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"], cwd=test_environment
         )
@@ -410,8 +424,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--changed-only"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -420,7 +434,12 @@ class TestAllFlagsIndividually:
 
     def test_changed_only_with_filenames_warns(self, test_environment):
         """Test --changed-only with filenames shows warning."""
-        subprocess.run(["git", "init"], cwd=test_environment, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=test_environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"], cwd=test_environment
         )
@@ -436,7 +455,8 @@ class TestAllFlagsIndividually:
                 "--changed-only",
                 str(file_path),
             ],  # Should be ignored
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -449,7 +469,12 @@ class TestAllFlagsIndividually:
 
     def test_base_ref_flag(self, test_environment):
         """Test --base-ref flag with --changed-only."""
-        subprocess.run(["git", "init"], cwd=test_environment, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=test_environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"], cwd=test_environment
         )
@@ -466,8 +491,8 @@ class TestAllFlagsIndividually:
                 "--base-ref",
                 "HEAD",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -487,7 +512,8 @@ class TestAllFlagsIndividually:
                 "main",
                 str(file_path),
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -501,8 +527,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--no-git-aware", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -511,7 +537,12 @@ class TestAllFlagsIndividually:
 
     def test_per_file_years_flag(self, test_environment):
         """Test --per-file-years flag."""
-        subprocess.run(["git", "init"], cwd=test_environment, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=test_environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"], cwd=test_environment
         )
@@ -521,8 +552,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--per-file-years", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -542,7 +573,8 @@ class TestAllFlagsIndividually:
                 "--no-git-aware",
                 str(file_path),
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -567,8 +599,8 @@ class TestAllFlagsIndividually:
                 str(ignore_file),
                 str(file_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -581,8 +613,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--no-gitignore", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -595,8 +627,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--hierarchical", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -611,8 +643,8 @@ class TestAllFlagsIndividually:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--replace", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -634,7 +666,8 @@ class TestAllFlagsIndividually:
                 "--no-fix",
                 str(file_path),
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -660,7 +693,8 @@ class TestFlagCombinations:
                 "--no-fix",
                 str(file_path),
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=test_environment,
         )
@@ -686,8 +720,8 @@ class TestFlagCombinations:
                 custom_name,
                 str(file_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -707,8 +741,8 @@ class TestFlagCombinations:
                 "--hierarchical",
                 str(file_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -716,7 +750,12 @@ class TestFlagCombinations:
 
     def test_all_flags_together(self, test_environment):
         """Test many flags together (valid combination)."""
-        subprocess.run(["git", "init"], cwd=test_environment, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=test_environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"], cwd=test_environment
         )
@@ -736,8 +775,8 @@ class TestFlagCombinations:
                 "--no-gitignore",
                 str(file_path),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -756,8 +795,8 @@ class TestErrorHandling:
                 "scripts.main",
                 str(test_environment / "nonexistent.py"),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -766,7 +805,12 @@ class TestErrorHandling:
 
     def test_invalid_base_ref(self, test_environment):
         """Test --base-ref with invalid git reference."""
-        subprocess.run(["git", "init"], cwd=test_environment, capture_output=True)
+        subprocess.run(
+            ["git", "init"],
+            cwd=test_environment,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"], cwd=test_environment
         )
@@ -781,8 +825,8 @@ class TestErrorHandling:
                 "--base-ref",
                 "nonexistent-branch",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -793,8 +837,8 @@ class TestErrorHandling:
         """Test --changed-only in non-git directory."""
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", "--changed-only"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -808,8 +852,8 @@ class TestErrorHandling:
 
         result = subprocess.run(
             [sys.executable, "-m", "scripts.main", str(file_path)],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=test_environment,
         )
 
@@ -7,14 +7,25 @@
 """Integration tests for the copyright checker"""
 
 import pytest
-import tempfile
+import json
+import logging
+import multiprocessing
 import os
+import pickle
 import subprocess
-from scripts.copyright_checker import CopyrightChecker
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from unittest.mock import patch
+from scripts.copyright_checker import (
+    DEFAULT_MAX_WORKERS,
+    PROCESS_POOL_MIN_FILES,
+    CopyrightChecker,
+    _root_logging_config,
+)
 
 
 @pytest.fixture
-def temp_copyright_template():
+def temp_copyright_template(template_file):
     """Create a temporary copyright template file"""
     content = """[.py]
 # Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation
@@ -28,30 +39,18 @@ def temp_copyright_template():
 // License: MIT
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    yield temp_path
-
-    os.unlink(temp_path)
+    return template_file(content)
 
 
 @pytest.fixture
-def temp_simple_template():
+def temp_simple_template(template_file):
     """Create a simple template without regex"""
     content = """[.txt]
 Copyright Notice
 All Rights Reserved
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    yield temp_path
-
-    os.unlink(temp_path)
+    return template_file(content)
 
 
 # ============================================================================
@@ -59,7 +58,7 @@ All Rights Reserved
 # ============================================================================
 
 
-def test_check_file_with_valid_copyright(temp_copyright_template):
+def test_check_file_with_valid_copyright(temp_copyright_template, write_temp_file):
     """Test checking a file that already has a valid copyright"""
     # Create a test file with copyright
     content = """# Copyright 2026 SNY Group Corporation
@@ -69,49 +68,39 @@ def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_file_missing_copyright(temp_copyright_template):
+def test_check_file_missing_copyright(temp_copyright_template, write_temp_file):
     """Test checking a file missing copyright (with auto-fix)"""
     # Create a test file without copyright
     content = """def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Verify copyright was added
-        with open(temp_file, "r") as f:
-            updated_content = f.read()
+    # Verify copyright was added
+    with open(temp_file, "r") as f:
+        updated_content = f.read()
 
-        assert "Copyright" in updated_content
-        assert "SNY Group Corporation" in updated_content
-    finally:
-        os.unlink(temp_file)
+    assert "Copyright" in updated_content
+    assert "SNY Group Corporation" in updated_content
 
 
-def test_check_file_with_shebang(temp_copyright_template):
+def test_check_file_with_shebang(temp_copyright_template, write_temp_file):
     """Test that shebang lines are preserved"""
     content = """#!/usr/bin/env python
 
@@ -119,28 +108,23 @@ def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Verify shebang is still first line
-        with open(temp_file, "r") as f:
-            lines = f.readlines()
+    # Verify shebang is still first line
+    with open(temp_file, "r") as f:
+        lines = f.readlines()
 
-        assert lines[0].startswith("#!/usr/bin/env python")
-        assert "Copyright" in lines[1]
-    finally:
-        os.unlink(temp_file)
+    assert lines[0].startswith("#!/usr/bin/env python")
+    assert "Copyright" in lines[1]
 
 
-def test_check_file_with_year_range(temp_copyright_template):
+def test_check_file_with_year_range(temp_copyright_template, write_temp_file):
     """Test checking a file with year range copyright"""
     content = """# Copyright 2020-2026 SNY Group Corporation
 # Author: Test Author
@@ -149,67 +133,52 @@ def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_file_sql_extension(temp_copyright_template):
+def test_check_file_sql_extension(temp_copyright_template, write_temp_file):
     """Test checking SQL file with correct copyright"""
     content = """-- Copyright 2026 SNY Group Corporation
 
 SELECT * FROM users;
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".sql") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".sql")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_file_adds_copyright_to_sql(temp_copyright_template):
+def test_check_file_adds_copyright_to_sql(temp_copyright_template, write_temp_file):
     """Test adding copyright to SQL file"""
     content = """SELECT * FROM users;
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".sql") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".sql")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        with open(temp_file, "r") as f:
-            updated_content = f.read()
+    with open(temp_file, "r") as f:
+        updated_content = f.read()
 
-        assert "-- Copyright" in updated_content
-        assert "SNY Group Corporation" in updated_content
-    finally:
-        os.unlink(temp_file)
+    assert "-- Copyright" in updated_content
+    assert "SNY Group Corporation" in updated_content
 
 
-def test_check_files_multiple(temp_copyright_template):
+def test_check_files_multiple(temp_copyright_template, write_temp_file):
     """Test checking multiple files at once"""
     # Create test files
     file1_content = """# Copyright 2026 SNY Group Corporation
@@ -222,28 +191,212 @@ def func1():
     pass
 """
 
-    temp_files = []
+    temp_files = [
+        write_temp_file(file1_content, suffix=".py"),  # with copyright
+        write_temp_file(file2_content, suffix=".py"),  # without copyright
+    ]
+
+    checker = CopyrightChecker(temp_copyright_template)
+    passed, failed, modified = checker.check_files(temp_files, auto_fix=True)
 
-    # Create file with copyright
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(file1_content)
-        temp_files.append(f.name)
+    assert len(passed) == 2
+    assert len(failed) == 0
+    assert len(modified) == 1  # Only second file was modified
 
-    # Create file without copyright
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(file2_content)
-        temp_files.append(f.name)
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        passed, failed, modified = checker.check_files(temp_files, auto_fix=True)
+def test_check_files_keeps_order_and_skips_duplicates(
+    temp_copyright_template, write_temp_file
+):
+    """Test that batch results follow input order and duplicates are checked once"""
+    temp_files = [
+        write_temp_file(f"def func{i}():\n    pass\n", suffix=".py") for i in range(5)
+    ]
 
-        assert len(passed) == 2
-        assert len(failed) == 0
-        assert len(modified) == 1  # Only second file was modified
-    finally:
-        for temp_file in temp_files:
-            os.unlink(temp_file)
+    checker = CopyrightChecker(temp_copyright_template)
+    passed, failed, modified = checker.check_files(
+        temp_files + [temp_files[0]], auto_fix=True
+    )
+
+    assert passed == temp_files
+    assert modified == temp_files
+    assert failed == []
+    # The duplicated path received exactly one notice
+    with open(temp_files[0], "r") as f:
+        assert f.read().count("Copyright") == 1
+
+
+def test_check_files_bounds_thread_pool(temp_copyright_template, write_temp_file):
+    """Test that check_files uses a small thread pool, or none for one worker"""
+    temp_files = [
+        write_temp_file(f"def func{i}():\n    pass\n", suffix=".py") for i in range(3)
+    ]
+    checker = CopyrightChecker(temp_copyright_template, git_aware=False)
+
+    with patch(
+        "scripts.copyright_checker.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    ) as pool:
+        checker.check_files(temp_files, auto_fix=False)
+        pool.assert_called_once_with(max_workers=DEFAULT_MAX_WORKERS)
+
+        pool.reset_mock()
+        passed, failed, modified = checker.check_files(
+            temp_files, auto_fix=False, max_workers=1
+        )
+        pool.assert_not_called()
+    assert failed == temp_files
+
+
+def test_check_files_skips_other_spellings_of_a_path(
+    temp_copyright_template, tmp_path, monkeypatch
+):
+    """Test that relative, ./-prefixed and absolute spellings of a file are checked once"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.py").write_bytes(b"def a():\n    pass\n")
+    (tmp_path / "b.py").write_bytes(b"def b():\n    pass\n")
+
+    checker = CopyrightChecker(temp_copyright_template, git_aware=False)
+    passed, failed, modified = checker.check_files(
+        ["a.py", "b.py", "./a.py", str(tmp_path / "a.py")], auto_fix=True
+    )
+
+    # The first spelling is the one reported
+    assert passed == ["a.py", "b.py"]
+    assert modified == ["a.py", "b.py"]
+    assert failed == []
+    assert (tmp_path / "a.py").read_text().count("Copyright") == 1
+
+
+def test_check_files_replace_mode_uses_process_pool(
+    temp_copyright_template, tmp_path, monkeypatch
+):
+    """Test that large replace-mode batches give the same results on a process pool"""
+    monkeypatch.setattr("scripts.copyright_checker.PROCESS_POOL_MIN_FILES", 2)
+    temp_files = []
+    for i in range(4):
+        test_file = tmp_path / f"func{i}.py"
+        test_file.write_bytes(f"def func{i}():\n    pass\n".encode())
+        temp_files.append(str(test_file))
+
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, replace_mode=True
+    )
+    passed, failed, modified = checker.check_files(
+        temp_files + [temp_files[0]], auto_fix=True, max_workers=2
+    )
+
+    assert passed == temp_files
+    assert modified == temp_files
+    assert failed == []
+    assert (tmp_path / "func0.py").read_text().count("Copyright") == 1
+
+
+def test_process_pool_is_bounded(temp_copyright_template, tmp_path, monkeypatch):
+    """Test that the replace-mode process pool has a small default size"""
+    monkeypatch.setattr("scripts.copyright_checker.PROCESS_POOL_MIN_FILES", 2)
+    temp_files = []
+    for i in range(3):
+        test_file = tmp_path / f"func{i}.py"
+        test_file.write_bytes(f"def func{i}():\n    pass\n".encode())
+        temp_files.append(str(test_file))
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, replace_mode=True
+    )
+
+    with patch(
+        "scripts.copyright_checker.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+    ) as pool:
+        checker.check_files(temp_files, auto_fix=False)
+        assert pool.call_args.kwargs["max_workers"] == DEFAULT_MAX_WORKERS
+
+        # One worker checks the files in this process
+        pool.reset_mock()
+        checker.check_files(temp_files, auto_fix=False, max_workers=1)
+        pool.assert_not_called()
+
+
+def test_process_pool_workers_log_under_spawn(
+    temp_copyright_template, tmp_path, monkeypatch, caplog, capfd
+):
+    """Test that spawned workers log like the parent process"""
+    monkeypatch.setattr("scripts.copyright_checker.PROCESS_POOL_MIN_FILES", 2)
+    monkeypatch.setattr(
+        "scripts.copyright_checker.ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+    )
+    caplog.set_level(logging.INFO)
+    temp_files = []
+    for i in range(4):
+        test_file = tmp_path / f"func{i}.py"
+        test_file.write_bytes(f"def func{i}():\n    pass\n".encode())
+        temp_files.append(str(test_file))
+
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, replace_mode=True
+    )
+    passed, failed, modified = checker.check_files(
+        temp_files, auto_fix=True, max_workers=2
+    )
+
+    assert modified == temp_files
+    # A spawned worker starts with an unconfigured root logger; its INFO
+    # records reach stderr only if it was set up like the parent
+    assert capfd.readouterr().err.count("Adding copyright notice to:") == 4
+
+
+def test_pickled_checker_drops_memoized_scores(temp_copyright_template):
+    """Test that worker processes receive the checker without per-run caches"""
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, replace_mode=True
+    )
+    template_text = checker.templates[".py"].get_notice_with_year("YEAR")
+    checker._calculate_copyright_similarity("# Copyright 2020 Other", template_text)
+    assert checker._similarity_cache
+
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    copy = pickle.loads(pickle.dumps(checker))
+
+    # Unpickling restores the checker without touching logging
+    assert root.handlers == handlers
+    assert root.level == level
+    assert copy._similarity_cache == {}
+    assert copy.templates[".py"].lines == checker.templates[".py"].lines
+    assert copy.replace_mode
+    # The original keeps its scores
+    assert checker._similarity_cache
+
+
+def test_root_logging_config_keeps_format_style(monkeypatch):
+    """Test that workers get the parent's log format along with its style"""
+    root = logging.getLogger()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("{levelname}: {message}", style="{"))
+    monkeypatch.setattr(root, "handlers", [handler])
+    monkeypatch.setattr(root, "level", logging.DEBUG)
+
+    assert _root_logging_config() == (
+        logging.DEBUG,
+        "{levelname}: {message}",
+        "{",
+        None,
+    )
+
+
+def test_reset_state_keeps_templates(temp_copyright_template):
+    """Test that reset_state clears per-run caches but keeps the templates"""
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, replace_mode=True
+    )
+    templates = checker.templates
+    template_text = templates[".py"].get_notice_with_year("YEAR")
+    checker._calculate_copyright_similarity("# Copyright 2020 Other", template_text)
+    checker._repo_year_cache = 2018
+
+    checker.reset_state()
+
+    assert checker._similarity_cache == {}
+    assert checker._repo_year_cache is None
+    assert checker.templates is templates
 
 
 def test_get_supported_extensions(temp_copyright_template):
@@ -257,63 +410,53 @@ def test_get_supported_extensions(temp_copyright_template):
     assert len(extensions) == 3
 
 
-def test_check_file_without_auto_fix(temp_copyright_template):
+def test_check_file_without_auto_fix(temp_copyright_template, write_temp_file):
     """Test checking file without auto-fix (report only)"""
     content = """def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=False)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=False)
 
-        # Should detect missing copyright but not modify
-        assert has_notice is False
-        assert was_modified is False
+    # Should detect missing copyright but not modify
+    assert has_notice is False
+    assert was_modified is False
 
-        # Verify file wasn't modified
-        with open(temp_file, "r") as f:
-            content_after = f.read()
+    # Verify file wasn't modified
+    with open(temp_file, "r") as f:
+        content_after = f.read()
 
-        assert content == content_after
-    finally:
-        os.unlink(temp_file)
+    assert content == content_after
 
 
-def test_check_file_adds_current_year(temp_copyright_template):
+def test_check_file_adds_current_year(temp_copyright_template, write_temp_file):
     """Test that added copyright uses current year"""
     content = """def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Verify current year is in copyright
-        with open(temp_file, "r") as f:
-            updated_content = f.read()
+    # Verify current year is in copyright
+    with open(temp_file, "r") as f:
+        updated_content = f.read()
 
-        from datetime import datetime
+    from datetime import datetime
 
-        current_year = str(datetime.now().year)
-        assert current_year in updated_content
-    finally:
-        os.unlink(temp_file)
+    current_year = str(datetime.now().year)
+    assert current_year in updated_content
 
 
-def test_check_file_multiline_template(temp_copyright_template):
+def test_check_file_multiline_template(temp_copyright_template, write_temp_file):
     """Test file with multi-line copyright template"""
     content = """// Copyright 2026 SNY Group Corporation
 // License: MIT
@@ -323,18 +466,13 @@ function hello() {
 }
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".js") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".js")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    assert has_notice is True
+    assert was_modified is False
 
 
 # ============================================================================
@@ -348,21 +486,193 @@ def test_init_with_nonexistent_template():
         CopyrightChecker("/nonexistent/template.txt")
 
 
-def test_init_with_invalid_template():
+def test_init_with_invalid_template(write_temp_file):
     """Test initializing checker with invalid template format"""
     content = """This is not a valid template
 No sections here
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    temp_path = write_temp_file(content, suffix=".txt")
 
-    try:
-        with pytest.raises(ValueError, match="Failed to parse copyright template"):
-            CopyrightChecker(temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(ValueError, match="Failed to parse copyright template"):
+        CopyrightChecker(temp_path)
+
+
+def test_init_with_preparsed_templates(temp_copyright_template):
+    """Test initializing checker with already parsed templates"""
+    templates = CopyrightChecker(temp_copyright_template).templates
+
+    # The template path is not read when templates are supplied
+    checker = CopyrightChecker("nonexistent_template.txt", templates=templates)
+
+    assert checker.templates is templates
+    assert set(checker.get_supported_extensions()) == {".py", ".sql", ".js"}
+
+
+def test_template_parse_cached_until_file_changes(tmp_path):
+    """Test that checkers share a parsed template until the file is edited"""
+    template_file = tmp_path / "copyright.txt"
+    template_file.write_bytes(b"[.py]\n# Copyright Test Company\n")
+
+    first = CopyrightChecker(str(template_file), git_aware=False)
+    second = CopyrightChecker(str(template_file), git_aware=False)
+    assert first.templates[".py"] is second.templates[".py"]
+
+    template_file.write_bytes(b"[.py]\n# Copyright Other Company Ltd\n")
+    third = CopyrightChecker(str(template_file), git_aware=False)
+    assert third.templates[".py"].lines == ("# Copyright Other Company Ltd",)
+
+
+def test_from_string(tmp_path):
+    """Test creating a checker from in-memory template text"""
+    checker = CopyrightChecker.from_string(
+        "[.py]\n# Copyright {regex:\\d{4}} Test Company\n"
+    )
+
+    test_file = tmp_path / "test.py"
+    test_file.write_bytes(b"# Copyright 2026 Test Company\n\nx = 1\n")
+
+    assert checker.get_supported_extensions() == {".py"}
+    assert checker.check_file(str(test_file), auto_fix=False) == (True, False)
+
+
+def test_from_string_invalid_template():
+    """Test that invalid in-memory template text is rejected"""
+    with pytest.raises(ValueError, match="Failed to parse copyright template"):
+        CopyrightChecker.from_string("no sections here\n")
+
+
+def test_template_rewritten_with_same_size_and_mtime_is_reparsed(tmp_path):
+    """Test that a template edit invisible to stat still reaches new checkers"""
+    template = tmp_path / "copyright.txt"
+    template.write_bytes(b"[.py]\n# Copyright 2024 AAA Corporation\n")
+    st = template.stat()
+    assert (
+        CopyrightChecker(str(template))
+        .templates[".py"]
+        .lines[0]
+        .endswith("AAA Corporation")
+    )
+
+    template.write_bytes(b"[.py]\n# Copyright 2024 BBB Corporation\n")
+    os.utime(template, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert (
+        CopyrightChecker(str(template))
+        .templates[".py"]
+        .lines[0]
+        .endswith("BBB Corporation")
+    )
+
+
+def test_cache_file_skips_unchanged_valid_files(temp_copyright_template, tmp_path):
+    """Test that files with a valid notice are skipped while unchanged"""
+    cache_file = tmp_path / "cache.json"
+    test_file = tmp_path / "test.py"
+    test_file.write_bytes(
+        b"# Copyright 2024 SNY Group Corporation\n# Author: Test Author\n\nx = 1\n"
+    )
+
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, cache_file=str(cache_file)
+    )
+    assert checker.check_file(str(test_file), auto_fix=False) == (True, False)
+    checker.save_cache()
+    assert str(test_file.resolve()) in cache_file.read_text()
+
+    # A fresh run trusts the cache and does not read the file
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, cache_file=str(cache_file)
+    )
+    with patch("builtins.open", side_effect=AssertionError("file was read")):
+        assert checker.check_file(str(test_file), auto_fix=False) == (True, False)
+
+    # Changing the file invalidates its entry
+    test_file.write_bytes(b"x = 1\n")
+    assert checker.check_file(str(test_file), auto_fix=False) == (False, False)
+
+
+def test_cache_file_records_process_pool_results(temp_copyright_template, tmp_path):
+    """Test that valid files checked on the replace-mode process pool are cached"""
+    cache_file = tmp_path / "cache.json"
+    temp_files = []
+    for i in range(PROCESS_POOL_MIN_FILES + 8):
+        test_file = tmp_path / f"func{i}.py"
+        test_file.write_bytes(
+            b"# Copyright 2024 SNY Group Corporation\n# Author: Test Author\n\n"
+            + f"x = {i}\n".encode()
+        )
+        temp_files.append(str(test_file))
+
+    checker = CopyrightChecker(
+        temp_copyright_template,
+        git_aware=False,
+        replace_mode=True,
+        cache_file=str(cache_file),
+    )
+    passed, failed, modified = checker.check_files(
+        temp_files, auto_fix=True, max_workers=2
+    )
+    checker.save_cache()
+
+    assert passed == temp_files
+    assert modified == []
+    assert sorted(json.loads(cache_file.read_text())) == sorted(
+        os.path.abspath(f) for f in temp_files
+    )
+
+
+def test_cache_file_unreadable_starts_empty(temp_copyright_template, tmp_path):
+    """Test that a corrupt cache file is ignored"""
+    cache_file = tmp_path / "cache.json"
+    cache_file.write_bytes(b"{not json")
+
+    checker = CopyrightChecker(
+        temp_copyright_template, git_aware=False, cache_file=str(cache_file)
+    )
+    assert checker._valid_files == {}
+
+
+def test_valid_file_scanned_once(temp_copyright_template, tmp_path):
+    """Test that a file with one valid notice is scanned for it only once"""
+    test_file = tmp_path / "test.py"
+    test_file.write_bytes(
+        b"# Copyright 2024 SNY Group Corporation\n# Author: Test Author\n\n"
+        + b"x = 1\n" * 1000
+    )
+    checker = CopyrightChecker(temp_copyright_template, git_aware=False)
+    template_cls = type(checker.templates[".py"])
+
+    with patch.object(
+        template_cls,
+        "_match_starts",
+        autospec=True,
+        side_effect=template_cls._match_starts,
+    ) as scan:
+        assert checker.check_file(str(test_file), auto_fix=False) == (True, False)
+
+    scan.assert_called_once()
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_duplicate_notices_scanned_once(temp_copyright_template, tmp_path, newline):
+    """Test that removing duplicate notices reuses the positions check_file found"""
+    notice = "# Copyright 2024 SNY Group Corporation\n# Author: Test Author\n\n"
+    test_file = tmp_path / "test.py"
+    test_file.write_bytes((notice + "x = 1\n" + notice).replace("\n", newline).encode())
+    checker = CopyrightChecker(temp_copyright_template, git_aware=False)
+    template_cls = type(checker.templates[".py"])
+
+    with patch.object(
+        template_cls,
+        "_match_starts",
+        autospec=True,
+        side_effect=template_cls._match_starts,
+    ) as scan:
+        assert checker.check_file(str(test_file), auto_fix=True) == (True, True)
+
+    scan.assert_called_once()
+    assert test_file.read_bytes().decode().count("Copyright") == 1
 
 
 def test_check_nonexistent_file(temp_copyright_template):
@@ -373,59 +683,46 @@ def test_check_nonexistent_file(temp_copyright_template):
         checker.check_file("/nonexistent/file.py", auto_fix=True)
 
 
-def test_unsupported_extension(temp_copyright_template):
+def test_unsupported_extension(temp_copyright_template, write_temp_file):
     """Test file with unsupported extension is skipped"""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".xyz") as f:
-        f.write("test content")
-        temp_file = f.name
+    temp_file = write_temp_file("test content", suffix=".xyz")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should return True (skipped, not an error) and not modified
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    # Should return True (skipped, not an error) and not modified
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_file_without_extension(temp_copyright_template):
+def test_check_file_without_extension(temp_copyright_template, write_temp_file):
     """Test checking file without extension"""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix="") as f:
-        f.write("test content")
-        temp_file = f.name
+    temp_file = write_temp_file("test content", suffix="")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should skip file without extension
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    # Should skip file without extension
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_binary_file(temp_copyright_template):
+def test_check_binary_file(temp_copyright_template, write_temp_file):
     """Test checking a binary file (should skip)"""
     # Create a simple binary file
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a")  # PNG header
-        temp_file = f.name
+    temp_file = write_temp_file(
+        b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a", suffix=".py"
+    )  # PNG header
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should skip binary file gracefully
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    # Should skip binary file gracefully
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_file_wrong_copyright(temp_copyright_template):
+def test_check_file_wrong_copyright(temp_copyright_template, write_temp_file):
     """Test file with incorrect copyright (different company)"""
     content = """# Copyright 2026 Another Company
 # Author: Test Author
@@ -434,46 +731,36 @@ def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should NOT add duplicate copyright for different entity
-        # User must remove the other copyright manually
-        assert has_notice is False
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    # Should NOT add duplicate copyright for different entity
+    # User must remove the other copyright manually
+    assert has_notice is False
+    assert was_modified is False
 
 
-def test_check_files_with_nonexistent(temp_copyright_template):
+def test_check_files_with_nonexistent(temp_copyright_template, write_temp_file):
     """Test check_files with mix of valid and non-existent files"""
     # Create one valid file
     content = """def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        files = [temp_file, "/nonexistent/file.py"]
-        passed, failed, modified = checker.check_files(files, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    files = [temp_file, "/nonexistent/file.py"]
+    passed, failed, modified = checker.check_files(files, auto_fix=True)
 
-        assert len(passed) == 1
-        assert len(failed) == 1
-        assert len(modified) == 1
-    finally:
-        os.unlink(temp_file)
+    assert len(passed) == 1
+    assert len(failed) == 1
+    assert len(modified) == 1
 
 
-def test_check_file_incomplete_copyright(temp_copyright_template):
+def test_check_file_incomplete_copyright(temp_copyright_template, write_temp_file):
     """Test file with incomplete copyright notice"""
     # Only first line of copyright present
     content = """# Copyright 2026 SNY Group Corporation
@@ -482,19 +769,14 @@ def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Template requires both lines, so this should be modified
-        assert has_notice is True
-        assert was_modified is True
-    finally:
-        os.unlink(temp_file)
+    # Template requires both lines, so this should be modified
+    assert has_notice is True
+    assert was_modified is True
 
 
 # ============================================================================
@@ -502,29 +784,24 @@ def hello():
 # ============================================================================
 
 
-def test_check_empty_file(temp_copyright_template):
+def test_check_empty_file(temp_copyright_template, write_temp_file):
     """Test checking an empty file"""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write("")
-        temp_file = f.name
+    temp_file = write_temp_file("", suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Verify copyright was added
-        with open(temp_file, "r") as f:
-            content = f.read()
+    # Verify copyright was added
+    with open(temp_file, "r") as f:
+        content = f.read()
 
-        assert "Copyright" in content
-    finally:
-        os.unlink(temp_file)
+    assert "Copyright" in content
 
 
-def test_check_file_only_whitespace(temp_copyright_template):
+def test_check_file_only_whitespace(temp_copyright_template, write_temp_file):
     """Test checking file with only whitespace"""
     content = """
 
@@ -532,49 +809,39 @@ def test_check_file_only_whitespace(temp_copyright_template):
 
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
-    finally:
-        os.unlink(temp_file)
+    assert has_notice is True
+    assert was_modified is True
 
 
-def test_check_file_shebang_with_content(temp_copyright_template):
+def test_check_file_shebang_with_content(temp_copyright_template, write_temp_file):
     """Test shebang handling with immediate content"""
     content = """#!/usr/bin/env python
 def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Check structure
-        with open(temp_file, "r") as f:
-            lines = f.readlines()
+    # Check structure
+    with open(temp_file, "r") as f:
+        lines = f.readlines()
 
-        assert lines[0].startswith("#!/usr/bin/env python")
-        assert "Copyright" in "".join(lines[1:3])
-    finally:
-        os.unlink(temp_file)
+    assert lines[0].startswith("#!/usr/bin/env python")
+    assert "Copyright" in "".join(lines[1:3])
 
 
-def test_check_file_multiple_shebangs(temp_copyright_template):
+def test_check_file_multiple_shebangs(temp_copyright_template, write_temp_file):
     """Test file with multiple lines starting with #! (only first should be preserved)"""
     content = """#!/usr/bin/env python
 #! This is a comment
@@ -583,90 +850,66 @@ def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Copyright should be after first line (shebang)
-        with open(temp_file, "r") as f:
-            content = f.read()
+    # Copyright should be after first line (shebang)
+    with open(temp_file, "r") as f:
+        content = f.read()
 
-        assert content.startswith("#!/usr/bin/env python")
-        assert "Copyright" in content
-        # Copyright should come before the second #! line
-        assert content.index("Copyright") < content.index("#! This is a comment")
-    finally:
-        os.unlink(temp_file)
+    assert content.startswith("#!/usr/bin/env python")
+    assert "Copyright" in content
+    # Copyright should come before the second #! line
+    assert content.index("Copyright") < content.index("#! This is a comment")
 
 
-def test_check_file_with_utf8_bom(temp_copyright_template):
+def test_check_file_with_utf8_bom(temp_copyright_template, write_temp_file):
     """Test file with UTF-8 BOM"""
     content = """\ufeffdef hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete=False, suffix=".py", encoding="utf-8-sig"
-    ) as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content.encode("utf-8-sig"), suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should handle BOM gracefully
-        assert has_notice is True
-        assert was_modified is True
-    finally:
-        os.unlink(temp_file)
+    # Should handle BOM gracefully
+    assert has_notice is True
+    assert was_modified is True
 
 
-def test_check_file_with_very_long_lines(temp_copyright_template):
+def test_check_file_with_very_long_lines(temp_copyright_template, write_temp_file):
     """Test file with very long lines"""
     long_line = "x = '" + "a" * 10000 + "'"
     content = f"""{long_line}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
-    finally:
-        os.unlink(temp_file)
+    assert has_notice is True
+    assert was_modified is True
 
 
-def test_check_file_with_mixed_line_endings(temp_copyright_template):
+def test_check_file_with_mixed_line_endings(temp_copyright_template, write_temp_file):
     """Test file with mixed line endings (CRLF and LF)"""
     content = "# Copyright 2026 SNY Group Corporation\r\n# Author: Test Author\n\ndef hello():\r\n    pass"
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete=False, suffix=".py", newline=""
-    ) as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should handle mixed line endings
-        assert has_notice is True
-    finally:
-        os.unlink(temp_file)
+    # Should handle mixed line endings
+    assert has_notice is True
 
 
 def test_check_files_empty_list(temp_copyright_template):
@@ -679,29 +922,22 @@ def test_check_files_empty_list(temp_copyright_template):
     assert len(modified) == 0
 
 
-def test_check_files_all_unsupported(temp_copyright_template):
+def test_check_files_all_unsupported(temp_copyright_template, write_temp_file):
     """Test check_files with all unsupported extensions"""
-    temp_files = []
-
-    for ext in [".xyz", ".abc", ".def"]:
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=ext) as f:
-            f.write("content")
-            temp_files.append(f.name)
+    temp_files = [
+        write_temp_file("content", suffix=ext) for ext in [".xyz", ".abc", ".def"]
+    ]
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        passed, failed, modified = checker.check_files(temp_files, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    passed, failed, modified = checker.check_files(temp_files, auto_fix=True)
 
-        # All should pass (skipped) with no modifications
-        assert len(passed) == 3
-        assert len(failed) == 0
-        assert len(modified) == 0
-    finally:
-        for temp_file in temp_files:
-            os.unlink(temp_file)
+    # All should pass (skipped) with no modifications
+    assert len(passed) == 3
+    assert len(failed) == 0
+    assert len(modified) == 0
 
 
-def test_check_file_preserves_exact_content(temp_copyright_template):
+def test_check_file_preserves_exact_content(temp_copyright_template, write_temp_file):
     """Test that check_file preserves file content when copyright is valid"""
     content = """# Copyright 2026 SNY Group Corporation
 # Author: Test Author
@@ -714,52 +950,44 @@ class MyClass:
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is False
+    assert has_notice is True
+    assert was_modified is False
 
-        # Verify content is unchanged
-        with open(temp_file, "r") as f:
-            content_after = f.read()
+    # Verify content is unchanged
+    with open(temp_file, "r") as f:
+        content_after = f.read()
 
-        assert content == content_after
-    finally:
-        os.unlink(temp_file)
+    assert content == content_after
 
 
-def test_check_file_single_line(temp_copyright_template):
+def test_check_file_single_line(temp_copyright_template, write_temp_file):
     """Test file with single line of code"""
     content = """print('hello')"""
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Verify copyright was added and code preserved
-        with open(temp_file, "r") as f:
-            updated = f.read()
+    # Verify copyright was added and code preserved
+    with open(temp_file, "r") as f:
+        updated = f.read()
 
-        assert "Copyright" in updated
-        assert "print('hello')" in updated
-    finally:
-        os.unlink(temp_file)
+    assert "Copyright" in updated
+    assert "print('hello')" in updated
 
 
-def test_check_file_copyright_at_wrong_position(temp_copyright_template):
+def test_check_file_copyright_at_wrong_position(
+    temp_copyright_template, write_temp_file
+):
     """Test file with copyright in middle instead of at top"""
     content = """def hello():
     pass
@@ -771,66 +999,56 @@ def world():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should find copyright notice at middle position
-        assert has_notice is True
-        assert was_modified is False
-    finally:
-        os.unlink(temp_file)
+    # Should find copyright notice at middle position
+    assert has_notice is True
+    assert was_modified is False
 
 
-def test_check_file_adds_blank_lines_properly(temp_copyright_template):
+def test_check_file_adds_blank_lines_properly(temp_copyright_template, write_temp_file):
     """Test that copyright is added with proper spacing"""
     content = """def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Check spacing
-        with open(temp_file, "r") as f:
-            lines = f.readlines()
+    # Check spacing
+    with open(temp_file, "r") as f:
+        lines = f.readlines()
 
-        # Should have copyright, blank line, then code
-        copyright_end = None
-        for i, line in enumerate(lines):
-            if "Author: Test Author" in line:
-                copyright_end = i
-                break
+    # Should have copyright, blank line, then code
+    copyright_end = None
+    for i, line in enumerate(lines):
+        if "Author: Test Author" in line:
+            copyright_end = i
+            break
 
-        assert copyright_end is not None
-        # Check there's a blank line after copyright
-        if copyright_end + 1 < len(lines):
-            assert lines[copyright_end + 1].strip() == ""
-    finally:
-        os.unlink(temp_file)
+    assert copyright_end is not None
+    # Check there's a blank line after copyright
+    if copyright_end + 1 < len(lines):
+        assert lines[copyright_end + 1].strip() == ""
 
 
-def test_check_file_with_readonly_permission_error(temp_copyright_template):
+def test_check_file_with_readonly_permission_error(
+    temp_copyright_template, write_temp_file
+):
     """Test handling of file permission errors"""
     content = """def hello():
     pass
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
     try:
         # Make file read-only
@@ -847,9 +1065,8 @@ def test_check_file_with_readonly_permission_error(temp_copyright_template):
             # If it fails with permission error, that's also expected
             pass
     finally:
-        # Restore permissions and delete
+        # Restore permissions so the scratch directory can be removed
         os.chmod(temp_file, 0o644)
-        os.unlink(temp_file)
 
 
 def test_template_with_no_extensions(temp_simple_template):
@@ -861,733 +1078,796 @@ def test_template_with_no_extensions(temp_simple_template):
     assert len(extensions) == 1
 
 
-def test_file_with_crlf_line_endings(temp_copyright_template):
+def test_file_with_crlf_line_endings(temp_copyright_template, write_temp_file):
     """Test that CRLF (Windows) line endings are preserved"""
     # Create a test file with CRLF line endings
     content = "def hello():\r\n    pass\r\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Read file in binary mode to check line endings
-        with open(temp_file, "rb") as f:
-            updated_content = f.read().decode("utf-8")
+    # Read file in binary mode to check line endings
+    with open(temp_file, "rb") as f:
+        updated_content = f.read().decode("utf-8")
 
-        # Verify CRLF line endings are preserved
-        assert "\r\n" in updated_content, "CRLF line endings should be preserved"
-        assert updated_content.count("\r\n") > 0
+    # Verify CRLF line endings are preserved
+    assert "\r\n" in updated_content, "CRLF line endings should be preserved"
+    assert updated_content.count("\r\n") > 0
 
-        # Verify copyright was added
-        assert "Copyright" in updated_content
-        assert "SNY Group Corporation" in updated_content
-    finally:
-        os.unlink(temp_file)
+    # Verify copyright was added
+    assert "Copyright" in updated_content
+    assert "SNY Group Corporation" in updated_content
 
 
-def test_file_with_lf_line_endings(temp_copyright_template):
+def test_file_with_lf_line_endings(temp_copyright_template, write_temp_file):
     """Test that LF (Unix/Linux) line endings are preserved"""
     # Create a test file with LF line endings only
     content = "def hello():\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Read file in binary mode to check line endings
-        with open(temp_file, "rb") as f:
-            updated_content = f.read().decode("utf-8")
+    # Read file in binary mode to check line endings
+    with open(temp_file, "rb") as f:
+        updated_content = f.read().decode("utf-8")
 
-        # Verify no CRLF, only LF
-        assert "\r\n" not in updated_content, "Should not have CRLF line endings"
-        assert "\n" in updated_content, "Should have LF line endings"
+    # Verify no CRLF, only LF
+    assert "\r\n" not in updated_content, "Should not have CRLF line endings"
+    assert "\n" in updated_content, "Should have LF line endings"
 
-        # Verify copyright was added
-        assert "Copyright" in updated_content
-        assert "SNY Group Corporation" in updated_content
-    finally:
-        os.unlink(temp_file)
+    # Verify copyright was added
+    assert "Copyright" in updated_content
+    assert "SNY Group Corporation" in updated_content
 
 
-def test_file_with_crlf_existing_copyright(temp_copyright_template):
+def test_file_with_crlf_existing_copyright(temp_copyright_template, write_temp_file):
     """Test that files with existing copyright and CRLF endings are left unchanged"""
     # Create a test file with copyright and CRLF line endings
     content = "# Copyright 2025 SNY Group Corporation\r\n# Author: Test Author\r\n\r\ndef hello():\r\n    pass\r\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should detect existing copyright and not modify
-        assert has_notice is True
-        assert was_modified is False
+    # Should detect existing copyright and not modify
+    assert has_notice is True
+    assert was_modified is False
 
-        # Read file in binary mode to check line endings
-        with open(temp_file, "rb") as f:
-            updated_content = f.read().decode("utf-8")
+    # Read file in binary mode to check line endings
+    with open(temp_file, "rb") as f:
+        updated_content = f.read().decode("utf-8")
 
-        # Verify CRLF line endings are still present
-        assert "\r\n" in updated_content, "CRLF line endings should be preserved"
+    # Verify CRLF line endings are still present
+    assert "\r\n" in updated_content, "CRLF line endings should be preserved"
 
-        # Verify only one copyright block exists
-        assert updated_content.count("Copyright") == 1
-    finally:
-        os.unlink(temp_file)
+    # Verify only one copyright block exists
+    assert updated_content.count("Copyright") == 1
 
 
-def test_file_with_lf_existing_copyright(temp_copyright_template):
+def test_file_with_lf_existing_copyright(temp_copyright_template, write_temp_file):
     """Test that files with existing copyright and LF endings are left unchanged"""
     # Create a test file with copyright and LF line endings
     content = "# Copyright 2025 SNY Group Corporation\n# Author: Test Author\n\ndef hello():\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should detect existing copyright and not modify
-        assert has_notice is True
-        assert was_modified is False
+    # Should detect existing copyright and not modify
+    assert has_notice is True
+    assert was_modified is False
 
-        # Read file in binary mode to check line endings
-        with open(temp_file, "rb") as f:
-            updated_content = f.read().decode("utf-8")
+    # Read file in binary mode to check line endings
+    with open(temp_file, "rb") as f:
+        updated_content = f.read().decode("utf-8")
 
-        # Verify no CRLF, only LF
-        assert "\r\n" not in updated_content, "Should not have CRLF line endings"
-        assert "\n" in updated_content, "Should have LF line endings"
+    # Verify no CRLF, only LF
+    assert "\r\n" not in updated_content, "Should not have CRLF line endings"
+    assert "\n" in updated_content, "Should have LF line endings"
 
-        # Verify only one copyright block exists
-        assert updated_content.count("Copyright") == 1
-    finally:
-        os.unlink(temp_file)
+    # Verify only one copyright block exists
+    assert updated_content.count("Copyright") == 1
 
 
-def test_mixed_line_endings_treated_as_crlf(temp_copyright_template):
+def test_mixed_line_endings_treated_as_crlf(temp_copyright_template, write_temp_file):
     """Test that files with mixed line endings (containing any CRLF) are treated as CRLF files"""
     # Create a test file with mixed line endings (mostly LF but some CRLF)
     content = "def hello():\r\n    pass\n"  # First line CRLF, second LF
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Read file in binary mode to check line endings
-        with open(temp_file, "rb") as f:
-            updated_content = f.read().decode("utf-8")
+    # Read file in binary mode to check line endings
+    with open(temp_file, "rb") as f:
+        updated_content = f.read().decode("utf-8")
 
-        # Since original had CRLF, output should use CRLF throughout
-        lines_in_copyright = updated_content.split("\n\n")[0]  # Get copyright section
-        assert "\r\n" in lines_in_copyright, (
-            "Copyright should use CRLF when file had any CRLF"
-        )
-    finally:
-        os.unlink(temp_file)
+    # Since original had CRLF, output should use CRLF throughout
+    lines_in_copyright = updated_content.split("\n\n")[0]  # Get copyright section
+    assert "\r\n" in lines_in_copyright, (
+        "Copyright should use CRLF when file had any CRLF"
+    )
 
 
-def test_no_duplicate_copyright_when_run_twice(temp_copyright_template):
+def test_no_duplicate_copyright_when_run_twice(
+    temp_copyright_template, write_temp_file
+):
     """Test that running the checker twice doesn't create duplicate copyrights"""
     # Create a test file without copyright
     content = "def hello():\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
+    checker = CopyrightChecker(temp_copyright_template)
 
-        # First run - should add copyright
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
-        assert has_notice is True
-        assert was_modified is True
+    # First run - should add copyright
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    assert has_notice is True
+    assert was_modified is True
 
-        # Read file after first run
-        with open(temp_file, "r", encoding="utf-8") as f:
-            content_after_first = f.read()
+    # Read file after first run
+    with open(temp_file, "r", encoding="utf-8") as f:
+        content_after_first = f.read()
 
-        first_copyright_count = content_after_first.count("Copyright")
-        assert first_copyright_count == 1, (
-            "Should have exactly one copyright after first run"
-        )
+    first_copyright_count = content_after_first.count("Copyright")
+    assert first_copyright_count == 1, (
+        "Should have exactly one copyright after first run"
+    )
 
-        # Second run - should detect existing copyright and not add another
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
-        assert has_notice is True
-        assert was_modified is False, "Second run should not modify the file"
+    # Second run - should detect existing copyright and not add another
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    assert has_notice is True
+    assert was_modified is False, "Second run should not modify the file"
 
-        # Read file after second run
-        with open(temp_file, "r", encoding="utf-8") as f:
-            content_after_second = f.read()
+    # Read file after second run
+    with open(temp_file, "r", encoding="utf-8") as f:
+        content_after_second = f.read()
 
-        second_copyright_count = content_after_second.count("Copyright")
-        assert second_copyright_count == 1, (
-            "Should still have exactly one copyright after second run"
-        )
-        assert content_after_first == content_after_second, (
-            "File content should be identical after second run"
-        )
-    finally:
-        os.unlink(temp_file)
+    second_copyright_count = content_after_second.count("Copyright")
+    assert second_copyright_count == 1, (
+        "Should still have exactly one copyright after second run"
+    )
+    assert content_after_first == content_after_second, (
+        "File content should be identical after second run"
+    )
 
 
-def test_old_year_copyright_not_replaced(temp_copyright_template):
+def test_old_year_copyright_not_replaced(temp_copyright_template, write_temp_file):
     """Test that copyrights with old years (e.g., 2025) are not replaced with current year"""
     # Create a test file with 2025 copyright
     content = "# Copyright 2025 SNY Group Corporation\n# Author: Test Author\n\ndef hello():\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
+    checker = CopyrightChecker(temp_copyright_template)
 
-        # Run checker
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    # Run checker
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        # Should detect existing copyright and not modify
-        assert has_notice is True
-        assert was_modified is False
+    # Should detect existing copyright and not modify
+    assert has_notice is True
+    assert was_modified is False
 
-        # Read file and verify
-        with open(temp_file, "r", encoding="utf-8") as f:
-            updated_content = f.read()
+    # Read file and verify
+    with open(temp_file, "r", encoding="utf-8") as f:
+        updated_content = f.read()
 
-        # Verify still has 2025, not replaced with 2026
-        assert "2025" in updated_content, "Original year should be preserved"
-        assert "2026" not in updated_content, "Should not add current year"
-        assert updated_content.count("Copyright") == 1, (
-            "Should have exactly one copyright"
-        )
-    finally:
-        os.unlink(temp_file)
+    # Verify still has 2025, not replaced with 2026
+    assert "2025" in updated_content, "Original year should be preserved"
+    assert "2026" not in updated_content, "Should not add current year"
+    assert updated_content.count("Copyright") == 1, "Should have exactly one copyright"
 
 
-def test_multiple_runs_on_old_copyright_no_duplicates(temp_copyright_template):
+def test_multiple_runs_on_old_copyright_no_duplicates(
+    temp_copyright_template, write_temp_file
+):
     """Test that running checker multiple times on file with old copyright doesn't create duplicates"""
     # Create a test file with 2025 copyright
     content = "# Copyright 2025 SNY Group Corporation\n# Author: Test Author\n\ndef hello():\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
+    checker = CopyrightChecker(temp_copyright_template)
 
-        # Run checker 3 times
-        for i in range(3):
-            has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    # Run checker 3 times
+    for i in range(3):
+        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-            assert has_notice is True, f"Run {i + 1}: Should detect copyright"
-            assert was_modified is False, f"Run {i + 1}: Should not modify file"
+        assert has_notice is True, f"Run {i + 1}: Should detect copyright"
+        assert was_modified is False, f"Run {i + 1}: Should not modify file"
 
-            # Read and verify
-            with open(temp_file, "r", encoding="utf-8") as f:
-                current_content = f.read()
+        # Read and verify
+        with open(temp_file, "r", encoding="utf-8") as f:
+            current_content = f.read()
 
-            assert current_content.count("Copyright") == 1, (
-                f"Run {i + 1}: Should have exactly one copyright"
-            )
-            assert "2025" in current_content, f"Run {i + 1}: Should preserve 2025 year"
-            assert "2026" not in current_content, f"Run {i + 1}: Should not add 2026"
-    finally:
-        os.unlink(temp_file)
+        assert current_content.count("Copyright") == 1, (
+            f"Run {i + 1}: Should have exactly one copyright"
+        )
+        assert "2025" in current_content, f"Run {i + 1}: Should preserve 2025 year"
+        assert "2026" not in current_content, f"Run {i + 1}: Should not add 2026"
 
 
-def test_copyright_insertion_position(temp_copyright_template):
+def test_copyright_insertion_position(temp_copyright_template, write_temp_file):
     """Test that copyright is inserted at the correct position (beginning of file)"""
     # Create a test file without copyright
     content = "def hello():\n    return 'world'\n\nclass MyClass:\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="wb", delete=False, suffix=".py") as f:
-        f.write(content.encode("utf-8"))
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
-    try:
-        checker = CopyrightChecker(temp_copyright_template)
-        has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
+    checker = CopyrightChecker(temp_copyright_template)
+    has_notice, was_modified = checker.check_file(temp_file, auto_fix=True)
 
-        assert has_notice is True
-        assert was_modified is True
+    assert has_notice is True
+    assert was_modified is True
 
-        # Read file and verify copyright is at the beginning
-        with open(temp_file, "r", encoding="utf-8") as f:
-            updated_content = f.read()
+    # Read file and verify copyright is at the beginning
+    with open(temp_file, "r", encoding="utf-8") as f:
+        updated_content = f.read()
 
-        # First lines should contain copyright
-        lines = updated_content.split("\n")
-        assert "Copyright" in lines[0], "First line should contain copyright"
-        assert "SNY Group Corporation" in lines[0], (
-            "First line should contain company name"
-        )
-        assert "Author:" in lines[1], "Second line should contain Author"
+    # First lines should contain copyright
+    lines = updated_content.split("\n")
+    assert "Copyright" in lines[0], "First line should contain copyright"
+    assert "SNY Group Corporation" in lines[0], "First line should contain company name"
+    assert "Author:" in lines[1], "Second line should contain Author"
 
-        # Original code should still be present after copyright
-        assert "def hello():" in updated_content
-        assert "class MyClass:" in updated_content
-    finally:
-        os.unlink(temp_file)
+    # Original code should still be present after copyright
+    assert "def hello():" in updated_content
+    assert "class MyClass:" in updated_content
 
 
-def test_get_changed_files_not_in_git_repo(temp_copyright_template):
+def test_get_changed_files_not_in_git_repo(temp_copyright_template, tmp_path):
     """Test that get_changed_files raises error when not in a git repository"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        checker = CopyrightChecker(temp_copyright_template)
+    temp_dir = str(tmp_path)
+    checker = CopyrightChecker(temp_copyright_template)
 
-        with pytest.raises(RuntimeError, match="Failed to get changed files from git"):
-            checker.get_changed_files(repo_path=temp_dir)
+    with pytest.raises(RuntimeError, match="Failed to get changed files from git"):
+        checker.get_changed_files(repo_path=temp_dir)
 
 
-def test_get_changed_files_in_git_repo(temp_copyright_template):
+def test_get_changed_files_in_git_repo(temp_copyright_template, tmp_path):
     """Test getting changed files from a git repository"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create and commit a file
-        file1 = os.path.join(temp_dir, "file1.py")
-        with open(file1, "w") as f:
-            f.write(
-                "# Copyright 2025 SNY Group Corporation\\n# Author: Test Author\\n\\nprint('hello')\\n"
-            )
-
-        subprocess.run(
-            ["git", "add", "file1.py"], cwd=temp_dir, check=True, capture_output=True
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create and commit a file
+    file1 = os.path.join(temp_dir, "file1.py")
+    with open(file1, "w") as f:
+        f.write(
+            "# Copyright 2025 SNY Group Corporation\\n# Author: Test Author\\n\\nprint('hello')\\n"
         )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create a new file (unstaged)
-        file2 = os.path.join(temp_dir, "file2.py")
-        with open(file2, "w") as f:
-            f.write("print('new file')\\n")
 
-        # Modify existing file
-        with open(file1, "a") as f:
-            f.write("print('modified')\\n")
+    subprocess.run(
+        ["git", "add", "file1.py"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial commit"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create a new file (unstaged)
+    file2 = os.path.join(temp_dir, "file2.py")
+    with open(file2, "w") as f:
+        f.write("print('new file')\\n")
+
+    # Modify existing file
+    with open(file1, "a") as f:
+        f.write("print('modified')\\n")
 
-        checker = CopyrightChecker(temp_copyright_template)
+    checker = CopyrightChecker(temp_copyright_template)
 
-        # Get changed files
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    # Get changed files
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should find file1.py (modified), but not file2.py (not in git yet)
-        assert any("file1.py" in f for f in changed_files), (
-            "Should detect modified file1.py"
-        )
+    # Should find file1.py (modified), but not file2.py (not in git yet)
+    assert any("file1.py" in f for f in changed_files), (
+        "Should detect modified file1.py"
+    )
 
 
-def test_get_changed_files_filters_by_extension(temp_copyright_template):
+def test_get_changed_files_filters_by_extension(temp_copyright_template, tmp_path):
     """Test that get_changed_files only returns files with supported extensions"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create files with different extensions
-        py_file = os.path.join(temp_dir, "test.py")
-        txt_file = os.path.join(temp_dir, "test.txt")
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create files with different extensions
+    py_file = os.path.join(temp_dir, "test.py")
+    txt_file = os.path.join(temp_dir, "test.txt")
+
+    with open(py_file, "w") as f:
+        f.write("print('hello')\\n")
+    with open(txt_file, "w") as f:
+        f.write("Some text\\n")
+
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Modify both files
+    with open(py_file, "a") as f:
+        f.write("print('modified')\\n")
+    with open(txt_file, "a") as f:
+        f.write("More text\\n")
 
-        with open(py_file, "w") as f:
-            f.write("print('hello')\\n")
-        with open(txt_file, "w") as f:
-            f.write("Some text\\n")
-
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Modify both files
-        with open(py_file, "a") as f:
-            f.write("print('modified')\\n")
-        with open(txt_file, "a") as f:
-            f.write("More text\\n")
-
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should only return .py file (supported extension)
-        assert any("test.py" in f for f in changed_files), "Should include .py file"
-        assert not any("test.txt" in f for f in changed_files), (
-            "Should not include .txt file (unsupported extension)"
-        )
+    # Should only return .py file (supported extension)
+    assert any("test.py" in f for f in changed_files), "Should include .py file"
+    assert not any("test.txt" in f for f in changed_files), (
+        "Should not include .txt file (unsupported extension)"
+    )
 
 
-def test_get_changed_files_with_staged_changes(temp_copyright_template):
+def test_get_changed_files_with_staged_changes(temp_copyright_template, tmp_path):
     """Test that get_changed_files detects both staged and unstaged files"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create and commit files
-        file1 = os.path.join(temp_dir, "staged.py")
-        file2 = os.path.join(temp_dir, "unstaged.py")
-
-        with open(file1, "w") as f:
-            f.write("print('original1')\\n")
-        with open(file2, "w") as f:
-            f.write("print('original2')\\n")
-
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Modify first file and stage it
-        with open(file1, "a") as f:
-            f.write("print('staged change')\\n")
-        subprocess.run(
-            ["git", "add", "staged.py"], cwd=temp_dir, check=True, capture_output=True
-        )
-
-        # Modify second file but don't stage
-        with open(file2, "a") as f:
-            f.write("print('unstaged change')\\n")
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create and commit files
+    file1 = os.path.join(temp_dir, "staged.py")
+    file2 = os.path.join(temp_dir, "unstaged.py")
+
+    with open(file1, "w") as f:
+        f.write("print('original1')\\n")
+    with open(file2, "w") as f:
+        f.write("print('original2')\\n")
+
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Modify first file and stage it
+    with open(file1, "a") as f:
+        f.write("print('staged change')\\n")
+    subprocess.run(
+        ["git", "add", "staged.py"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Modify second file but don't stage
+    with open(file2, "a") as f:
+        f.write("print('unstaged change')\\n")
 
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should detect both staged and unstaged changes
-        assert any("staged.py" in f for f in changed_files), "Should detect staged file"
-        assert any("unstaged.py" in f for f in changed_files), (
-            "Should detect unstaged file"
-        )
+    # Should detect both staged and unstaged changes
+    assert any("staged.py" in f for f in changed_files), "Should detect staged file"
+    assert any("unstaged.py" in f for f in changed_files), "Should detect unstaged file"
 
 
-def test_get_changed_files_with_new_staged_file(temp_copyright_template):
+def test_get_changed_files_with_new_staged_file(temp_copyright_template, tmp_path):
     """Test that get_changed_files detects new files that are staged"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create initial commit
+    file1 = os.path.join(temp_dir, "existing.py")
+    with open(file1, "w") as f:
+        f.write("print('exists')\\n")
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create new file and stage it
+    new_file = os.path.join(temp_dir, "newfile.py")
+    with open(new_file, "w") as f:
+        f.write("print('new')\\n")
+    subprocess.run(
+        ["git", "add", "newfile.py"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
-        # Create initial commit
-        file1 = os.path.join(temp_dir, "existing.py")
-        with open(file1, "w") as f:
-            f.write("print('exists')\\n")
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create new file and stage it
-        new_file = os.path.join(temp_dir, "newfile.py")
-        with open(new_file, "w") as f:
-            f.write("print('new')\\n")
-        subprocess.run(
-            ["git", "add", "newfile.py"], cwd=temp_dir, check=True, capture_output=True
-        )
-
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should detect new staged file
-        assert any("newfile.py" in f for f in changed_files), (
-            "Should detect new staged file"
-        )
+    # Should detect new staged file
+    assert any("newfile.py" in f for f in changed_files), (
+        "Should detect new staged file"
+    )
 
 
-def test_get_changed_files_no_changes(temp_copyright_template):
+def test_get_changed_files_no_changes(temp_copyright_template, tmp_path):
     """Test that get_changed_files returns empty list when no changes"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create and commit a file
-        file1 = os.path.join(temp_dir, "test.py")
-        with open(file1, "w") as f:
-            f.write("print('hello')\\n")
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create and commit a file
+    file1 = os.path.join(temp_dir, "test.py")
+    with open(file1, "w") as f:
+        f.write("print('hello')\\n")
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should return empty list
-        assert len(changed_files) == 0, "Should return no files when nothing changed"
+    # Should return empty list
+    assert len(changed_files) == 0, "Should return no files when nothing changed"
 
 
-def test_get_changed_files_in_subdirectory(temp_copyright_template):
+def test_get_changed_files_in_subdirectory(temp_copyright_template, tmp_path):
     """Test that get_changed_files works with files in subdirectories"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create subdirectory with file
-        subdir = os.path.join(temp_dir, "src", "utils")
-        os.makedirs(subdir, exist_ok=True)
-
-        file1 = os.path.join(subdir, "helper.py")
-        with open(file1, "w") as f:
-            f.write("print('helper')\\n")
-
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create subdirectory with file
+    subdir = os.path.join(temp_dir, "src", "utils")
+    os.makedirs(subdir, exist_ok=True)
+
+    file1 = os.path.join(subdir, "helper.py")
+    with open(file1, "w") as f:
+        f.write("print('helper')\\n")
+
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Modify the file in subdirectory
+    with open(file1, "a") as f:
+        f.write("print('modified')\\n")
 
-        # Modify the file in subdirectory
-        with open(file1, "a") as f:
-            f.write("print('modified')\\n")
-
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should detect file in subdirectory
-        assert len(changed_files) == 1, "Should detect one changed file"
-        assert "helper.py" in changed_files[0], (
-            "Should detect helper.py in subdirectory"
-        )
-        assert os.path.exists(changed_files[0]), (
-            "Returned path should be absolute and exist"
-        )
+    # Should detect file in subdirectory
+    assert len(changed_files) == 1, "Should detect one changed file"
+    assert "helper.py" in changed_files[0], "Should detect helper.py in subdirectory"
+    assert os.path.exists(changed_files[0]), (
+        "Returned path should be absolute and exist"
+    )
 
 
-def test_get_changed_files_multiple_file_types(temp_copyright_template):
+def test_get_changed_files_multiple_file_types(temp_copyright_template, tmp_path):
     """Test that get_changed_files handles multiple supported file types"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create files of different supported types
-        py_file = os.path.join(temp_dir, "script.py")
-        js_file = os.path.join(temp_dir, "app.js")
-        sql_file = os.path.join(temp_dir, "schema.sql")
-
-        with open(py_file, "w") as f:
-            f.write("print('python')\\n")
-        with open(js_file, "w") as f:
-            f.write("console.log('js');\\n")
-        with open(sql_file, "w") as f:
-            f.write("SELECT * FROM table;\\n")
-
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create files of different supported types
+    py_file = os.path.join(temp_dir, "script.py")
+    js_file = os.path.join(temp_dir, "app.js")
+    sql_file = os.path.join(temp_dir, "schema.sql")
+
+    with open(py_file, "w") as f:
+        f.write("print('python')\\n")
+    with open(js_file, "w") as f:
+        f.write("console.log('js');\\n")
+    with open(sql_file, "w") as f:
+        f.write("SELECT * FROM table;\\n")
+
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Modify all files
+    with open(py_file, "a") as f:
+        f.write("print('modified')\\n")
+    with open(js_file, "a") as f:
+        f.write("console.log('modified');\\n")
+    with open(sql_file, "a") as f:
+        f.write("-- comment\\n")
 
-        # Modify all files
-        with open(py_file, "a") as f:
-            f.write("print('modified')\\n")
-        with open(js_file, "a") as f:
-            f.write("console.log('modified');\\n")
-        with open(sql_file, "a") as f:
-            f.write("-- comment\\n")
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    # Should detect all supported file types
+    assert len(changed_files) == 3, (
+        f"Should detect 3 changed files, found {len(changed_files)}"
+    )
+    assert any("script.py" in f for f in changed_files), "Should detect .py file"
+    assert any("app.js" in f for f in changed_files), "Should detect .js file"
+    assert any("schema.sql" in f for f in changed_files), "Should detect .sql file"
 
-        # Should detect all supported file types
-        assert len(changed_files) == 3, (
-            f"Should detect 3 changed files, found {len(changed_files)}"
-        )
-        assert any("script.py" in f for f in changed_files), "Should detect .py file"
-        assert any("app.js" in f for f in changed_files), "Should detect .js file"
-        assert any("schema.sql" in f for f in changed_files), "Should detect .sql file"
 
-
-def test_get_changed_files_with_deleted_file(temp_copyright_template):
+def test_get_changed_files_with_deleted_file(temp_copyright_template, tmp_path):
     """Test that get_changed_files handles deleted files gracefully"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Create and commit files
-        file1 = os.path.join(temp_dir, "keep.py")
-        file2 = os.path.join(temp_dir, "delete.py")
-
-        with open(file1, "w") as f:
-            f.write("print('keep')\\n")
-        with open(file2, "w") as f:
-            f.write("print('delete')\\n")
+    temp_dir = str(tmp_path)
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.email", "test@test.com"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "config", "user.name", "Test User"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create and commit files
+    file1 = os.path.join(temp_dir, "keep.py")
+    file2 = os.path.join(temp_dir, "delete.py")
+
+    with open(file1, "w") as f:
+        f.write("print('keep')\\n")
+    with open(file2, "w") as f:
+        f.write("print('delete')\\n")
+
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "Initial"],
+        cwd=temp_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Delete one file and modify the other
+    os.remove(file2)
+    with open(file1, "a") as f:
+        f.write("print('modified')\\n")
 
-        subprocess.run(
-            ["git", "add", "."], cwd=temp_dir, check=True, capture_output=True
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=temp_dir,
-            check=True,
-            capture_output=True,
-        )
-
-        # Delete one file and modify the other
-        os.remove(file2)
-        with open(file1, "a") as f:
-            f.write("print('modified')\\n")
-
-        checker = CopyrightChecker(temp_copyright_template)
-        changed_files = checker.get_changed_files(repo_path=temp_dir)
+    checker = CopyrightChecker(temp_copyright_template)
+    changed_files = checker.get_changed_files(repo_path=temp_dir)
 
-        # Should only include the file that still exists
-        assert any("keep.py" in f for f in changed_files), "Should detect modified file"
-        assert not any("delete.py" in f for f in changed_files), (
-            "Should not include deleted file"
-        )
+    # Should only include the file that still exists
+    assert any("keep.py" in f for f in changed_files), "Should detect modified file"
+    assert not any("delete.py" in f for f in changed_files), (
+        "Should not include deleted file"
+    )
 
 
-def test_template_change_creates_duplicate_copyright():
+def test_template_change_creates_duplicate_copyright(write_temp_file):
     """
     Test documenting known limitation: changing template creates duplicate copyrights.
 
@@ -1600,9 +1880,7 @@ def test_template_change_creates_duplicate_copyright():
     # Create file with original copyright
     content = "def hello():\n    pass\n"
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".py") as f:
-        f.write(content)
-        temp_file = f.name
+    temp_file = write_temp_file(content, suffix=".py")
 
     # Create first template
     template_content_v1 = """[.py]
@@ -1610,63 +1888,52 @@ def test_template_change_creates_duplicate_copyright():
 # License: MIT
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(template_content_v1)
-        template_file_v1 = f.name
+    template_file_v1 = write_temp_file(template_content_v1)
 
-    try:
-        # First run - add original copyright
-        checker1 = CopyrightChecker(template_file_v1)
-        has_notice, was_modified = checker1.check_file(temp_file, auto_fix=True)
-        assert has_notice is True
-        assert was_modified is True
+    # First run - add original copyright
+    checker1 = CopyrightChecker(template_file_v1)
+    has_notice, was_modified = checker1.check_file(temp_file, auto_fix=True)
+    assert has_notice is True
+    assert was_modified is True
 
-        # Read content after first run
-        with open(temp_file, "r", encoding="utf-8") as f:
-            content_v1 = f.read()
+    # Read content after first run
+    with open(temp_file, "r", encoding="utf-8") as f:
+        content_v1 = f.read()
 
-        assert "Company A" in content_v1
-        assert content_v1.count("Copyright") == 1
+    assert "Company A" in content_v1
+    assert content_v1.count("Copyright") == 1
 
-        # User updates template - different company and license
-        template_content_v2 = """[.py]
+    # User updates template - different company and license
+    template_content_v2 = """[.py]
 # Copyright {regex:\\d{4}} Company B
 # SPDX-License-Identifier: Apache-2.0
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-            f.write(template_content_v2)
-            template_file_v2 = f.name
+    template_file_v2 = write_temp_file(template_content_v2)
 
-        try:
-            # Second run with new template - creates duplicate (known limitation)
-            checker2 = CopyrightChecker(template_file_v2)
-            has_notice, was_modified = checker2.check_file(temp_file, auto_fix=True)
-
-            # Read content after second run
-            with open(temp_file, "r", encoding="utf-8") as f:
-                content_v2 = f.read()
-
-            copyright_count = content_v2.count("Copyright")
-
-            # Known limitation: strict template matching creates duplicates
-            assert copyright_count == 2, (
-                f"Expected 2 copyrights due to template change, found {copyright_count}"
-            )
-            assert "Company A" in content_v2, "Old copyright still present"
-            assert "Company B" in content_v2, "New copyright added"
-            assert was_modified is True, "File was modified to add new copyright"
-
-            # Verify new copyright is at the top
-            lines = content_v2.split("\n")
-            assert "Company B" in lines[0] or "Company B" in lines[1], (
-                "New copyright should be at top"
-            )
-        finally:
-            os.unlink(template_file_v2)
-    finally:
-        os.unlink(temp_file)
-        os.unlink(template_file_v1)
+    # Second run with new template - creates duplicate (known limitation)
+    checker2 = CopyrightChecker(template_file_v2)
+    has_notice, was_modified = checker2.check_file(temp_file, auto_fix=True)
+
+    # Read content after second run
+    with open(temp_file, "r", encoding="utf-8") as f:
+        content_v2 = f.read()
+
+    copyright_count = content_v2.count("Copyright")
+
+    # Known limitation: strict template matching creates duplicates
+    assert copyright_count == 2, (
+        f"Expected 2 copyrights due to template change, found {copyright_count}"
+    )
+    assert "Company A" in content_v2, "Old copyright still present"
+    assert "Company B" in content_v2, "New copyright added"
+    assert was_modified is True, "File was modified to add new copyright"
+
+    # Verify new copyright is at the top
+    lines = content_v2.split("\n")
+    assert "Company B" in lines[0] or "Company B" in lines[1], (
+        "New copyright should be at top"
+    )
 
 
 if __name__ == "__main__":
@@ -611,3 +611,43 @@ def another():
         # Content should be preserved
         assert "# Copyright 2020 Sony Group Corporation" in result
         assert "code =" in result
+
+    def test_string_literal_states_match_per_line_checks(
+        self, temp_dir, copyright_template
+    ):
+        """Test that the one-pass line states agree with per-line checks"""
+        lines = [
+            "x = 1",
+            'doc = """',
+            "# Copyright 2020 Sony Group Corporation",
+            'still inside \\""" escaped',
+            '"""',
+            's = \'a """ in a plain string\'',
+            "t = '''",
+            '"""',
+            "'''",
+        ]
+        checker = CopyrightChecker(copyright_template)
+
+        states = checker._string_literal_states(lines, len(lines) - 1)
+
+        assert states == [False, True, True, True, False, False, True, True, False]
+        assert states == [
+            checker._is_inside_string_literal(lines, i) for i in range(len(lines))
+        ]
+
+    @pytest.mark.parametrize(
+        "line,inside",
+        [
+            ('s = "a""""', True),  # string closes, then """ opens
+            ('s = "a"""', False),  # string closes, then an empty string
+            ("s = '\\\\''''", True),  # escaped backslash, then ''' opens
+        ],
+    )
+    def test_quote_runs_after_closing_quote(
+        self, temp_dir, copyright_template, line, inside
+    ):
+        """Test that only the first quote of a run closes a plain string"""
+        checker = CopyrightChecker(copyright_template)
+
+        assert checker._string_literal_states([line, "x"], 1) == [inside, inside]
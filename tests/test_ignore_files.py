@@ -7,20 +7,73 @@
 
 """Tests for ignore file functionality (.copyrightignore and .gitignore)"""
 
+import functools
+import itertools
 import os
+import shutil
 import tempfile
 import unittest
+from pathlib import Path
+
+import pytest
 
 from scripts.copyright_checker import CopyrightChecker, HAS_PATHSPEC
 
+# Evaluated once at collection time so pathspec-dependent tests are skipped
+# without running their setUp/tearDown when the library is absent
+requires_pathspec = pytest.mark.skipif(
+    not HAS_PATHSPEC, reason="pathspec library not installed"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _long_path(depth: int) -> str:
+    """Return a deeply nested relative path as a pure string (never created on disk)"""
+    return "/".join(["dir"] * depth)
+
+
+@pytest.fixture(autouse=True)
+def _forbid_long_path_makedirs(monkeypatch):
+    """Fail fast if a test tries to materialize the long path on disk"""
+    real_makedirs = os.makedirs
+
+    def guarded_makedirs(name, *args, **kwargs):
+        assert not os.fspath(name).startswith(_long_path(50)), (
+            "long-path tests must not create directories"
+        )
+        return real_makedirs(name, *args, **kwargs)
+
+    monkeypatch.setattr(os, "makedirs", guarded_makedirs)
+
 
-@unittest.skipIf(not HAS_PATHSPEC, "pathspec library not installed")
-class TestIgnoreFiles(unittest.TestCase):
+class _SharedTempDirTestCase(unittest.TestCase):
+    """Base class giving each test its own subdirectory of one per-class temp dir"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared base directory once per class"""
+        cls._base_dir = tempfile.mkdtemp(prefix="sny_cp_")
+        cls._dir_counter = itertools.count()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared base directory and all per-test subdirectories"""
+        shutil.rmtree(cls._base_dir, ignore_errors=True)
+
+    def _make_temp_dir(self) -> str:
+        """Create a fresh, uniquely named subdirectory for the current test"""
+        temp_dir = os.path.join(self._base_dir, f"t{next(self._dir_counter)}")
+        os.mkdir(temp_dir)
+        return temp_dir
+
+
+@requires_pathspec
+class TestIgnoreFiles(_SharedTempDirTestCase):
     """Test ignore file functionality"""
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = self._make_temp_dir()
         self.original_cwd = os.getcwd()
         os.chdir(self.temp_dir)
 
@@ -37,16 +90,11 @@ COMPANY = Test Company
     def tearDown(self):
         """Clean up test fixtures"""
         os.chdir(self.original_cwd)
-        import shutil
-
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
 
     def test_copyrightignore_simple_pattern(self):
         """Test basic .copyrightignore pattern matching"""
         # Create .copyrightignore
-        with open(".copyrightignore", "w") as f:
-            f.write("generated.py\n")
+        Path(".copyrightignore").write_text("generated.py\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -55,9 +103,7 @@ COMPANY = Test Company
 
     def test_copyrightignore_wildcard_pattern(self):
         """Test wildcard patterns in .copyrightignore"""
-        with open(".copyrightignore", "w") as f:
-            f.write("*.min.js\n")
-            f.write("*.bundle.js\n")
+        Path(".copyrightignore").write_text("*.min.js\n*.bundle.js\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -67,9 +113,7 @@ COMPANY = Test Company
 
     def test_copyrightignore_directory_pattern(self):
         """Test directory patterns in .copyrightignore"""
-        with open(".copyrightignore", "w") as f:
-            f.write("node_modules/\n")
-            f.write("vendor/\n")
+        Path(".copyrightignore").write_text("node_modules/\nvendor/\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -79,8 +123,7 @@ COMPANY = Test Company
 
     def test_copyrightignore_nested_directory(self):
         """Test nested directory patterns"""
-        with open(".copyrightignore", "w") as f:
-            f.write("**/generated/\n")
+        Path(".copyrightignore").write_text("**/generated/\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -90,13 +133,9 @@ COMPANY = Test Company
 
     def test_copyrightignore_comments_and_empty_lines(self):
         """Test that comments and empty lines are ignored"""
-        with open(".copyrightignore", "w") as f:
-            f.write("# This is a comment\n")
-            f.write("\n")
-            f.write("generated.py\n")
-            f.write("# Another comment\n")
-            f.write("\n")
-            f.write("*.tmp\n")
+        Path(".copyrightignore").write_text(
+            "# This is a comment\n\ngenerated.py\n# Another comment\n\n*.tmp\n"
+        )
 
         checker = CopyrightChecker(self.template_path)
 
@@ -106,10 +145,7 @@ COMPANY = Test Company
 
     def test_gitignore_patterns(self):
         """Test that .gitignore patterns are respected"""
-        with open(".gitignore", "w") as f:
-            f.write("__pycache__/\n")
-            f.write("*.pyc\n")
-            f.write(".env\n")
+        Path(".gitignore").write_text("__pycache__/\n*.pyc\n.env\n")
 
         checker = CopyrightChecker(self.template_path, use_gitignore=True)
 
@@ -120,8 +156,7 @@ COMPANY = Test Company
 
     def test_gitignore_disabled(self):
         """Test disabling .gitignore patterns"""
-        with open(".gitignore", "w") as f:
-            f.write("*.pyc\n")
+        Path(".gitignore").write_text("*.pyc\n")
 
         checker = CopyrightChecker(self.template_path, use_gitignore=False)
 
@@ -130,11 +165,9 @@ COMPANY = Test Company
 
     def test_combined_copyrightignore_and_gitignore(self):
         """Test combining patterns from both files"""
-        with open(".copyrightignore", "w") as f:
-            f.write("generated/\n")
+        Path(".copyrightignore").write_text("generated/\n")
 
-        with open(".gitignore", "w") as f:
-            f.write("*.pyc\n")
+        Path(".gitignore").write_text("*.pyc\n")
 
         checker = CopyrightChecker(self.template_path, use_gitignore=True)
 
@@ -144,11 +177,9 @@ COMPANY = Test Company
 
     def test_copyrightignore_precedence(self):
         """Test .copyrightignore patterns are loaded"""
-        with open(".copyrightignore", "w") as f:
-            f.write("specific_file.py\n")
+        Path(".copyrightignore").write_text("specific_file.py\n")
 
-        with open(".gitignore", "w") as f:
-            f.write("other_file.py\n")
+        Path(".gitignore").write_text("other_file.py\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -158,8 +189,7 @@ COMPANY = Test Company
     def test_custom_ignore_file_path(self):
         """Test using a custom ignore file path"""
         custom_ignore = os.path.join(self.temp_dir, "custom.ignore")
-        with open(custom_ignore, "w") as f:
-            f.write("custom_pattern.py\n")
+        Path(custom_ignore).write_text("custom_pattern.py\n")
 
         checker = CopyrightChecker(self.template_path, ignore_file=custom_ignore)
 
@@ -175,8 +205,7 @@ COMPANY = Test Company
 
     def test_check_files_with_ignored(self):
         """Test check_files skips ignored files"""
-        with open(".copyrightignore", "w") as f:
-            f.write("ignored.py\n")
+        Path(".copyrightignore").write_text("ignored.py\n")
 
         # Create test files
         with open("ignored.py", "w") as f:
@@ -198,8 +227,7 @@ COMPANY = Test Company
 
     def test_glob_star_pattern(self):
         """Test ** glob pattern"""
-        with open(".copyrightignore", "w") as f:
-            f.write("**/build/**\n")
+        Path(".copyrightignore").write_text("**/build/**\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -209,9 +237,7 @@ COMPANY = Test Company
 
     def test_negation_pattern(self):
         """Test negation patterns (!)"""
-        with open(".copyrightignore", "w") as f:
-            f.write("*.log\n")
-            f.write("!important.log\n")
+        Path(".copyrightignore").write_text("*.log\n!important.log\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -222,8 +248,7 @@ COMPANY = Test Company
 
     def test_absolute_path_handling(self):
         """Test handling of absolute paths"""
-        with open(".copyrightignore", "w") as f:
-            f.write("temp/\n")
+        Path(".copyrightignore").write_text("temp/\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -232,8 +257,7 @@ COMPANY = Test Company
 
     def test_windows_path_separators(self):
         """Test Windows path separator handling"""
-        with open(".copyrightignore", "w") as f:
-            f.write("src/generated/\n")
+        Path(".copyrightignore").write_text("src/generated/\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -242,10 +266,7 @@ COMPANY = Test Company
 
     def test_file_extension_patterns(self):
         """Test patterns matching file extensions"""
-        with open(".copyrightignore", "w") as f:
-            f.write("*.min.js\n")
-            f.write("*.min.css\n")
-            f.write("*.map\n")
+        Path(".copyrightignore").write_text("*.min.js\n*.min.css\n*.map\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -255,12 +276,12 @@ COMPANY = Test Company
         self.assertFalse(checker.should_ignore("app.js"))
 
 
-class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
+class TestIgnoreFilesWithoutPathspec(_SharedTempDirTestCase):
     """Test behavior when pathspec is not installed"""
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = self._make_temp_dir()
         self.original_cwd = os.getcwd()
         os.chdir(self.temp_dir)
 
@@ -273,16 +294,13 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures"""
         os.chdir(self.original_cwd)
-        import shutil
-
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
 
-    @unittest.skipIf(HAS_PATHSPEC, "This test requires pathspec to NOT be installed")
+    @pytest.mark.skipif(
+        HAS_PATHSPEC, reason="This test requires pathspec to NOT be installed"
+    )
     def test_graceful_degradation_without_pathspec(self):
         """Test that checker works without pathspec installed"""
-        with open(".copyrightignore", "w") as f:
-            f.write("generated.py\n")
+        Path(".copyrightignore").write_text("generated.py\n")
 
         # Should not raise an error
         checker = CopyrightChecker(self.template_path)
@@ -290,11 +308,10 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
         # Should not ignore anything when pathspec is not available
         self.assertFalse(checker.should_ignore("generated.py"))
 
+    @requires_pathspec
     def test_unicode_filenames_in_ignore_patterns(self):
         """Test ignore patterns with Unicode characters"""
-        with open(".copyrightignore", "w", encoding="utf-8") as f:
-            f.write("日本語.py\n")
-            f.write("файл.py\n")
+        Path(".copyrightignore").write_text("日本語.py\nфайл.py\n", encoding="utf-8")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -302,11 +319,10 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
         self.assertTrue(checker.should_ignore("файл.py"))
         self.assertFalse(checker.should_ignore("regular.py"))
 
+    @requires_pathspec
     def test_patterns_with_spaces(self):
         """Test ignore patterns with spaces in filenames"""
-        with open(".copyrightignore", "w") as f:
-            f.write("my file.py\n")
-            f.write("path with spaces/*.py\n")
+        Path(".copyrightignore").write_text("my file.py\npath with spaces/*.py\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -316,11 +332,10 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
 
     def test_very_long_paths(self):
         """Test ignore patterns with very long paths"""
-        # Create deeply nested directory
-        long_path = "/".join(["dir"] * 50)  # 50 levels deep
+        # Path is only matched as a string; no directories are created
+        long_path = _long_path(50)  # 50 levels deep
 
-        with open(".copyrightignore", "w") as f:
-            f.write(f"{long_path}/*.py\n")
+        Path(".copyrightignore").write_text(f"{long_path}/*.py\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -344,6 +359,7 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
             # If it fails, it should be a handled exception
             self.assertIsInstance(e, (UnicodeDecodeError, ValueError))
 
+    @requires_pathspec
     def test_ignore_with_hierarchical_mode(self):
         """Test ignore patterns combined with hierarchical templates"""
         # Root copyright
@@ -351,8 +367,7 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
             f.write("[.py]\n# Copyright 2026 Root\n")
 
         # Root ignore file
-        with open(".copyrightignore", "w") as f:
-            f.write("vendor/**/*.py\n")
+        Path(".copyrightignore").write_text("vendor/**/*.py\n")
 
         # Create vendor directory with its own copyright
         os.makedirs("vendor")
@@ -367,16 +382,15 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
         # File should be ignored despite hierarchical mode
         self.assertTrue(checker.should_ignore("vendor/lib.py"))
 
+    @requires_pathspec
     def test_gitignore_in_subdirectories(self):
         """Test that only root .gitignore is respected (current behavior)"""
         # Root .gitignore
-        with open(".gitignore", "w") as f:
-            f.write("*.pyc\n")
+        Path(".gitignore").write_text("*.pyc\n")
 
         # Subdirectory .gitignore (should be ignored)
         os.makedirs("subdir")
-        with open("subdir/.gitignore", "w") as f:
-            f.write("*.log\n")
+        Path("subdir/.gitignore").write_text("*.log\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -387,11 +401,10 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
         # Subdirectory patterns should NOT work (only root .gitignore is read)
         self.assertFalse(checker.should_ignore("subdir/test.log"))
 
+    @requires_pathspec
     def test_case_sensitivity_handling(self):
         """Test case sensitivity in ignore patterns"""
-        with open(".copyrightignore", "w") as f:
-            f.write("Test.py\n")
-            f.write("UPPER.PY\n")
+        Path(".copyrightignore").write_text("Test.py\nUPPER.PY\n")
 
         checker = CopyrightChecker(self.template_path)
 
@@ -404,24 +417,20 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
         result = checker.should_ignore("test.py")
         self.assertIsInstance(result, bool)
 
+    @requires_pathspec
     def test_empty_pattern_lines(self):
         """Test that empty lines in ignore file are handled"""
-        with open(".copyrightignore", "w") as f:
-            f.write("test1.py\n")
-            f.write("\n")
-            f.write("\n")
-            f.write("test2.py\n")
-            f.write("\n")
+        Path(".copyrightignore").write_text("test1.py\n\n\ntest2.py\n\n")
 
         checker = CopyrightChecker(self.template_path)
 
         self.assertTrue(checker.should_ignore("test1.py"))
         self.assertTrue(checker.should_ignore("test2.py"))
 
+    @requires_pathspec
     def test_ignore_patterns_with_git_aware(self):
         """Test ignore patterns combined with Git-aware year management"""
-        with open(".copyrightignore", "w") as f:
-            f.write("generated/*.py\n")
+        Path(".copyrightignore").write_text("generated/*.py\n")
 
         with open("copyright.txt", "w") as f:
             f.write("[.py]\n# Copyright {regex:\\d{4}(-\\d{4})?} Company\n")
@@ -436,11 +445,10 @@ class TestIgnoreFilesWithoutPathspec(unittest.TestCase):
         # Ignored files should be skipped
         self.assertTrue(checker.should_ignore("generated/auto.py"))
 
+    @requires_pathspec
     def test_whitespace_in_patterns(self):
         """Test patterns with leading/trailing whitespace"""
-        with open(".copyrightignore", "w") as f:
-            f.write("  test.py  \n")
-            f.write("\tindented.py\n")
+        Path(".copyrightignore").write_text("  test.py  \n\tindented.py\n")
 
         checker = CopyrightChecker(self.template_path)
 
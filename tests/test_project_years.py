@@ -7,158 +7,158 @@
 """Tests for project-wide vs per-file year management."""
 
 import os
-import tempfile
-import unittest
 from unittest.mock import Mock, patch
 
-from scripts.copyright_checker import CopyrightChecker
-
+import pytest
 
-class TestProjectYears(unittest.TestCase):
-    """Test project-wide vs per-file year modes."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
-        self.template_path = os.path.join(self.test_dir, "copyright.txt")
+from scripts.copyright_checker import CopyrightChecker
+from scripts.copyright_template_parser import CopyrightTemplateParser
 
-        # Create a simple template
-        with open(self.template_path, "w") as f:
-            f.write("""[VARIABLES]
+TEMPLATE_BYTES = b"""[VARIABLES]
 YEAR_PATTERN = {regex:\\d{4}(-\\d{4})?}
 
 [.py]
 # Copyright {YEAR_PATTERN} Sony Corporation
-""")
-
-    def test_project_wide_mode_default(self):
-        """Test that project-wide mode is the default."""
-        checker = CopyrightChecker(self.template_path, git_aware=True)
-        self.assertFalse(checker.per_file_years)
-
-    def test_per_file_mode_enabled(self):
-        """Test that per-file mode can be enabled."""
-        checker = CopyrightChecker(
-            self.template_path, git_aware=True, per_file_years=True
-        )
-        self.assertTrue(checker.per_file_years)
-
-    @patch("subprocess.run")
-    def test_project_year_retrieval(self, mock_run):
-        """Test that project creation year is correctly retrieved."""
-        # Mock git log to return project creation date
-        mock_run.return_value = Mock(stdout="2018-03-15T10:30:00+01:00\n", returncode=0)
-
-        checker = CopyrightChecker(
-            self.template_path, git_aware=True, per_file_years=False
-        )
-
-        test_file = os.path.join(self.test_dir, "test.py")
-        year = checker._get_repository_creation_year(test_file)
-
-        self.assertEqual(year, 2018)
-        mock_run.assert_called_once()
-        # Check that it used --max-count=1 for project query
-        call_args = mock_run.call_args[0][0]
-        self.assertIn("--max-count=1", call_args)
-
-    @patch("subprocess.run")
-    def test_file_year_retrieval(self, mock_run):
-        """Test that file creation year is correctly retrieved."""
-        # Mock git log to return file creation date
-        mock_run.return_value = Mock(stdout="2020-06-10T14:20:00+01:00\n", returncode=0)
-
-        checker = CopyrightChecker(
-            self.template_path, git_aware=True, per_file_years=True
-        )
-
-        test_file = os.path.join(self.test_dir, "test.py")
-        year = checker._get_file_creation_year(test_file)
-
-        self.assertEqual(year, 2020)
-        mock_run.assert_called_once()
-        # Check that it used --follow for file tracking
-        call_args = mock_run.call_args[0][0]
-        self.assertIn("--follow", call_args)
-
-    @patch("subprocess.run")
-    def test_project_year_caching(self, mock_run):
-        """Test that project year is cached after first retrieval."""
-        mock_run.return_value = Mock(stdout="2018-03-15T10:30:00+01:00\n", returncode=0)
-
-        checker = CopyrightChecker(
-            self.template_path, git_aware=True, per_file_years=False
-        )
-
-        test_file = os.path.join(self.test_dir, "test.py")
-
-        # First call
-        year1 = checker._get_repository_creation_year(test_file)
-        # Second call (should use cache)
-        year2 = checker._get_repository_creation_year(test_file)
-
-        self.assertEqual(year1, 2018)
-        self.assertEqual(year2, 2018)
-        # Should only call git once due to caching
-        self.assertEqual(mock_run.call_count, 1)
-
-    @patch("subprocess.run")
-    @patch("scripts.copyright_checker.datetime")
-    def test_project_wide_years_new_file(self, mock_datetime, mock_run):
-        """Test that new files get project inception year in project-wide mode."""
-        # Mock current year
-        mock_datetime.now.return_value = Mock(year=2026)
+"""
+
+# Dates returned by the stubbed git log calls
+PROJECT_CREATED = "2018-03-15T10:30:00+01:00\n"
+FILE_CREATED = "2023-06-10T14:20:00+01:00\n"
+
+# Git commands (trailing file path dropped) -> stubbed stdout
+_GIT_OUTPUT = {
+    ("git", "log", "--reverse", "--format=%aI", "--max-count=1"): PROJECT_CREATED,
+    ("git", "log", "--follow", "--format=%aI", "--reverse", "--"): FILE_CREATED,
+    ("git", "status", "--porcelain"): "?? test.py\n",
+}
+
 
-        # Mock project creation year
-        mock_run.return_value = Mock(stdout="2018-03-15T10:30:00+01:00\n", returncode=0)
+def _git_dispatcher(cmd, *args, **kwargs):
+    """Answer git queries from _GIT_OUTPUT; unknown commands fail loudly."""
+    key = tuple(cmd[:-1]) if os.path.isabs(cmd[-1]) else tuple(cmd)
+    return Mock(stdout=_GIT_OUTPUT[key], returncode=0)
 
-        checker = CopyrightChecker(
-            self.template_path, git_aware=True, per_file_years=False
-        )
 
-        test_file = os.path.join(self.test_dir, "test.py")
-        with open(test_file, "w") as f:
-            f.write("# Test file\n")
+@pytest.fixture(scope="module")
+def template(tmp_path_factory):
+    """Write and parse the shared template once per module."""
+    template_path = tmp_path_factory.mktemp("project_years") / "copyright.txt"
+    template_path.write_bytes(TEMPLATE_BYTES)
+    return str(template_path), CopyrightTemplateParser.parse(str(template_path))
 
-        template = checker.templates[".py"]
-        year_str = checker._determine_copyright_year(test_file, template, "")
 
-        # Should use project year (2018) to current year (2026)
-        self.assertEqual(year_str, "2018-2026")
+@pytest.fixture(scope="module")
+def py_template(template):
+    """The parsed .py template, looked up once per module."""
+    return template[1][".py"]
 
-    @patch("subprocess.run")
-    @patch("scripts.copyright_checker.datetime")
-    def test_per_file_years_new_file(self, mock_datetime, mock_run):
-        """Test that new files get file creation year in per-file mode."""
-        # Mock current year
+
+@pytest.fixture(scope="module")
+def _git_stub():
+    """Stub git once for the whole module."""
+    with patch("subprocess.run", autospec=True) as run:
+        run.side_effect = _git_dispatcher
+        yield run
+
+
+@pytest.fixture
+def mock_run(_git_stub):
+    """Git stub with the call history of earlier tests cleared."""
+    _git_stub.reset_mock()
+    return _git_stub
+
+
+@pytest.fixture
+def current_year_2026():
+    """Pin the checker's notion of the current year."""
+    with patch("scripts.copyright_checker.datetime") as mock_datetime:
         mock_datetime.now.return_value = Mock(year=2026)
+        yield
+
+
+def _make_checker(template, **kwargs):
+    """Build a Git-aware checker on the shared, already parsed template."""
+    template_path, templates = template
+    return CopyrightChecker(
+        template_path, git_aware=True, templates=templates, **kwargs
+    )
+
+
+def test_project_wide_mode_default(template, mock_run):
+    """Test that project-wide mode is the default."""
+    checker = _make_checker(template)
+    assert not checker.per_file_years
+
+
+def test_per_file_mode_enabled(template, mock_run):
+    """Test that per-file mode can be enabled."""
+    checker = _make_checker(template, per_file_years=True)
+    assert checker.per_file_years
+
+
+def test_project_year_retrieval(template, mock_run, tmp_path):
+    """Test that project creation year is correctly retrieved."""
+    checker = _make_checker(template, per_file_years=False)
+
+    year = checker._get_repository_creation_year(str(tmp_path / "test.py"))
+
+    assert year == 2018
+    mock_run.assert_called_once()
+    # Check that it used --max-count=1 for project query
+    assert "--max-count=1" in mock_run.call_args[0][0]
+
+
+def test_file_year_retrieval(template, mock_run, tmp_path):
+    """Test that file creation year is correctly retrieved."""
+    checker = _make_checker(template, per_file_years=True)
+
+    year = checker._get_file_creation_year(str(tmp_path / "test.py"))
+
+    assert year == 2023
+    mock_run.assert_called_once()
+    # Check that it used --follow for file tracking
+    assert "--follow" in mock_run.call_args[0][0]
+
+
+def test_project_year_caching(template, mock_run, tmp_path):
+    """Test that project year is cached after first retrieval."""
+    checker = _make_checker(template, per_file_years=False)
+    test_file = str(tmp_path / "test.py")
+
+    # First call
+    year1 = checker._get_repository_creation_year(test_file)
+    # Second call (should use cache)
+    year2 = checker._get_repository_creation_year(test_file)
+
+    assert year1 == 2018
+    assert year2 == 2018
+    # Should only call git once due to caching
+    assert mock_run.call_count == 1
 
-        # Mock file creation year (different from project year)
-        def mock_git_call(*args, **kwargs):
-            cmd = args[0]
-            if "--follow" in cmd:
-                # File creation year
-                return Mock(stdout="2023-06-10T14:20:00+01:00\n", returncode=0)
-            else:
-                # Project creation year
-                return Mock(stdout="2018-03-15T10:30:00+01:00\n", returncode=0)
 
-        mock_run.side_effect = mock_git_call
+def test_project_wide_years_new_file(
+    template, py_template, mock_run, current_year_2026, tmp_path
+):
+    """Test that new files get project inception year in project-wide mode."""
+    checker = _make_checker(template, per_file_years=False)
+    test_file = tmp_path / "test.py"
+    test_file.write_bytes(b"# Test file\n")
 
-        checker = CopyrightChecker(
-            self.template_path, git_aware=True, per_file_years=True
-        )
+    year_str = checker._determine_copyright_year(str(test_file), py_template, "")
 
-        test_file = os.path.join(self.test_dir, "test.py")
-        with open(test_file, "w") as f:
-            f.write("# Test file\n")
+    # Should use project year (2018) to current year (2026)
+    assert year_str == "2018-2026"
 
-        template = checker.templates[".py"]
-        year_str = checker._determine_copyright_year(test_file, template, "")
 
-        # Should use file year (2023) to current year (2026)
-        self.assertEqual(year_str, "2023-2026")
+def test_per_file_years_new_file(
+    template, py_template, mock_run, current_year_2026, tmp_path
+):
+    """Test that new files get file creation year in per-file mode."""
+    checker = _make_checker(template, per_file_years=True)
+    test_file = tmp_path / "test.py"
+    test_file.write_bytes(b"# Test file\n")
 
+    year_str = checker._determine_copyright_year(str(test_file), py_template, "")
 
-if __name__ == "__main__":
-    unittest.main()
+    # Should use file year (2023) to current year (2026)
+    assert year_str == "2023-2026"
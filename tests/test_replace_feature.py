@@ -7,24 +7,19 @@
 """Tests for the --replace feature that intelligently replaces similar copyrights"""
 
 import os
-import tempfile
 import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 import pytest
 
-from scripts.copyright_checker import CopyrightChecker
-
-
-class TestCopyrightReplace(unittest.TestCase):
-    """Test the copyright replacement feature"""
-
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_file = os.path.join(self.temp_dir, "copyright.txt")
+from scripts.copyright_checker import (
+    CopyrightChecker,
+    _normalize_similarity_text,
+    _word_tokens,
+)
 
-        # Create a simple template
-        template_content = """[VARIABLES]
+TEMPLATE_CONTENT = """[VARIABLES]
 COMPANY = Sony Group Corporation
 AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
 
@@ -34,15 +29,26 @@ AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
 # Author: {AUTHOR}
 # License: For licensing see the License.txt file
 """
-        with open(self.template_file, "w", encoding="utf-8") as f:
-            f.write(template_content)
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
 
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+@pytest.fixture(scope="module")
+def shared_template(tmp_path_factory):
+    """Write the copyright template once for the whole module"""
+    template_file = tmp_path_factory.mktemp("replace") / "copyright.txt"
+    template_file.write_text(TEMPLATE_CONTENT, encoding="utf-8")
+    return str(template_file)
+
+
+@pytest.fixture
+def replace_env(request, shared_template, tmp_path):
+    """Give the TestCase classes the shared template and a fresh scratch directory"""
+    request.instance.template_file = shared_template
+    request.instance.temp_dir = str(tmp_path)
+
+
+@pytest.mark.usefixtures("replace_env")
+class TestCopyrightReplace(unittest.TestCase):
+    """Test the copyright replacement feature"""
 
     def test_similarity_calculation(self):
         """Test copyright similarity calculation"""
@@ -88,6 +94,16 @@ AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
         years = checker._extract_years_general(text3)
         self.assertEqual(years, (2022, None))
 
+        # Test year range written with an en dash
+        text4 = "Copyright 2019\u20132023 Sony Group Corporation"
+        years = checker._extract_years_general(text4)
+        self.assertEqual(years, (2019, 2023))
+
+        # Test year directly followed by a non-Latin letter
+        text5 = "Copyright 2020\u5e74 Sony Group Corporation"
+        years = checker._extract_years_general(text5)
+        self.assertEqual(years, (2020, None))
+
     def test_year_range_merging(self):
         """Test intelligent year range merging"""
         checker = CopyrightChecker(
@@ -129,6 +145,17 @@ def my_function():
         self.assertEqual(start_line, 0)
         self.assertEqual(end_line, 1)
 
+    def test_copyright_block_extraction_ignores_body(self):
+        """Test that copyright keywords past the file header are not extracted"""
+        checker = CopyrightChecker(
+            self.template_file, git_aware=False, replace_mode=True
+        )
+        template = checker.templates[".py"]
+
+        content = "x = 1\n" * 5000 + "# Copyright 2025 Sony Group Corporation\n"
+
+        self.assertIsNone(checker._extract_copyright_block(content, template))
+
     def test_replace_similar_copyright(self):
         """Test replacing a similar copyright with template version"""
         checker = CopyrightChecker(
@@ -154,8 +181,7 @@ def test_function():
         self.assertTrue(was_modified)
 
         # Verify the replacement
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         self.assertIn("SPDX-License-Identifier: MIT", new_content)
         self.assertIn("Sony Group Corporation", new_content)
@@ -163,6 +189,106 @@ def test_function():
         # Old license reference should be gone
         self.assertNotIn("OldLicense.txt", new_content)
 
+    def test_replace_extracts_header_once(self):
+        """Test that the block found by check_file is reused for the replacement"""
+        checker = CopyrightChecker(
+            self.template_file, git_aware=False, replace_mode=True
+        )
+        test_file = os.path.join(self.temp_dir, "test_once.py")
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write(
+                "# Copyright (c) 2021-2024 Sony Group Corporation\n"
+                "# Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation\n"
+                "\nx = 1\n"
+            )
+
+        with patch.object(
+            checker,
+            "_extract_copyright_block",
+            wraps=checker._extract_copyright_block,
+        ) as mock_extract:
+            has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+
+        self.assertTrue(has_notice)
+        self.assertTrue(was_modified)
+        self.assertEqual(mock_extract.call_count, 1)
+
+    def test_replace_year_only_keeps_body(self):
+        """Test that a same-size replacement keeps the body and blank line intact"""
+        checker = CopyrightChecker(
+            self.template_file, git_aware=False, replace_mode=True
+        )
+
+        test_file = os.path.join(self.temp_dir, "test_splice.py")
+        header = """# SPDX-License-Identifier: MIT
+# Copyright 2021-2024 Sony Group Corporation
+# Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
+# License: For licensing see the License.txt fi1e
+"""
+        body = "\ndef test_function():\n    return 1\n" * 5000
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write(header + body)
+
+        has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+
+        self.assertTrue(has_notice)
+        self.assertTrue(was_modified)
+        new_content = Path(test_file).read_text(encoding="utf-8")
+        self.assertEqual(
+            new_content,
+            header.replace("2021-2024", "2021-2026").replace("fi1e", "file") + body,
+        )
+
+    def test_identical_content_not_rewritten(self):
+        """Test that writing back unchanged content leaves the file untouched"""
+        checker = CopyrightChecker(
+            self.template_file, git_aware=False, replace_mode=True
+        )
+        test_file = os.path.join(self.temp_dir, "test_same.py")
+        content = "# Copyright 2024 Sony Group Corporation\n\nx = 1\n"
+
+        with patch("builtins.open", side_effect=AssertionError("file was opened")):
+            checker._write_changed_content(test_file, content, content)
+
+        self.assertFalse(os.path.exists(test_file))
+
+    def test_failed_write_keeps_original(self):
+        """Test that a write interrupted before the swap leaves the file intact"""
+        checker = CopyrightChecker(
+            self.template_file, git_aware=False, replace_mode=True
+        )
+        test_file = os.path.join(self.temp_dir, "test_atomic.py")
+        old_content = "# Copyright 2024 Sony Group Corporation\n\nx = 1\n"
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write(old_content)
+        before = set(os.listdir(self.temp_dir))
+
+        with patch("os.replace", side_effect=OSError("No space left on device")):
+            with self.assertRaises(OSError):
+                checker._write_changed_content(
+                    test_file, old_content, old_content.replace("2024", "2026")
+                )
+
+        self.assertEqual(Path(test_file).read_text(encoding="utf-8"), old_content)
+        # The temporary file is cleaned up
+        self.assertEqual(set(os.listdir(self.temp_dir)), before)
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_rewrite_keeps_permissions(self):
+        """Test that replacing the file keeps its mode"""
+        checker = CopyrightChecker(
+            self.template_file, git_aware=False, replace_mode=True
+        )
+        test_file = os.path.join(self.temp_dir, "test_mode.sh")
+        with open(test_file, "w", encoding="utf-8") as f:
+            f.write("x = 1\n")
+        os.chmod(test_file, 0o750)
+
+        checker._write_changed_content(test_file, "x = 1\n", "x = 2\n")
+
+        self.assertEqual(os.stat(test_file).st_mode & 0o777, 0o750)
+        self.assertEqual(Path(test_file).read_text(encoding="utf-8"), "x = 2\n")
+
     def test_no_replace_dissimilar_copyright(self):
         """Test that dissimilar copyrights are not replaced"""
         checker = CopyrightChecker(
@@ -188,8 +314,7 @@ def test_function():
         self.assertTrue(was_modified)
 
         # Verify new copyright was added (not replaced)
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # Old copyright should still be there (below new one)
         self.assertIn("Completely Different Company", new_content)
@@ -220,8 +345,7 @@ if __name__ == "__main__":
         checker.check_file(test_file, auto_fix=True)
 
         # Verify code is preserved
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         self.assertIn("import sys", new_content)
         self.assertIn("def important_function():", new_content)
@@ -258,8 +382,7 @@ def unit_function():
             has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
             # Verify the old unit name is still present
-            with open(test_file, "r", encoding="utf-8") as f:
-                new_content = f.read()
+            new_content = Path(test_file).read_text(encoding="utf-8")
 
             # Extract the unit name from the original copyright
             unit_name = unit_copyright.split("Author:")[1].split(",")[0].strip()
@@ -350,8 +473,7 @@ def test_function():
         self.assertTrue(was_modified)
 
         # Verify the replacement occurred
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # Should have been replaced with standard template
         self.assertIn("SPDX-License-Identifier: MIT", new_content)
@@ -361,34 +483,10 @@ def test_function():
         self.assertEqual(new_content.count("# Copyright"), 1)
 
 
+@pytest.mark.usefixtures("replace_env")
 class TestCopyrightReplacePositive(unittest.TestCase):
     """Positive test cases: scenarios where replacement SHOULD occur"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_file = os.path.join(self.temp_dir, "copyright.txt")
-
-        template_content = """[VARIABLES]
-COMPANY = Sony Group Corporation
-AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
-
-[.py]
-# SPDX-License-Identifier: MIT
-# Copyright {regex:\\d{4}(-\\d{4})?} {COMPANY}
-# Author: {AUTHOR}
-# License: For licensing see the License.txt file
-"""
-        with open(self.template_file, "w", encoding="utf-8") as f:
-            f.write(template_content)
-
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_replace_same_unit_abbreviation_variation(self):
         """Test replacement when same unit uses abbreviation variation"""
         checker = CopyrightChecker(
@@ -413,8 +511,7 @@ def test():
             "Same unit with abbreviation variation should trigger modification",
         )
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # The similarity might not be high enough to replace, but should at least modify
         # Just check that year 2026 is present (either merged or in new copyright)
@@ -441,8 +538,7 @@ def test():
 
         self.assertTrue(was_modified)
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         self.assertNotIn("OldLicense.md", new_content)
         self.assertIn("License.txt", new_content)
@@ -471,34 +567,10 @@ def test():
         )
 
 
+@pytest.mark.usefixtures("replace_env")
 class TestCopyrightReplaceNegative(unittest.TestCase):
     """Negative test cases: scenarios where replacement should NOT occur"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_file = os.path.join(self.temp_dir, "copyright.txt")
-
-        template_content = """[VARIABLES]
-COMPANY = Sony Group Corporation
-AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
-
-[.py]
-# SPDX-License-Identifier: MIT
-# Copyright {regex:\\d{4}(-\\d{4})?} {COMPANY}
-# Author: {AUTHOR}
-# License: For licensing see the License.txt file
-"""
-        with open(self.template_file, "w", encoding="utf-8") as f:
-            f.write(template_content)
-
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_no_replace_completely_different_company(self):
         """Test no replacement for completely different company"""
         checker = CopyrightChecker(
@@ -518,8 +590,7 @@ def test():
 
         has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # Should preserve original Microsoft copyright
         self.assertIn("Microsoft Corporation", new_content)
@@ -549,8 +620,7 @@ def test():
 
             has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
-            with open(test_file, "r", encoding="utf-8") as f:
-                new_content = f.read()
+            new_content = Path(test_file).read_text(encoding="utf-8")
 
             # Original division should be preserved
             self.assertIn(division.split(",")[0], new_content)
@@ -573,8 +643,7 @@ def test():
 
         has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # Without author field, similarity should be low, so new copyright added
         # but original should be preserved
@@ -582,34 +651,10 @@ def test():
         self.assertGreaterEqual(copyright_count, 1)
 
 
+@pytest.mark.usefixtures("replace_env")
 class TestCopyrightReplaceEdgeCases(unittest.TestCase):
     """Edge case tests for unusual scenarios"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_file = os.path.join(self.temp_dir, "copyright.txt")
-
-        template_content = """[VARIABLES]
-COMPANY = Sony Group Corporation
-AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
-
-[.py]
-# SPDX-License-Identifier: MIT
-# Copyright {regex:\\d{4}(-\\d{4})?} {COMPANY}
-# Author: {AUTHOR}
-# License: For licensing see the License.txt file
-"""
-        with open(self.template_file, "w", encoding="utf-8") as f:
-            f.write(template_content)
-
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_copyright_with_unicode_characters(self):
         """Test replacement with unicode characters in author name"""
         checker = CopyrightChecker(
@@ -658,8 +703,7 @@ def test():
 
         has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # Should handle long blocks
         self.assertIn("def test():", new_content, "Code should be preserved")
@@ -700,8 +744,7 @@ def test():
 
         self.assertTrue(was_modified, "Empty file should get copyright added")
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         self.assertIn("Copyright", new_content)
 
@@ -748,8 +791,7 @@ def test():
 
         has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         self.assertIn("import sys", new_content, "Code should be preserved")
 
@@ -772,41 +814,16 @@ def test():
 
         has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
 
-        with open(test_file, "r", encoding="utf-8") as f:
-            new_content = f.read()
+        new_content = Path(test_file).read_text(encoding="utf-8")
 
         # Should handle gracefully, might or might not modify
         self.assertIn("2026", new_content)
 
 
+@pytest.mark.usefixtures("replace_env")
 class TestCopyrightReplaceStress(unittest.TestCase):
     """Stress tests for performance and robustness"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.template_file = os.path.join(self.temp_dir, "copyright.txt")
-
-        template_content = """[VARIABLES]
-COMPANY = Sony Group Corporation
-AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
-
-[.py]
-# SPDX-License-Identifier: MIT
-# Copyright {regex:\\d{4}(-\\d{4})?} {COMPANY}
-# Author: {AUTHOR}
-# License: For licensing see the License.txt file
-"""
-        with open(self.template_file, "w", encoding="utf-8") as f:
-            f.write(template_content)
-
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
     def test_large_file_with_copyright(self):
         """Test replacement in a very large file"""
         checker = CopyrightChecker(
@@ -827,8 +844,6 @@ AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
         with open(test_file, "w", encoding="utf-8") as f:
             f.write(old_content)
 
-        import time
-
         start_time = time.time()
         has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
         elapsed = time.time() - start_time
@@ -845,20 +860,27 @@ AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
 
         # Create 50 test files
         test_files = []
-        for i in range(50):
-            test_file = os.path.join(self.temp_dir, f"test_{i}.py")
-            old_content = f"""# Copyright {2020 + (i % 5)} Sony Group Corporation
+        base = self.temp_dir + os.sep
+        old_content = b"""# Copyright %d Sony Group Corporation
 # Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
 
-def test_{i}():
+def test_%d():
     pass
 """
-            with open(test_file, "w", encoding="utf-8") as f:
-                f.write(old_content)
+        for i in range(50):
+            test_file = f"{base}test_{i}.py"
+            # One unbuffered write per file (O_BINARY keeps LF on Windows)
+            fd = os.open(
+                test_file,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                0o644,
+            )
+            try:
+                os.write(fd, old_content % (2020 + (i % 5), i))
+            finally:
+                os.close(fd)
             test_files.append(test_file)
 
-        import time
-
         start_time = time.time()
         passed, failed, modified = checker.check_files(test_files, auto_fix=True)
         elapsed = time.time() - start_time
@@ -886,8 +908,6 @@ def test_{i}():
             + ("Different line\n" * 20)
         )
 
-        import time
-
         start_time = time.time()
 
         # Calculate similarity just 5 times to avoid hanging
@@ -928,33 +948,28 @@ Copyright years: 2020-2024
 
 
 @pytest.fixture
-def temp_dir_pytest():
-    """Create a temporary directory for pytest test files"""
-    temp_d = tempfile.mkdtemp()
-    yield temp_d
-    import shutil
-
-    if os.path.exists(temp_d):
-        shutil.rmtree(temp_d)
+def temp_dir_pytest(tmp_path):
+    """Scratch directory for pytest test files"""
+    return str(tmp_path)
 
 
 @pytest.fixture
-def template_file_pytest(temp_dir_pytest):
-    """Create a standard copyright template for pytest"""
-    template_path = os.path.join(temp_dir_pytest, "copyright.txt")
-    template_content = """[VARIABLES]
-COMPANY = Sony Group Corporation
-AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
+def template_file_pytest(shared_template):
+    """The standard copyright template for pytest"""
+    return shared_template
 
-[.py]
-# SPDX-License-Identifier: MIT
-# Copyright {regex:\\d{4}(-\\d{4})?} {COMPANY}
-# Author: {AUTHOR}
-# License: For licensing see the License.txt file
-"""
-    with open(template_path, "w", encoding="utf-8") as f:
-        f.write(template_content)
-    return template_path
+
+@pytest.fixture(scope="module")
+def _shared_checker(shared_template):
+    """Build the replace-mode checker once for the whole module"""
+    return CopyrightChecker(shared_template, git_aware=False, replace_mode=True)
+
+
+@pytest.fixture
+def checker_pytest(_shared_checker):
+    """The shared replace-mode checker with the memo caches of earlier tests cleared"""
+    _shared_checker.reset_state()
+    return _shared_checker
 
 
 # POSITIVE TESTS - Parametrized
@@ -971,11 +986,9 @@ AUTHOR = R&D Center Europe Brussels Laboratory, Sony Group Corporation
     ],
 )
 def test_replace_same_unit_variations_parametrized(
-    temp_dir_pytest, template_file_pytest, old_author, expected_match
+    temp_dir_pytest, checker_pytest, old_author, expected_match
 ):
     """Test replacement with various acceptable variations of the same unit"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
     old_content = f"""# Copyright 2022 Sony Group Corporation
 # Author: {old_author}
@@ -986,10 +999,9 @@ def test():
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
-    with open(test_file, "r", encoding="utf-8") as f:
-        new_content = f.read()
+    new_content = Path(test_file).read_text(encoding="utf-8")
 
     if expected_match:
         assert was_modified, (
@@ -1010,11 +1022,9 @@ def test():
     ],
 )
 def test_replace_year_range_merging_parametrized(
-    temp_dir_pytest, template_file_pytest, old_years, expected_merged
+    temp_dir_pytest, checker_pytest, old_years, expected_merged
 ):
     """Test year range merging with various starting years"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
     old_content = f"""# Copyright {old_years} Sony Group Corporation
 # Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
@@ -1025,12 +1035,11 @@ def test():
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
     assert was_modified, f"Copyright with year '{old_years}' should be updated"
 
-    with open(test_file, "r", encoding="utf-8") as f:
-        new_content = f.read()
+    new_content = Path(test_file).read_text(encoding="utf-8")
 
     assert expected_merged in new_content, f"Expected year range {expected_merged}"
 
@@ -1044,11 +1053,9 @@ def test():
     ],
 )
 def test_replace_outdated_license_references_parametrized(
-    temp_dir_pytest, template_file_pytest, old_license
+    temp_dir_pytest, checker_pytest, old_license
 ):
     """Test replacement of various outdated license references"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
     old_content = f"""# Copyright 2022 Sony Group Corporation
 # Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
@@ -1060,10 +1067,9 @@ def test():
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
-    with open(test_file, "r", encoding="utf-8") as f:
-        new_content = f.read()
+    new_content = Path(test_file).read_text(encoding="utf-8")
 
     assert "License.txt" in new_content, "Should have updated license reference"
 
@@ -1080,11 +1086,9 @@ def test():
     ],
 )
 def test_no_replace_different_companies_parametrized(
-    temp_dir_pytest, template_file_pytest, company, author
+    temp_dir_pytest, checker_pytest, company, author
 ):
     """Test no replacement for completely different companies"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
     old_content = f"""# Copyright 2023 {company}
 # Author: {author}
@@ -1095,10 +1099,9 @@ def test():
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
-    with open(test_file, "r", encoding="utf-8") as f:
-        new_content = f.read()
+    new_content = Path(test_file).read_text(encoding="utf-8")
 
     # Original company should be preserved
     assert company in new_content, f"Original {company} should be preserved"
@@ -1120,11 +1123,9 @@ def test():
     ],
 )
 def test_no_replace_different_sony_units_parametrized(
-    temp_dir_pytest, template_file_pytest, sony_unit
+    temp_dir_pytest, checker_pytest, sony_unit
 ):
     """Test no replacement across different Sony organizational units"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, f"test_{sony_unit[:10]}.py")
     old_content = f"""# Copyright 2023 Sony Group Corporation
 # Author: {sony_unit}
@@ -1135,10 +1136,9 @@ def test():
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
-    with open(test_file, "r", encoding="utf-8") as f:
-        new_content = f.read()
+    new_content = Path(test_file).read_text(encoding="utf-8")
 
     # Original unit identifier should be preserved in the content
     unit_identifier = sony_unit.split(",")[0].strip()
@@ -1147,6 +1147,35 @@ def test():
     )
 
 
+def test_different_unit_skips_similarity_scoring(
+    temp_dir_pytest, checker_pytest, monkeypatch
+):
+    """Test that a different business unit is ruled out before similarity scoring"""
+
+    def fail_similarity(*args):
+        raise AssertionError("similarity should not be computed")
+
+    monkeypatch.setattr(
+        checker_pytest, "_calculate_copyright_similarity", fail_similarity
+    )
+
+    test_file = os.path.join(temp_dir_pytest, "test_haptic.py")
+    with open(test_file, "w", encoding="utf-8") as f:
+        f.write(
+            "# Copyright 2023 Sony Group Corporation\n"
+            "# Author: Haptic Europe, Brussels Laboratory, Sony Group Corporation\n"
+            "\ndef test():\n    pass\n"
+        )
+
+    assert checker_pytest.check_file(test_file, auto_fix=True) == (True, True)
+
+    new_content = Path(test_file).read_text(encoding="utf-8")
+
+    # Our notice is added and the other unit's notice is kept
+    assert "Haptic Europe" in new_content
+    assert "R&D Center Europe" in new_content
+
+
 # EDGE CASE TESTS - Parametrized
 @pytest.mark.parametrize(
     "special_char_name",
@@ -1160,11 +1189,9 @@ def test():
     ],
 )
 def test_copyright_with_unicode_author_names_parametrized(
-    temp_dir_pytest, template_file_pytest, special_char_name
+    temp_dir_pytest, checker_pytest, special_char_name
 ):
     """Test replacement with various unicode characters in author names"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
     old_content = f"""# Copyright 2023 Sony Group Corporation
 # Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
@@ -1178,7 +1205,7 @@ def test():
 
     # Should handle unicode without crashing
     try:
-        has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+        has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
         assert True, "Should handle unicode characters"
     except Exception as e:
         pytest.fail(f"Failed with unicode character: {e}")
@@ -1194,11 +1221,9 @@ def test():
     ],
 )
 def test_copyright_with_various_whitespace_parametrized(
-    temp_dir_pytest, template_file_pytest, whitespace_pattern
+    temp_dir_pytest, checker_pytest, whitespace_pattern
 ):
     """Test replacement with various whitespace patterns"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
     old_content = f"""{whitespace_pattern}
 # Author: R&D Center Europe Brussels Laboratory, Sony Group Corporation
@@ -1209,7 +1234,7 @@ def test():
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
     # Should handle various whitespace patterns
     assert True, "Should handle whitespace variations"
@@ -1225,11 +1250,9 @@ def test():
     ],
 )
 def test_various_copyright_block_lengths_parametrized(
-    temp_dir_pytest, template_file_pytest, copyright_lines
+    temp_dir_pytest, checker_pytest, copyright_lines
 ):
     """Test replacement with various copyright block lengths"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, "test.py")
 
     copyright_block = [
@@ -1245,10 +1268,9 @@ def test_various_copyright_block_lengths_parametrized(
     with open(test_file, "w", encoding="utf-8") as f:
         f.write(old_content)
 
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
 
-    with open(test_file, "r", encoding="utf-8") as f:
-        new_content = f.read()
+    new_content = Path(test_file).read_text(encoding="utf-8")
 
     # Code should be preserved
     assert "def test():" in new_content, "Code should be preserved"
@@ -1309,11 +1331,9 @@ void test() {{}}
     ],
 )
 def test_large_file_performance_parametrized(
-    temp_dir_pytest, template_file_pytest, file_lines
+    temp_dir_pytest, checker_pytest, file_lines
 ):
     """Test replacement performance with various file sizes"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     test_file = os.path.join(temp_dir_pytest, f"large_test_{file_lines}.py")
 
     # Create a large file
@@ -1329,7 +1349,7 @@ def test_large_file_performance_parametrized(
         f.write(old_content)
 
     start_time = time.time()
-    has_notice, was_modified = checker.check_file(test_file, auto_fix=True)
+    has_notice, was_modified = checker_pytest.check_file(test_file, auto_fix=True)
     elapsed = time.time() - start_time
 
     # Performance expectations based on file size
@@ -1349,11 +1369,9 @@ def test_large_file_performance_parametrized(
     ],
 )
 def test_batch_processing_performance_parametrized(
-    temp_dir_pytest, template_file_pytest, num_files
+    temp_dir_pytest, checker_pytest, num_files
 ):
     """Test batch processing performance with various numbers of files"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     # Create multiple test files
     test_files = []
     for i in range(num_files):
@@ -1369,7 +1387,7 @@ def test_{i}():
         test_files.append(test_file)
 
     start_time = time.time()
-    passed, failed, modified = checker.check_files(test_files, auto_fix=True)
+    passed, failed, modified = checker_pytest.check_files(test_files, auto_fix=True)
     elapsed = time.time() - start_time
 
     # Performance expectations
@@ -1389,12 +1407,8 @@ def test_{i}():
         50,  # Medium
     ],
 )
-def test_similarity_calculation_performance_parametrized(
-    template_file_pytest, text_length
-):
+def test_similarity_calculation_performance_parametrized(checker_pytest, text_length):
     """Test similarity calculation performance with various text lengths"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     # Create copyright texts
     long_text1 = (
         "Copyright Sony Group Corporation\nAuthor: R&D Center Europe Brussels Laboratory\n"
@@ -1410,7 +1424,9 @@ def test_similarity_calculation_performance_parametrized(
     # Calculate similarity just a few times
     iterations = 5
     for _ in range(iterations):
-        similarity = checker._calculate_copyright_similarity(long_text1, long_text2)
+        similarity = checker_pytest._calculate_copyright_similarity(
+            long_text1, long_text2
+        )
         assert similarity is not None, "Similarity should return a value"
 
     elapsed = time.time() - start_time
@@ -1433,15 +1449,13 @@ def test_similarity_calculation_performance_parametrized(
     ],
 )
 def test_complex_year_extraction_parametrized(
-    temp_dir_pytest, template_file_pytest, year_pattern
+    temp_dir_pytest, checker_pytest, year_pattern
 ):
     """Test year extraction with various complex year patterns"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     complex_text = f"""{year_pattern} Group Corporation
 Author: R&D Center Europe Brussels Laboratory
 """
-    years = checker._extract_years_general(complex_text)
+    years = checker_pytest._extract_years_general(complex_text)
 
     # Should extract valid years without crashing
     assert years is not None, "Should extract years from pattern"
@@ -1478,16 +1492,14 @@ Author: R&D Center Europe Brussels Laboratory
     ],
 )
 def test_entity_extraction_accuracy_parametrized(
-    template_file_pytest, author_line, expected_entity
+    checker_pytest, author_line, expected_entity
 ):
     """Test accurate entity extraction from various author formats"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     copyright_text = f"""Copyright 2023 Sony Group Corporation
 {author_line}
 """
 
-    entity = checker._extract_author_entity(copyright_text)
+    entity = checker_pytest._extract_author_entity(copyright_text)
 
     assert entity is not None, f"Should extract entity from '{author_line}'"
     assert entity == expected_entity, f"Expected '{expected_entity}', got '{entity}'"
@@ -1507,27 +1519,172 @@ def test_entity_extraction_accuracy_parametrized(
         ("Sony Group Corporation", "Sony Group Corp", 0.6),  # Adjusted expectation
     ],
 )
-def test_similarity_metrics_parametrized(
-    template_file_pytest, text1, text2, min_similarity
-):
+def test_similarity_metrics_parametrized(checker_pytest, text1, text2, min_similarity):
     """Test similarity calculation between related texts"""
-    checker = CopyrightChecker(template_file_pytest, git_aware=False, replace_mode=True)
-
     # Test n-gram similarity (most reliable for variations)
-    ngram_sim = checker._calculate_ngram_similarity(text1, text2)
+    ngram_sim = checker_pytest._calculate_ngram_similarity(text1, text2)
     assert ngram_sim >= min_similarity, (
         f"N-gram similarity too low: {ngram_sim} (expected >= {min_similarity})"
     )
 
     # Test sequence similarity
-    seq_sim = checker._calculate_sequence_similarity(text1, text2)
+    seq_sim = checker_pytest._calculate_sequence_similarity(text1, text2)
     assert seq_sim >= min_similarity - 0.1, f"Sequence similarity too low: {seq_sim}"
 
     # Token similarity can be much lower for short texts with different words
     # Just verify it returns a valid value
-    token_sim = checker._calculate_token_similarity(text1, text2)
+    token_sim = checker_pytest._calculate_token_similarity(text1, text2)
     assert 0.0 <= token_sim <= 1.0, f"Token similarity out of range: {token_sim}"
 
 
+def test_jaccard_metrics_exact_values(checker_pytest):
+    """Test the exact Jaccard scores of the token and n-gram metrics"""
+    # {a, b, c} vs {b, c, d}: 2 shared out of 4
+    assert checker_pytest._calculate_token_similarity("a b c", "b c d") == 0.5
+    # {abc, bcd} vs {bcd, cde}: 1 shared out of 3
+    assert checker_pytest._calculate_ngram_similarity("abcd", "bcde") == 1 / 3
+    assert checker_pytest._calculate_ngram_similarity("ab", "ab") == 1.0
+    # Identical texts are decided before any set work
+    assert checker_pytest._calculate_ngram_similarity("", "") == 1.0
+    assert checker_pytest._calculate_token_similarity("a b", "a b") == 1.0
+    assert checker_pytest._calculate_token_similarity("  ", "  ") == 0.0
+
+
+def test_word_tokens_interned():
+    """Test that tokens from different texts share one string object"""
+    first = _word_tokens("".join(["sony", " group"]))
+    second = _word_tokens("".join(["so", "ny corp"]))
+
+    (shared,) = first & second
+    assert next(t for t in first if t == "sony") is shared
+    assert next(t for t in second if t == "sony") is shared
+
+
+@pytest.mark.parametrize("has_rapidfuzz", [True, False])
+@pytest.mark.parametrize(
+    "text1,text2,expected",
+    [
+        ("abcde", "ace", 3 / 5),
+        ("sony group corporation", "sony group corporation", 1.0),
+        ("kitten", "sitting", 4 / 7),
+        ("abc", "", 0.0),
+    ],
+)
+def test_sequence_similarity_backends_agree(
+    checker_pytest, monkeypatch, has_rapidfuzz, text1, text2, expected
+):
+    """Test that the RapidFuzz and pure-Python LCS give the same score"""
+    if has_rapidfuzz:
+        pytest.importorskip("rapidfuzz")
+    monkeypatch.setattr("scripts.copyright_checker.HAS_RAPIDFUZZ", has_rapidfuzz)
+    assert checker_pytest._calculate_sequence_similarity(text1, text2) == pytest.approx(
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    "existing",
+    [
+        "# Copyright 2021 Sony Group Corporation\n# Author: R&D Center Europe Brussels Laboratory",
+        "# Copyright 2021 Sony Group Corp.\n# Author: R&D Center Europe",
+        "# Copyright 2024 Microsoft Corporation\n# All rights reserved",
+        "# (c) Someone Else",
+    ],
+)
+def test_similarity_threshold_keeps_decision(checker_pytest, existing):
+    """Test that the threshold shortcut never changes the replace decision"""
+    template_text = checker_pytest.templates[".py"].get_notice_with_year("YEAR")
+
+    full = checker_pytest._calculate_copyright_similarity(existing, template_text)
+    bounded = checker_pytest._calculate_copyright_similarity(
+        existing, template_text, threshold=0.4
+    )
+
+    assert (bounded >= 0.4) == (full >= 0.4)
+    assert bounded <= full
+
+
+def test_identical_notices_skip_similarity_metrics(checker_pytest):
+    """Test that notices differing only in years score 1.0 without scoring"""
+    template_text = checker_pytest.templates[".py"].get_notice_with_year("2026")
+    existing = checker_pytest.templates[".py"].get_notice_with_year("2019-2021")
+
+    with (
+        patch.object(
+            checker_pytest, "_calculate_sequence_similarity", side_effect=AssertionError
+        ),
+        patch.object(
+            checker_pytest, "_calculate_ngram_similarity", side_effect=AssertionError
+        ),
+    ):
+        assert (
+            checker_pytest._calculate_copyright_similarity(existing, template_text)
+            == 1.0
+        )
+    assert checker_pytest._calculate_sequence_similarity("same", "same") == 1.0
+    assert checker_pytest._calculate_sequence_similarity("", "") == 0.0
+
+
+def test_template_side_features_computed_once(checker_pytest):
+    """Test that scoring many notices normalizes the template text only once"""
+    template_text = checker_pytest.templates[".py"].get_notice_with_year("YEAR")
+    checker_pytest._calculate_copyright_similarity(
+        "# Copyright 2020 Warmup", template_text
+    )
+
+    misses = _normalize_similarity_text.cache_info().misses
+    for i in range(5):
+        checker_pytest._calculate_copyright_similarity(
+            f"# Copyright 2020 Sony Group Corporation {i}", template_text
+        )
+
+    # One normalization per existing notice, none for the template
+    assert _normalize_similarity_text.cache_info().misses - misses == 5
+
+
+def test_similarity_scores_memoized(checker_pytest):
+    """Test that a repeated pair of notices is scored once"""
+    template_text = checker_pytest.templates[".py"].get_notice_with_year("YEAR")
+    existing = "# Copyright 2020 Sony Group Corporation\n# Author: Someone"
+
+    with patch.object(
+        checker_pytest,
+        "_compute_copyright_similarity",
+        wraps=checker_pytest._compute_copyright_similarity,
+    ) as compute:
+        scores = {
+            checker_pytest._calculate_copyright_similarity(existing, template_text)
+            for _ in range(3)
+        }
+        checker_pytest._calculate_copyright_similarity(
+            existing, template_text, threshold=0.4
+        )
+
+    assert len(scores) == 1
+    # The thresholded score may be a bound, so it is cached separately
+    assert compute.call_count == 2
+
+
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n"])
+def test_replace_normalizes_body_line_endings(
+    checker_pytest, temp_dir_pytest, line_ending
+):
+    """Test that the carried-over body gets the file's line ending style"""
+    template = checker_pytest.templates[".py"]
+    notice = template.get_notice_with_year("2020").replace("\n", "\r\n")
+    content = notice + "\r\n\r\na = 1\r\nb = 2\nc = 3\r\n"
+    test_file = os.path.join(temp_dir_pytest, "mixed.py")
+
+    with patch.object(checker_pytest, "_write_changed_content") as write:
+        assert checker_pytest._replace_copyright_notice(
+            test_file, template, content, line_ending
+        )
+
+    new_content = write.call_args.args[2]
+    body = "a = 1\nb = 2\nc = 3\n".replace("\n", line_ending)
+    assert new_content.endswith(line_ending * 2 + body)
+    assert new_content.count("\n") == new_content.count(line_ending)
+
+
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__, "-v"])
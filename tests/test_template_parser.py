@@ -5,10 +5,27 @@
 
 """Unit tests for copyright template parser"""
 
+import dataclasses
+import functools
+import importlib.util
+import io
+import pickle
 import pytest
-import tempfile
-import os
-from scripts.copyright_template_parser import CopyrightTemplateParser, CopyrightTemplate
+from unittest.mock import patch
+from scripts.copyright_template_parser import (
+    CopyrightTemplate,
+    CopyrightTemplateParser,
+    _lines_from,
+    _placeholder_span,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_template(extension, *lines):
+    """Build a template without compiled patterns, once per distinct set of lines"""
+    return CopyrightTemplate(
+        extension=extension, lines=lines, regex_patterns=(None,) * len(lines)
+    )
 
 
 # ============================================================================
@@ -16,211 +33,411 @@ from scripts.copyright_template_parser import CopyrightTemplateParser, Copyright
 # ============================================================================
 
 
-def test_parse_simple_template():
+def test_parse_simple_template(parse_template):
     """Test parsing a simple copyright template"""
     content = """[.py]
 # Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation
 # Author: Test Author
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-
-        assert ".py" in templates
-        template = templates[".py"]
-        assert template.extension == ".py"
-        assert len(template.lines) == 2
-        assert "Copyright" in template.lines[0]
-        assert "Author" in template.lines[1]
-    finally:
-        os.unlink(temp_path)
-
+    templates = parse_template(content)
 
-def test_parse_multiple_sections():
-    """Test parsing template with multiple sections"""
-    content = """[.py]
-# Copyright {regex:\\d{4}} sny
+    assert ".py" in templates
+    template = templates[".py"]
+    assert template.extension == ".py"
+    assert len(template.lines) == 2
+    assert "Copyright" in template.lines[0]
+    assert "Author" in template.lines[1]
 
-[.sql]
--- Copyright {regex:\\d{4}} sny
-"""
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-
-        assert len(templates) == 2
-        assert ".py" in templates
-        assert ".sql" in templates
-    finally:
-        os.unlink(temp_path)
-
-
-def test_parse_template_with_nested_braces():
+def test_parse_template_with_nested_braces(parse_template):
     """Test parsing template with nested braces in regex pattern"""
     content = """[.py]
 # Copyright {regex:\\d{4}(-\\d{4})?} sny Corporation
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
+    template = templates[".py"]
+
+    # Verify the regex pattern was correctly extracted
+    assert template.regex_patterns[0] is not None
+    assert template.regex_patterns[0].pattern == r"\d{4}(-\d{4})?"
+
+
+# (test id, template text, file content, expected match)
+MATCH_CASES = [
+    (
+        "single_year",
+        "# Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation\n# Author: Test Author",
+        "# Copyright 2026 SNY Group Corporation\n# Author: Test Author\n\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "year_range",
+        "# Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation\n# Author: Test Author",
+        "# Copyright 2020-2026 SNY Group Corporation\n# Author: Test Author\n\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "without_regex",
+        "Copyright Notice\nAll rights reserved",
+        "Copyright Notice\nAll rights reserved\n\nSome text content\n",
+        True,
+    ),
+    (
+        "without_regex_mismatch",
+        "Copyright Notice\nAll rights reserved",
+        "Copyright Notice\nSome other text\n",
+        False,
+    ),
+    (
+        "at_beginning",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright 2026 sny\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "after_shebang",
+        "# Copyright {regex:\\d{4}} sny",
+        "#!/usr/bin/env python\n# Copyright 2026 sny\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "different_company",
+        "# Copyright {regex:\\d{4}} sny Corporation",
+        "# Copyright 2026 Microsoft Corporation\ndef main():\n    pass\n",
+        False,
+    ),
+    (
+        "missing_notice",
+        "# Copyright {regex:\\d{4}} sny Corporation",
+        "def main():\n    pass\n",
+        False,
+    ),
+    (
+        "three_digit_year",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright 202 sny\ndef main():\n    pass\n",
+        False,
+    ),
+    (
+        "no_year",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright sny\ndef main():\n    pass\n",
+        False,
+    ),
+    (
+        "incomplete_lines",
+        "# Copyright {regex:\\d{4}} sny\n# Author: Test Author\n# License: MIT",
+        "# Copyright 2026 sny\ndef main():\n    pass\n",
+        False,
+    ),
+    (
+        "trailing_tab",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright 2026 sny\t\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "single_line_no_newline",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright 2026 sny",
+        True,
+    ),
+    (
+        "literal_parentheses",
+        "# Copyright {regex:\\d{4}} sny (R&D)",
+        "# Copyright 2026 sny (R&D)\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "missing_parentheses",
+        "# Copyright {regex:\\d{4}} sny (R&D)",
+        "# Copyright 2026 sny R&D\ndef main():\n    pass\n",
+        False,
+    ),
+    (
+        "very_long_line",
+        "# Copyright {regex:\\d{4}} sny - " + "A" * 500,
+        "# Copyright 2026 sny - " + "A" * 500 + "\ndef main():\n    pass\n",
+        True,
+    ),
+    (
+        "lf_line_endings",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright 2026 sny\ndef main():\n    pass",
+        True,
+    ),
+    (
+        "crlf_line_endings",
+        "# Copyright {regex:\\d{4}} sny",
+        "# Copyright 2026 sny\r\ndef main():\r\n    pass",
+        True,
+    ),
+    ("empty_content", "# Copyright 2026", "", False),
+    (
+        "content_shorter_than_template",
+        "# Copyright 2026\n# Author: Test\n# License: MIT",
+        "# Copyright 2026\n# Author: Test\n",
+        False,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "template_text,file_content,expected",
+    [case[1:] for case in MATCH_CASES],
+    ids=[case[0] for case in MATCH_CASES],
+)
+def test_template_matches(parse_template, template_text, file_content, expected):
+    """Test matching file content against a parsed template"""
+    template = parse_template(f"[.py]\n{template_text}\n")[".py"]
+
+    assert template.matches(file_content) is expected
+
+
+@pytest.mark.parametrize(
+    "content,extensions",
+    [
+        (
+            "[.py]\n# Copyright {regex:\\d{4}} sny\n\n[.sql]\n-- Copyright {regex:\\d{4}} sny\n",
+            {".py", ".sql"},
+        ),
+        (
+            "[.py]\n# Python copyright\n\n[.js]\n// JavaScript copyright\n\n"
+            "[.cpp]\n// C++ copyright\n\n[.html]\n<!-- HTML copyright -->\n",
+            {".py", ".js", ".cpp", ".html"},
+        ),
+    ],
+    ids=["multiple_sections", "multiple_extensions"],
+)
+def test_parse_sections(parse_template, content, extensions):
+    """Test that every section header yields a template for its extension"""
+    assert parse_template(content).keys() == extensions
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
 
-        # Verify the regex pattern was correctly extracted
-        assert template.regex_patterns[0] is not None
-        assert template.regex_patterns[0].pattern == r"\d{4}(-\d{4})?"
-    finally:
-        os.unlink(temp_path)
-
-
-def test_parse_template_with_multiple_extensions():
-    """Test parsing template with various file extensions"""
-    content = """[.py]
-# Python copyright
-
-[.js]
-// JavaScript copyright
-
-[.cpp]
-// C++ copyright
-
-[.html]
-<!-- HTML copyright -->
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-
-        assert len(templates) == 4
-        assert ".py" in templates
-        assert ".js" in templates
-        assert ".cpp" in templates
-        assert ".html" in templates
-    finally:
-        os.unlink(temp_path)
-
-
-def test_template_matches_with_regex():
-    """Test template matching with regex patterns"""
-    content = """[.py]
-# Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation
-# Author: Test Author
-"""
+def test_get_notice_with_year():
+    """Test generating notice with specific year"""
+    template = _make_template(".py", "# Copyright {regex:\\d{4}} sny", "# Author: Test")
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    notice = template.get_notice_with_year(2026)
+    assert "2026" in notice
+    assert "Author: Test" in notice
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
 
-        # Test with single year
-        file_content = """# Copyright 2026 SNY Group Corporation
-# Author: Test Author
+def test_get_notice_with_year_placeholder_per_line():
+    """Test that each line's placeholder is filled and unmatched braces are kept"""
+    template = _make_template(
+        ".py",
+        "# Copyright {regex:\\d{4}} sny",
+        "",
+        "# Since {regex:\\d{4}}, see LICENSE",
+        "# Broken {regex:\\d{4}",
+    )
 
-def main():
-    pass
-"""
-        assert template.matches(file_content) is True
+    assert template.get_notice_with_year("2020-2026") == (
+        "# Copyright 2020-2026 sny\n\n# Since 2020-2026, see LICENSE\n"
+        "# Broken {regex:\\d{4}"
+    )
 
-        # Test with year range
-        file_content2 = """# Copyright 2020-2026 SNY Group Corporation
-# Author: Test Author
 
-def main():
-    pass
-"""
-        assert template.matches(file_content2) is True
-    finally:
-        os.unlink(temp_path)
+def test_get_notice_with_year_keeps_literal_braces(parse_template):
+    """Test that braces in the literal text and in the year are kept verbatim"""
+    template = parse_template(
+        "[.py]\n# Copyright {regex:\\d{4}} sny\n# See {LICENSE_FILE} and {}\n"
+    )[".py"]
 
+    assert template.get_notice_with_year("{0}") == (
+        "# Copyright {0} sny\n# See {LICENSE_FILE} and {}"
+    )
 
-def test_template_matches_without_regex():
-    """Test template matching with exact string match (no regex)"""
-    content = """[.txt]
-Copyright Notice
-All rights reserved
-"""
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+def test_line_patterns_built_once():
+    """Test that matching and year extraction reuse the patterns built at parse time"""
+    templates = CopyrightTemplateParser.parse_string(
+        "[.py]\n# Copyright {regex:\\d{4}(-\\d{4})?} sny\n# Author: Test\n"
+    )
+    template = templates[".py"]
+    content = "# Copyright 2020-2024 sny\n# Author: Test\n"
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".txt"]
+    with patch(
+        "scripts.copyright_template_parser.re.escape", side_effect=AssertionError
+    ):
+        assert template.matches(content)
+        assert template.extract_years(content) == (2020, 2024)
 
-        file_content = """Copyright Notice
-All rights reserved
 
-Some text content
-"""
-        assert template.matches(file_content) is True
+def test_template_is_frozen(parse_template):
+    """Test that parsed templates cannot be modified once shared"""
+    template = parse_template("[.py]\n# Copyright {regex:\\d{4}} sny\n")[".py"]
 
-        # Test with mismatch
-        file_content2 = """Copyright Notice
-Some other text
-"""
-        assert template.matches(file_content2) is False
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        template.lines = ["# Copyright other"]
+    # No field, derived ones included, can be changed in place either
+    for f in dataclasses.fields(template):
+        assert not isinstance(getattr(template, f.name), (list, dict, set)), f.name
 
 
-def test_get_notice_with_year():
-    """Test generating notice with specific year"""
+def test_template_uses_slots_and_is_hashable():
+    """Test that templates carry no instance dict and can be used as dict keys"""
     template = CopyrightTemplate(
-        extension=".py",
-        lines=["# Copyright {regex:\\d{4}} sny", "# Author: Test"],
-        regex_patterns=[None, None],
+        extension=".py", lines=["# Copyright {regex:\\d{4}} sny"], regex_patterns=[None]
     )
 
-    notice = template.get_notice_with_year(2026)
-    assert "2026" in notice
-    assert "Author: Test" in notice
+    assert not hasattr(template, "__dict__")
+    assert template.lines == ("# Copyright {regex:\\d{4}} sny",)
+    assert {template: 1}[
+        CopyrightTemplate(
+            extension=".py",
+            lines=("# Copyright {regex:\\d{4}} sny",),
+            regex_patterns=(None,),
+        )
+    ] == 1
+
+
+def test_find_all_matches_checks_only_candidate_lines():
+    """Test that only positions carrying the notice's literal lines are checked"""
+    template = CopyrightTemplateParser.parse_string(
+        "[.py]\n# Copyright {regex:\\d{4}} sny\n# Author: Test\n"
+    )[".py"]
+    notice = "# Copyright 2024 sny\n# Author: Test\n"
+    content = "x = 1\n" * 500 + notice + "# Copyright in a comment\n" + notice
+
+    with patch.object(
+        CopyrightTemplate,
+        "_matches_at_position",
+        autospec=True,
+        side_effect=CopyrightTemplate._matches_at_position,
+    ) as check:
+        assert template.find_all_matches(content) == [500, 503]
+
+    # "# Copyright in a comment" is not followed by "# Author: Test"
+    assert check.call_count == 2
+
+
+def test_find_all_matches_skips_lines_without_placeholder_suffix():
+    """Test that lines lacking the text after a placeholder are not candidates"""
+    template = CopyrightTemplateParser.parse_string(
+        "[.py]\n# Copyright {regex:\\d{4}} sny\n"
+    )[".py"]
+    content = "# Copyright 2024 Other Corp\n" * 50 + "# Copyright 2024 sny\n"
+
+    with patch.object(
+        CopyrightTemplate,
+        "_matches_at_position",
+        autospec=True,
+        side_effect=CopyrightTemplate._matches_at_position,
+    ) as check:
+        assert template.find_all_matches(content) == [50]
+
+    assert check.call_count == 1
+
+
+def test_content_without_notice_text_skips_scan():
+    """Test that content lacking the notice's longest literal text is not scanned"""
+    template = CopyrightTemplateParser.parse_string(
+        "[.py]\n# Copyright {regex:\\d{4}} sny\n# Author: Test Author\n"
+    )[".py"]
+
+    with patch("scripts.copyright_template_parser._line_starts", autospec=True) as scan:
+        assert template.find_all_matches("x = 1\n" * 1000) == []
+        scan.assert_not_called()
+
+
+def test_text_after_placeholder_rejects_content():
+    """Test that the literal text after a placeholder also rules out content"""
+    template = CopyrightTemplateParser.parse_string(
+        "[.py]\n# Copyright {regex:\\d{4}} SNY Group Corporation\n"
+    )[".py"]
+    content = "# Copyright 2024 Other Company\n" * 100
+
+    with patch("scripts.copyright_template_parser._line_starts", autospec=True) as scan:
+        assert not template.matches(content)
+        scan.assert_not_called()
+    assert template.matches("# Copyright 2024 SNY Group Corporation\n")
+
+
+@pytest.mark.parametrize(
+    "line,span",
+    [
+        ("# Copyright {regex:\\d{4}(-\\d{4})?} sny", (12, 34)),
+        ("{regex:a{1,2}}{regex:b}", (0, 14)),
+        ("# Broken {regex:\\d{4}", None),
+        ("# Copyright {YEAR} sny", None),
+    ],
+)
+def test_placeholder_span(line, span):
+    """Test that a placeholder ends at the brace closing its opening one"""
+    assert _placeholder_span(line) == span
+
+
+def test_pickled_template_matches_like_original():
+    """Test that a pickled template keeps its derived matching state"""
+    template = CopyrightTemplateParser.parse_string(
+        "[.py]\n# Copyright {regex:\\d{4}} sny\n"
+    )[".py"]
+
+    copy = pickle.loads(pickle.dumps(template))
+
+    assert copy == template
+    assert copy.find_all_matches("x = 1\n# Copyright 2024 sny\n") == [1]
+
+
+@pytest.mark.parametrize(
+    "content,offset,count",
+    [
+        ("a\nb\nc", 0, 2),
+        ("a\nb\nc", 2, 5),
+        ("a\nb\n", 2, 5),
+        ("a\r\n\nb", 0, 3),
+        ("", 0, 1),
+    ],
+)
+def test_lines_from_matches_split(content, offset, count):
+    """Test that partial line splitting agrees with str.split"""
+    expected = content[offset:].split("\n")[:count]
+    assert _lines_from(content, offset, count) == expected
+
+
+def test_extract_years_earliest_position_wins(parse_template):
+    """Test that the earliest notice position decides, then the first regex line"""
+    template = parse_template(
+        "[.py]\n# Since {regex:\\d{4}}\n# Copyright {regex:\\d{4}(-\\d{4})?} sny\n"
+    )[".py"]
+    content = (
+        "x = 1\n" * 300
+        + "# Copyright 2020-2024 sny\n# Since 2010\n# Copyright 2030 sny\n"
+    )
+
+    # Line 300 can only be the second template line of a notice at 299,
+    # which comes before the notice at 301 that "# Since 2010" starts
+    assert template.extract_years(content) == (2020, 2024)
+    assert template.extract_years("# Since 2010\n# Copyright 2030 sny\n") == (
+        2010,
+        None,
+    )
+    assert template.extract_years("# Copyright 2030 sny") is None
 
 
-def test_get_notice_with_year_replaces_regex():
+def test_get_notice_with_year_replaces_regex(parse_template):
     """Test that get_notice_with_year properly replaces regex placeholders"""
     content = """[.py]
 # Copyright {regex:\\d{4}(-\\d{4})?} sny Corporation
 # License: MIT
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
+    templates = parse_template(content)
+    template = templates[".py"]
 
-        notice = template.get_notice_with_year(2026)
+    notice = template.get_notice_with_year(2026)
 
-        assert "2026" in notice
-        assert "{regex:" not in notice
-        assert "sny Corporation" in notice
-        assert "License: MIT" in notice
-    finally:
-        os.unlink(temp_path)
+    assert "2026" in notice
+    assert "{regex:" not in notice
+    assert "sny Corporation" in notice
+    assert "License: MIT" in notice
 
 
-def test_parse_template_with_empty_lines():
+def test_parse_template_with_empty_lines(parse_template):
     """Test parsing template that includes empty lines within sections"""
     content = """[.py]
 # Copyright {regex:\\d{4}} sny
@@ -228,22 +445,15 @@ def test_parse_template_with_empty_lines():
 # This is a multi-line notice
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
+    template = templates[".py"]
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
+    # Should include the empty line in the middle
+    assert len(template.lines) == 3
+    assert template.lines[1] == ""
 
-        # Should include the empty line in the middle
-        assert len(template.lines) == 3
-        assert template.lines[1] == ""
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_template_strips_trailing_empty_lines():
+def test_parse_template_strips_trailing_empty_lines(parse_template):
     """Test that parser removes trailing empty lines from sections"""
     content = """[.py]
 # Copyright {regex:\\d{4}} sny
@@ -251,51 +461,26 @@ def test_parse_template_strips_trailing_empty_lines():
 
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
+    templates = parse_template(content)
+    template = templates[".py"]
 
-        # Trailing empty lines should be removed
-        assert len(template.lines) == 1
-        assert template.lines[-1] != ""
-    finally:
-        os.unlink(temp_path)
+    # Trailing empty lines should be removed
+    assert len(template.lines) == 1
+    assert template.lines[-1] != ""
 
 
-def test_template_matches_at_different_positions():
-    """Test that template can match copyright at different positions in file"""
+def test_parse_template_fixture_shares_templates(parse_template):
+    """Test that repeated content is parsed once but each caller gets its own dict"""
     content = """[.py]
-# Copyright {regex:\\d{4}} sny
+# Copyright {regex:\\d{4}} SNY Group Corporation
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    first = parse_template(content)
+    first.pop(".py")
+    second = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        # Copyright at beginning
-        file_content1 = """# Copyright 2026 sny
-def main():
-    pass
-"""
-        assert template.matches(file_content1) is True
-
-        # Copyright after shebang
-        file_content2 = """#!/usr/bin/env python
-# Copyright 2026 sny
-def main():
-    pass
-"""
-        assert template.matches(file_content2) is True
-    finally:
-        os.unlink(temp_path)
+    assert ".py" in second
+    assert second[".py"] is parse_template(content)[".py"]
 
 
 # ============================================================================
@@ -303,25 +488,18 @@ def main():
 # ============================================================================
 
 
-def test_parse_nonexistent_file():
+def test_parse_nonexistent_file(tmp_path):
     """Test parsing a file that doesn't exist"""
     with pytest.raises(FileNotFoundError):
-        CopyrightTemplateParser.parse("/nonexistent/path/to/file.txt")
+        CopyrightTemplateParser.parse(str(tmp_path / "missing.txt"))
 
 
 def test_parse_empty_file():
     """Test parsing an empty template file"""
     content = ""
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="No valid sections found"):
-            CopyrightTemplateParser.parse(temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(ValueError, match="No valid sections found"):
+        CopyrightTemplateParser.parse_string(content)
 
 
 def test_parse_file_without_sections():
@@ -330,136 +508,97 @@ def test_parse_file_without_sections():
 # No section headers
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    with pytest.raises(ValueError, match="No valid sections found"):
+        CopyrightTemplateParser.parse_string(content)
 
-    try:
-        with pytest.raises(ValueError, match="No valid sections found"):
-            CopyrightTemplateParser.parse(temp_path)
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_invalid_regex_pattern():
-    """Test parsing template with invalid regex pattern"""
+def test_parse_reuses_compiled_regex_patterns():
+    """Test that identical {regex:...} patterns share one compiled object"""
     content = """[.py]
-# Copyright {regex:[[[invalid} sny
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        with pytest.raises(ValueError, match="Invalid regex pattern"):
-            CopyrightTemplateParser.parse(temp_path)
-    finally:
-        os.unlink(temp_path)
-
+# Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation
 
-def test_parse_unmatched_braces():
-    """Test parsing template with unmatched braces in regex"""
-    content = """[.py]
-# Copyright {regex:\\d{4 sny
+[.sql]
+-- Copyright {regex:\\d{4}(-\\d{4})?} SNY Group Corporation
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    first = CopyrightTemplateParser.parse_string(content)
+    second = CopyrightTemplateParser.parse_string(content)
 
-    try:
-        with pytest.raises(ValueError, match="Unmatched braces"):
-            CopyrightTemplateParser.parse(temp_path)
-    finally:
-        os.unlink(temp_path)
+    pattern = first[".py"].regex_patterns[0]
+    assert pattern is first[".sql"].regex_patterns[0]
+    assert pattern is second[".py"].regex_patterns[0]
+    # The literal-prefix scanners are shared as well
+    assert first[".py"]._line_prefixes[0] is second[".py"]._line_prefixes[0]
 
 
-def test_template_no_match_different_text():
-    """Test that template doesn't match when text is different"""
-    content = """[.py]
-# Copyright {regex:\\d{4}} sny Corporation
-"""
+@pytest.mark.parametrize(
+    "line_break,extra_line",
+    [
+        ("\n", "# Licensed under MIT"),
+        ("\r\n", "# Licensed under MIT"),
+        ("\r", "# Licensed under MIT"),
+        # Characters str.splitlines() would also break at, unlike a file read
+        ("\n", "# Licensed\x0cunder\x1cMIT\x85and\u2028more"),
+    ],
+)
+def test_parse_string_matches_file_parse(template_file, line_break, extra_line):
+    """Test parsing template text from memory gives the same templates"""
+    content = f"""[VARIABLES]
+COMPANY = SNY Group Corporation
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+[.py, .sh]
+# Copyright {{regex:\\d{{4}}(-\\d{{4}})?}} {{COMPANY}}
+{extra_line}
+""".replace("\n", line_break)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
+    from_file = CopyrightTemplateParser.parse(template_file(content))
+    from_text = CopyrightTemplateParser.parse_string(content)
 
-        # Different company name
-        file_content = """# Copyright 2026 Microsoft Corporation
-def main():
-    pass
-"""
-        assert template.matches(file_content) is False
+    assert from_text.keys() == from_file.keys()
+    assert from_text[".sh"] is from_text[".py"]
+    assert from_text[".py"].lines == from_file[".py"].lines
+    assert from_text[".py"] == from_file[".py"]
 
-        # Missing copyright
-        file_content2 = """def main():
-    pass
-"""
-        assert template.matches(file_content2) is False
-    finally:
-        os.unlink(temp_path)
+
+def test_parse_string_without_sections():
+    """Test in-memory template text without sections names its source"""
+    with pytest.raises(ValueError, match="<string>"):
+        CopyrightTemplateParser.parse_string("no sections here\n")
 
 
-def test_template_no_match_wrong_year_format():
-    """Test that template doesn't match when year format is wrong"""
+def test_parse_text_stream():
+    """Test parsing a template from an open text stream"""
     content = """[.py]
-# Copyright {regex:\\d{4}} sny
+# Copyright {regex:\\d{4}} SNY Group Corporation
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = CopyrightTemplateParser.parse(io.StringIO(content))
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        # Wrong year format (3 digits instead of 4)
-        file_content = """# Copyright 202 sny
-def main():
-    pass
-"""
-        assert template.matches(file_content) is False
-
-        # No year at all
-        file_content2 = """# Copyright sny
-def main():
-    pass
-"""
-        assert template.matches(file_content2) is False
-    finally:
-        os.unlink(temp_path)
+    assert templates[".py"].lines == (
+        "# Copyright {regex:\\d{4}} SNY Group Corporation",
+    )
+    with pytest.raises(ValueError, match="<stream>"):
+        CopyrightTemplateParser.parse(io.StringIO("no sections here\n"))
 
 
-def test_template_no_match_incomplete_lines():
-    """Test that template doesn't match when file has incomplete copyright"""
+def test_parse_invalid_regex_pattern():
+    """Test parsing template with invalid regex pattern"""
     content = """[.py]
-# Copyright {regex:\\d{4}} sny
-# Author: Test Author
-# License: MIT
+# Copyright {regex:[[[invalid} sny
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    with pytest.raises(ValueError, match="Invalid regex pattern"):
+        CopyrightTemplateParser.parse_string(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
 
-        # Only first line present
-        file_content = """# Copyright 2026 sny
-def main():
-    pass
+def test_parse_unmatched_braces():
+    """Test parsing template with unmatched braces in regex"""
+    content = """[.py]
+# Copyright {regex:\\d{4 sny
 """
-        assert template.matches(file_content) is False
-    finally:
-        os.unlink(temp_path)
+
+    with pytest.raises(ValueError, match="Unmatched braces"):
+        CopyrightTemplateParser.parse_string(content)
 
 
 # ============================================================================
@@ -467,7 +606,7 @@ def main():
 # ============================================================================
 
 
-def test_parse_section_with_only_empty_lines():
+def test_parse_section_with_only_empty_lines(parse_template):
     """Test parsing a section that contains only empty lines"""
     content = """[.py]
 
@@ -476,23 +615,16 @@ def test_parse_section_with_only_empty_lines():
 -- Copyright 2026
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        # Empty section creates an empty template (current behavior)
-        assert ".py" in templates
-        assert len(templates[".py"].lines) == 0
-        assert ".sql" in templates
-        assert len(templates[".sql"].lines) == 1
-    finally:
-        os.unlink(temp_path)
+    # Empty section creates an empty template (current behavior)
+    assert ".py" in templates
+    assert len(templates[".py"].lines) == 0
+    assert ".sql" in templates
+    assert len(templates[".sql"].lines) == 1
 
 
-def test_parse_template_with_leading_empty_lines():
+def test_parse_template_with_leading_empty_lines(parse_template):
     """Test parsing template with empty lines before first section"""
     content = """
 
@@ -500,99 +632,15 @@ def test_parse_template_with_leading_empty_lines():
 # Copyright {regex:\\d{4}} sny
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-
-        assert ".py" in templates
-        assert len(templates[".py"].lines) == 1
-    finally:
-        os.unlink(temp_path)
-
-
-def test_template_matches_empty_content():
-    """Test template matching against empty content"""
-    template = CopyrightTemplate(
-        extension=".py", lines=["# Copyright 2026"], regex_patterns=[None]
-    )
-
-    assert template.matches("") is False
-
-
-def test_template_matches_content_shorter_than_template():
-    """Test template matching when content has fewer lines than template"""
-    template = CopyrightTemplate(
-        extension=".py",
-        lines=["# Copyright 2026", "# Author: Test", "# License: MIT"],
-        regex_patterns=[None, None, None],
-    )
-
-    file_content = """# Copyright 2026
-# Author: Test
-"""
-    assert template.matches(file_content) is False
-
-
-def test_template_with_whitespace_variations():
-    """Test template matching with various whitespace patterns"""
-    content = """[.py]
-# Copyright {regex:\\d{4}} sny
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        # Trailing whitespace should be handled
-        file_content1 = """# Copyright 2026 sny
-def main():
-    pass
-"""
-        assert template.matches(file_content1) is True
-
-        # Tab characters
-        file_content2 = """# Copyright 2026 sny\t
-def main():
-    pass
-"""
-        assert template.matches(file_content2) is True
-    finally:
-        os.unlink(temp_path)
-
-
-def test_template_single_line():
-    """Test template with only one line"""
-    content = """[.py]
-# Copyright {regex:\\d{4}} sny
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        assert len(template.lines) == 1
-        file_content = """# Copyright 2026 sny"""
-        assert template.matches(file_content) is True
-    finally:
-        os.unlink(temp_path)
+    assert ".py" in templates
+    assert len(templates[".py"].lines) == 1
 
 
 def test_get_notice_with_year_edge_values():
     """Test get_notice_with_year with edge case year values"""
-    template = CopyrightTemplate(
-        extension=".py", lines=["# Copyright {regex:\\d{4}} sny"], regex_patterns=[None]
-    )
+    template = _make_template(".py", "# Copyright {regex:\\d{4}} sny")
 
     # Very old year
     notice1 = template.get_notice_with_year(1900)
@@ -607,38 +655,7 @@ def test_get_notice_with_year_edge_values():
     assert "2000" in notice3
 
 
-def test_template_with_special_regex_characters():
-    """Test template with special regex characters in literal text"""
-    content = """[.py]
-# Copyright {regex:\\d{4}} sny (R&D)
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        # Parentheses should be matched literally, not as regex groups
-        file_content = """# Copyright 2026 sny (R&D)
-def main():
-    pass
-"""
-        assert template.matches(file_content) is True
-
-        # Should not match without parentheses
-        file_content2 = """# Copyright 2026 sny R&D
-def main():
-    pass
-"""
-        assert template.matches(file_content2) is False
-    finally:
-        os.unlink(temp_path)
-
-
-def test_template_with_multiple_regex_patterns_per_line():
+def test_template_with_multiple_regex_patterns_per_line(parse_template):
     """Test template with multiple {regex:...} patterns on one line (edge case)"""
     # This is an edge case - the current implementation only handles one regex per line
     # This test documents the current behavior
@@ -646,109 +663,35 @@ def test_template_with_multiple_regex_patterns_per_line():
 # Copyright {regex:\\d{4}} by {regex:\\w+}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        # Only the first regex pattern is extracted and compiled
-        assert template.regex_patterns[0] is not None
-    finally:
-        os.unlink(temp_path)
-
+    templates = parse_template(content)
+    template = templates[".py"]
 
-def test_template_with_very_long_line():
-    """Test template with very long copyright line"""
-    long_text = "A" * 500
-    content = f"""[.py]
-# Copyright {{regex:\\d{{4}}}} sny - {long_text}
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    # Only the first regex pattern is extracted and compiled
+    assert template.regex_patterns[0] is not None
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
 
-        file_content = f"""# Copyright 2026 sny - {long_text}
-def main():
-    pass
-"""
-        assert template.matches(file_content) is True
-    finally:
-        os.unlink(temp_path)
-
-
-def test_parse_section_header_variations():
+def test_parse_section_header_variations(parse_template):
     """Test various section header formats"""
     # Valid section header
     content1 = """[.py]
 # Copyright 2026
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content1)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        assert ".py" in templates
-    finally:
-        os.unlink(temp_path)
+    templates = parse_template(content1)
+    assert ".py" in templates
 
     # Section header with spaces (should be valid since we strip)
     content2 = """  [.js]
 // Copyright 2026
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content2)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        assert ".js" in templates
-    finally:
-        os.unlink(temp_path)
-
-
-def test_template_matches_with_line_endings():
-    """Test template matching with different line ending styles"""
-    content = """[.py]
-# Copyright {regex:\\d{4}} sny
-"""
-
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
-
-        # Unix line endings (LF)
-        file_content_lf = "# Copyright 2026 sny\ndef main():\n    pass"
-        assert template.matches(file_content_lf) is True
-
-        # Windows line endings (CRLF) - will be handled as LF after split
-        file_content_crlf = "# Copyright 2026 sny\r\ndef main():\r\n    pass"
-        assert template.matches(file_content_crlf) is True
-    finally:
-        os.unlink(temp_path)
+    templates = parse_template(content2)
+    assert ".js" in templates
 
 
 def test_template_get_notice_no_regex():
     """Test get_notice_with_year when template has no regex patterns"""
-    template = CopyrightTemplate(
-        extension=".txt",
-        lines=["Copyright Notice", "All rights reserved"],
-        regex_patterns=[None, None],
-    )
+    template = _make_template(".txt", "Copyright Notice", "All rights reserved")
 
     notice = template.get_notice_with_year(2026)
     # Should return the template as-is since there's no {regex:...} to replace
@@ -762,64 +705,50 @@ def test_template_get_notice_no_regex():
 # ============================================================================
 
 
-def test_parse_grouped_extensions_basic():
+def test_parse_grouped_extensions_basic(parse_template):
     """Test parsing template with grouped extensions [.ext1, .ext2, .ext3]"""
     content = """[.py, .yaml, .yml]
 # Copyright {regex:\\d{4}} SNY Group Corporation
 # Author: Test
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    # All three extensions should be present
+    assert ".py" in templates
+    assert ".yaml" in templates
+    assert ".yml" in templates
 
-        # All three extensions should be present
-        assert ".py" in templates
-        assert ".yaml" in templates
-        assert ".yml" in templates
+    # All share the same template
+    assert templates[".py"] is templates[".yaml"]
+    assert templates[".yaml"] is templates[".yml"]
 
-        # All should have the same template content
-        assert templates[".py"].lines == templates[".yaml"].lines
-        assert templates[".yaml"].lines == templates[".yml"].lines
+    # Verify content
+    assert len(templates[".py"].lines) == 2
+    assert "Copyright" in templates[".py"].lines[0]
 
-        # Verify content
-        assert len(templates[".py"].lines) == 2
-        assert "Copyright" in templates[".py"].lines[0]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_grouped_extensions_with_spaces():
+def test_parse_grouped_extensions_with_spaces(parse_template):
     """Test grouped extensions with various spacing"""
     content = """[.js,.ts,  .go  , .rs]
 // Copyright 2026 SNY
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        # All extensions should be parsed correctly despite spacing
-        assert ".js" in templates
-        assert ".ts" in templates
-        assert ".go" in templates
-        assert ".rs" in templates
+    # All extensions should be parsed correctly despite spacing
+    assert ".js" in templates
+    assert ".ts" in templates
+    assert ".go" in templates
+    assert ".rs" in templates
 
-        # All should have identical content
-        assert templates[".js"].lines == templates[".ts"].lines
-        assert templates[".ts"].lines == templates[".go"].lines
-        assert templates[".go"].lines == templates[".rs"].lines
-    finally:
-        os.unlink(temp_path)
+    # All share the same template
+    assert templates[".js"] is templates[".ts"]
+    assert templates[".ts"] is templates[".go"]
+    assert templates[".go"] is templates[".rs"]
 
 
-def test_parse_mixed_grouped_and_single_extensions():
+def test_parse_mixed_grouped_and_single_extensions(parse_template):
     """Test mixing grouped and single extension sections"""
     content = """[.py, .yaml]
 # Python/YAML copyright
@@ -831,105 +760,77 @@ def test_parse_mixed_grouped_and_single_extensions():
 // JS/TS copyright
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    # Check all extensions are present
+    assert ".py" in templates
+    assert ".yaml" in templates
+    assert ".sql" in templates
+    assert ".js" in templates
+    assert ".ts" in templates
 
-        # Check all extensions are present
-        assert ".py" in templates
-        assert ".yaml" in templates
-        assert ".sql" in templates
-        assert ".js" in templates
-        assert ".ts" in templates
+    # Grouped extensions should share templates
+    assert templates[".py"] is templates[".yaml"]
+    assert templates[".js"] is templates[".ts"]
 
-        # Grouped extensions should share templates
-        assert templates[".py"].lines == templates[".yaml"].lines
-        assert templates[".js"].lines == templates[".ts"].lines
+    # But different groups should have different templates
+    assert templates[".py"].lines != templates[".sql"].lines
+    assert templates[".sql"].lines != templates[".js"].lines
 
-        # But different groups should have different templates
-        assert templates[".py"].lines != templates[".sql"].lines
-        assert templates[".sql"].lines != templates[".js"].lines
-    finally:
-        os.unlink(temp_path)
 
-
-def test_grouped_extensions_all_match_same_content():
+def test_grouped_extensions_all_match_same_content(parse_template):
     """Test that all extensions in a group match the same file content"""
     content = """[.py, .yaml, .sh]
 # Copyright {regex:\\d{4}} SNY Corporation
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        file_content = """# Copyright 2026 SNY Corporation
+    file_content = """# Copyright 2026 SNY Corporation
 
 def main():
     pass
 """
 
-        # All grouped extensions should match the same content
-        assert templates[".py"].matches(file_content) is True
-        assert templates[".yaml"].matches(file_content) is True
-        assert templates[".sh"].matches(file_content) is True
-    finally:
-        os.unlink(temp_path)
+    # All grouped extensions should match the same content
+    assert templates[".py"].matches(file_content) is True
+    assert templates[".yaml"].matches(file_content) is True
+    assert templates[".sh"].matches(file_content) is True
 
 
-def test_grouped_extensions_get_notice_with_year():
+def test_grouped_extensions_get_notice_with_year(parse_template):
     """Test that all extensions in a group generate the same notice"""
     content = """[.js, .ts, .go]
 // Copyright {regex:\\d{4}(-\\d{4})?} SNY Group
 // Author: Test
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        # All should generate the same notice for the same year
-        notice_js = templates[".js"].get_notice_with_year(2026)
-        notice_ts = templates[".ts"].get_notice_with_year(2026)
-        notice_go = templates[".go"].get_notice_with_year(2026)
+    # All should generate the same notice for the same year
+    notice_js = templates[".js"].get_notice_with_year(2026)
+    notice_ts = templates[".ts"].get_notice_with_year(2026)
+    notice_go = templates[".go"].get_notice_with_year(2026)
 
-        assert notice_js == notice_ts
-        assert notice_ts == notice_go
-        assert "2026" in notice_js
-        assert "SNY Group" in notice_js
-    finally:
-        os.unlink(temp_path)
+    assert notice_js == notice_ts
+    assert notice_ts == notice_go
+    assert "2026" in notice_js
+    assert "SNY Group" in notice_js
 
 
-def test_grouped_extensions_single_extension():
+def test_grouped_extensions_single_extension(parse_template):
     """Test that single extension in brackets still works"""
     content = """[.py]
 # Copyright 2026 SNY
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert ".py" in templates
+    assert "Copyright" in templates[".py"].lines[0]
 
-        assert ".py" in templates
-        assert "Copyright" in templates[".py"].lines[0]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_grouped_extensions_multiple_groups():
+def test_grouped_extensions_multiple_groups(parse_template):
     """Test multiple grouped extension sections"""
     content = """[.c, .h, .cpp]
 /* C/C++ copyright */
@@ -941,34 +842,27 @@ def test_grouped_extensions_multiple_groups():
 # Python/Ruby copyright
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        # Should have 7 extensions total
-        assert len(templates) == 7
+    # Should have 7 extensions total
+    assert len(templates) == 7
 
-        # First group
-        assert templates[".c"].lines == templates[".h"].lines
-        assert templates[".h"].lines == templates[".cpp"].lines
+    # First group
+    assert templates[".c"] is templates[".h"]
+    assert templates[".h"] is templates[".cpp"]
 
-        # Second group
-        assert templates[".js"].lines == templates[".ts"].lines
+    # Second group
+    assert templates[".js"] is templates[".ts"]
 
-        # Third group
-        assert templates[".py"].lines == templates[".rb"].lines
+    # Third group
+    assert templates[".py"] is templates[".rb"]
 
-        # Different groups should have different content
-        assert templates[".c"].lines != templates[".js"].lines
-        assert templates[".js"].lines != templates[".py"].lines
-    finally:
-        os.unlink(temp_path)
+    # Different groups should have different content
+    assert templates[".c"].lines != templates[".js"].lines
+    assert templates[".js"].lines != templates[".py"].lines
 
 
-def test_grouped_extensions_with_regex_patterns():
+def test_grouped_extensions_with_regex_patterns(parse_template):
     """Test grouped extensions with complex regex patterns"""
     content = """[.c, .cpp, .h]
 /**************************************************************************
@@ -977,34 +871,27 @@ def test_grouped_extensions_with_regex_patterns():
 **************************************************************************/
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    # All should have the regex pattern
+    assert templates[".c"].regex_patterns[1] is not None
+    assert templates[".cpp"].regex_patterns[1] is not None
+    assert templates[".h"].regex_patterns[1] is not None
 
-        # All should have the regex pattern
-        assert templates[".c"].regex_patterns[1] is not None
-        assert templates[".cpp"].regex_patterns[1] is not None
-        assert templates[".h"].regex_patterns[1] is not None
-
-        # Test matching with year range
-        file_content = """/**************************************************************************
+    # Test matching with year range
+    file_content = """/**************************************************************************
 * Copyright 2020-2026 SNY Group Corporation                 *
 * License: For licensing see the License.txt file                         *
 **************************************************************************/
 
 int main() {}
 """
-        assert templates[".c"].matches(file_content) is True
-        assert templates[".cpp"].matches(file_content) is True
-        assert templates[".h"].matches(file_content) is True
-    finally:
-        os.unlink(temp_path)
+    assert templates[".c"].matches(file_content) is True
+    assert templates[".cpp"].matches(file_content) is True
+    assert templates[".h"].matches(file_content) is True
 
 
-def test_grouped_extensions_empty_section():
+def test_grouped_extensions_empty_section(parse_template):
     """Test grouped extensions with empty section"""
     content = """[.py, .yaml]
 
@@ -1013,24 +900,19 @@ def test_grouped_extensions_empty_section():
 -- SQL copyright
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        # Both extensions should exist with empty lines
-        assert ".py" in templates
-        assert ".yaml" in templates
-        assert len(templates[".py"].lines) == 0
-        assert len(templates[".yaml"].lines) == 0
+    # Both extensions should exist with empty lines
+    assert ".py" in templates
+    assert ".yaml" in templates
+    assert len(templates[".py"].lines) == 0
+    assert len(templates[".yaml"].lines) == 0
+    # A template without lines matches at every line
+    assert templates[".py"].find_all_matches("a\nb\n") == [0, 1, 2]
 
-        # SQL should have content
-        assert ".sql" in templates
-        assert len(templates[".sql"].lines) == 1
-    finally:
-        os.unlink(temp_path)
+    # SQL should have content
+    assert ".sql" in templates
+    assert len(templates[".sql"].lines) == 1
 
 
 # ============================================================================
@@ -1038,7 +920,7 @@ def test_grouped_extensions_empty_section():
 # ============================================================================
 
 
-def test_parse_template_with_variables():
+def test_parse_template_with_variables(parse_template):
     """Test parsing template with [VARIABLES] section"""
     content = """[VARIABLES]
 COMPANY = Sony Group Corporation
@@ -1049,25 +931,18 @@ AUTHOR = Test Author
 # Author: {AUTHOR}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert ".py" in templates
+    template = templates[".py"]
+    assert "Sony Group Corporation" in template.lines[0]
+    assert "Test Author" in template.lines[1]
+    # Variables should be substituted, not remain as placeholders
+    assert "{COMPANY}" not in template.lines[0]
+    assert "{AUTHOR}" not in template.lines[1]
 
-        assert ".py" in templates
-        template = templates[".py"]
-        assert "Sony Group Corporation" in template.lines[0]
-        assert "Test Author" in template.lines[1]
-        # Variables should be substituted, not remain as placeholders
-        assert "{COMPANY}" not in template.lines[0]
-        assert "{AUTHOR}" not in template.lines[1]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_template_with_spdx_variable():
+def test_parse_template_with_spdx_variable(parse_template):
     """Test parsing template with SPDX license variable"""
     content = """[VARIABLES]
 SPDX_LICENSE = MIT
@@ -1078,22 +953,15 @@ COMPANY = Sony Corporation
 # Copyright 2026 {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        assert ".py" in templates
-        template = templates[".py"]
-        assert "SPDX-License-Identifier: MIT" in template.lines[0]
-        assert "Sony Corporation" in template.lines[1]
-    finally:
-        os.unlink(temp_path)
+    assert ".py" in templates
+    template = templates[".py"]
+    assert "SPDX-License-Identifier: MIT" in template.lines[0]
+    assert "Sony Corporation" in template.lines[1]
 
 
-def test_parse_template_with_variables_and_regex():
+def test_parse_template_with_variables_and_regex(parse_template):
     """Test that variables and regex patterns can coexist"""
     content = """[VARIABLES]
 COMPANY = Sony Group Corporation
@@ -1103,26 +971,19 @@ YEAR_PATTERN = {regex:\\d{4}(-\\d{4})?}
 # Copyright {YEAR_PATTERN} {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert ".py" in templates
+    template = templates[".py"]
+    # YEAR_PATTERN variable should be substituted with regex pattern
+    assert "{regex:\\d{4}(-\\d{4})?}" in template.lines[0]
+    assert "Sony Group Corporation" in template.lines[0]
+    # Variable placeholder should be gone
+    assert "{YEAR_PATTERN}" not in template.lines[0]
+    assert "{COMPANY}" not in template.lines[0]
 
-        assert ".py" in templates
-        template = templates[".py"]
-        # YEAR_PATTERN variable should be substituted with regex pattern
-        assert "{regex:\\d{4}(-\\d{4})?}" in template.lines[0]
-        assert "Sony Group Corporation" in template.lines[0]
-        # Variable placeholder should be gone
-        assert "{YEAR_PATTERN}" not in template.lines[0]
-        assert "{COMPANY}" not in template.lines[0]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_template_variables_multiple_sections():
+def test_parse_template_variables_multiple_sections(parse_template):
     """Test variables work across multiple file extension sections"""
     content = """[VARIABLES]
 COMPANY = Sony Group
@@ -1134,23 +995,16 @@ COMPANY = Sony Group
 // Copyright {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        assert ".py" in templates
-        assert ".js" in templates
-        # Both should have the variable substituted
-        assert "Sony Group" in templates[".py"].lines[0]
-        assert "Sony Group" in templates[".js"].lines[0]
-    finally:
-        os.unlink(temp_path)
+    assert ".py" in templates
+    assert ".js" in templates
+    # Both should have the variable substituted
+    assert "Sony Group" in templates[".py"].lines[0]
+    assert "Sony Group" in templates[".js"].lines[0]
 
 
-def test_parse_template_variables_with_grouped_extensions():
+def test_parse_template_variables_with_grouped_extensions(parse_template):
     """Test variables work with grouped extensions"""
     content = """[VARIABLES]
 COMPANY = Sony Corporation
@@ -1161,44 +1015,30 @@ SPDX_LICENSE = Apache-2.0
 # Copyright 2026 {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert ".py" in templates
+    assert ".yaml" in templates
+    assert ".yml" in templates
+    # All should have variables substituted
+    for ext in [".py", ".yaml", ".yml"]:
+        assert "Apache-2.0" in templates[ext].lines[0]
+        assert "Sony Corporation" in templates[ext].lines[1]
 
-        assert ".py" in templates
-        assert ".yaml" in templates
-        assert ".yml" in templates
-        # All should have variables substituted
-        for ext in [".py", ".yaml", ".yml"]:
-            assert "Apache-2.0" in templates[ext].lines[0]
-            assert "Sony Corporation" in templates[ext].lines[1]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_template_no_variables_section():
+def test_parse_template_no_variables_section(parse_template):
     """Test backward compatibility - templates without [VARIABLES] still work"""
     content = """[.py]
 # Copyright 2026 Sony Group Corporation
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        assert ".py" in templates
-        assert "Sony Group Corporation" in templates[".py"].lines[0]
-    finally:
-        os.unlink(temp_path)
+    assert ".py" in templates
+    assert "Sony Group Corporation" in templates[".py"].lines[0]
 
 
-def test_parse_template_empty_variables_section():
+def test_parse_template_empty_variables_section(parse_template):
     """Test template with empty [VARIABLES] section"""
     content = """[VARIABLES]
 
@@ -1206,20 +1046,13 @@ def test_parse_template_empty_variables_section():
 # Copyright 2026 Sony
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert ".py" in templates
+    assert "Sony" in templates[".py"].lines[0]
 
-        assert ".py" in templates
-        assert "Sony" in templates[".py"].lines[0]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_parse_template_variable_with_spaces():
+def test_parse_template_variable_with_spaces(parse_template):
     """Test variable values with spaces are handled correctly"""
     content = """[VARIABLES]
 COMPANY = Sony Group Corporation Europe
@@ -1230,20 +1063,13 @@ AUTHOR = R&D Center Europe Brussels Laboratory
 # Author: {AUTHOR}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        assert "Sony Group Corporation Europe" in templates[".py"].lines[0]
-        assert "R&D Center Europe Brussels Laboratory" in templates[".py"].lines[1]
-    finally:
-        os.unlink(temp_path)
+    assert "Sony Group Corporation Europe" in templates[".py"].lines[0]
+    assert "R&D Center Europe Brussels Laboratory" in templates[".py"].lines[1]
 
 
-def test_parse_template_unused_variables():
+def test_parse_template_unused_variables(parse_template):
     """Test that unused variables don't cause errors"""
     content = """[VARIABLES]
 COMPANY = Sony
@@ -1253,20 +1079,29 @@ UNUSED_VAR = Some Value
 # Copyright {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert ".py" in templates
+    assert "Sony" in templates[".py"].lines[0]
 
-        assert ".py" in templates
-        assert "Sony" in templates[".py"].lines[0]
-    finally:
-        os.unlink(temp_path)
 
+def test_parse_template_variable_referencing_later_variable(parse_template):
+    """Test that a value using a variable defined after it is expanded in order"""
+    content = """[VARIABLES]
+HOLDER = {COMPANY} Group
+COMPANY = Sony
+OWNER = {HOLDER}
 
-def test_variables_template_matches_content():
+[.py]
+# Copyright {HOLDER}, {OWNER}, {{COMPANY}}
+"""
+
+    templates = parse_template(content)
+
+    assert templates[".py"].lines == ("# Copyright Sony Group, {HOLDER}, {Sony}",)
+
+
+def test_variables_template_matches_content(parse_template):
     """Test that templates with variables can match file content"""
     content = """[VARIABLES]
 COMPANY = Sony Group Corporation
@@ -1277,26 +1112,19 @@ YEAR_PATTERN = {regex:\\d{4}(-\\d{4})?}
 # Author: Test
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
+    templates = parse_template(content)
+    template = templates[".py"]
 
-        file_content = """# Copyright 2026 Sony Group Corporation
+    file_content = """# Copyright 2026 Sony Group Corporation
 # Author: Test
 
 def main():
     pass
 """
-        assert template.matches(file_content) is True
-    finally:
-        os.unlink(temp_path)
+    assert template.matches(file_content) is True
 
 
-def test_parse_template_undefined_variable():
+def test_parse_template_undefined_variable(parse_template):
     """Test that undefined variables remain as placeholders"""
     content = """[VARIABLES]
 COMPANY = Sony
@@ -1306,22 +1134,15 @@ COMPANY = Sony
 # Author: {UNDEFINED_VAR}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        # Defined variable should be substituted
-        assert "Sony" in templates[".py"].lines[0]
-        # Undefined variable should remain as placeholder
-        assert "{UNDEFINED_VAR}" in templates[".py"].lines[1]
-    finally:
-        os.unlink(temp_path)
+    # Defined variable should be substituted
+    assert "Sony" in templates[".py"].lines[0]
+    # Undefined variable should remain as placeholder
+    assert "{UNDEFINED_VAR}" in templates[".py"].lines[1]
 
 
-def test_parse_template_multiple_variables_sections():
+def test_parse_template_multiple_variables_sections(parse_template):
     """Test that only the first [VARIABLES] section is used"""
     content = """[VARIABLES]
 COMPANY = First Company
@@ -1336,21 +1157,14 @@ COMPANY = Second Company
 // Copyright {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    # Both should use the first VARIABLES section
+    assert "First Company" in templates[".py"].lines[0]
+    assert "First Company" in templates[".js"].lines[0]
 
-        # Both should use the first VARIABLES section
-        assert "First Company" in templates[".py"].lines[0]
-        assert "First Company" in templates[".js"].lines[0]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_variables_get_notice_with_year():
+def test_variables_get_notice_with_year(parse_template):
     """Test that variables work correctly in get_notice_with_year"""
     content = """[VARIABLES]
 COMPANY = Sony Corporation
@@ -1361,29 +1175,22 @@ YEAR_PATTERN = {regex:\\d{4}(-\\d{4})?}
 # Author: Test Team
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
-        template = templates[".py"]
+    templates = parse_template(content)
+    template = templates[".py"]
 
-        # Generate notice with year
-        notice = template.get_notice_with_year(2026)
+    # Generate notice with year
+    notice = template.get_notice_with_year(2026)
 
-        # Should have year substituted and company name
-        assert "2026" in notice
-        assert "Sony Corporation" in notice
-        assert "Test Team" in notice
-        # Variable placeholders should be gone
-        assert "{COMPANY}" not in notice
-        assert "{YEAR_PATTERN}" not in notice
-    finally:
-        os.unlink(temp_path)
+    # Should have year substituted and company name
+    assert "2026" in notice
+    assert "Sony Corporation" in notice
+    assert "Test Team" in notice
+    # Variable placeholders should be gone
+    assert "{COMPANY}" not in notice
+    assert "{YEAR_PATTERN}" not in notice
 
 
-def test_variables_special_characters():
+def test_variables_special_characters(parse_template):
     """Test variables with special characters in values"""
     content = """[VARIABLES]
 COMPANY = Sony & Associates (Europe)
@@ -1394,20 +1201,13 @@ LICENSE = MIT/Apache-2.0
 # License: {LICENSE}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
+    templates = parse_template(content)
 
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    assert "Sony & Associates (Europe)" in templates[".py"].lines[0]
+    assert "MIT/Apache-2.0" in templates[".py"].lines[1]
 
-        assert "Sony & Associates (Europe)" in templates[".py"].lines[0]
-        assert "MIT/Apache-2.0" in templates[".py"].lines[1]
-    finally:
-        os.unlink(temp_path)
 
-
-def test_variables_empty_value():
+def test_variables_empty_value(parse_template):
     """Test variable with empty value"""
     content = """[VARIABLES]
 COMPANY = Sony
@@ -1418,21 +1218,14 @@ OPTIONAL_FIELD =
 # Optional: {OPTIONAL_FIELD}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        assert "Sony" in templates[".py"].lines[0]
-        # Empty variable should result in just the prefix
-        assert "Optional: " in templates[".py"].lines[1]
-    finally:
-        os.unlink(temp_path)
+    assert "Sony" in templates[".py"].lines[0]
+    # Empty variable should result in just the prefix
+    assert "Optional: " in templates[".py"].lines[1]
 
 
-def test_variables_case_sensitive():
+def test_variables_case_sensitive(parse_template):
     """Test that variable names are case-sensitive"""
     content = """[VARIABLES]
 company = Lower Case
@@ -1443,18 +1236,16 @@ COMPANY = Upper Case
 # Also: {COMPANY}
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
-        f.write(content)
-        temp_path = f.name
-
-    try:
-        templates = CopyrightTemplateParser.parse(temp_path)
+    templates = parse_template(content)
 
-        assert "Lower Case" in templates[".py"].lines[0]
-        assert "Upper Case" in templates[".py"].lines[1]
-    finally:
-        os.unlink(temp_path)
+    assert "Lower Case" in templates[".py"].lines[0]
+    assert "Upper Case" in templates[".py"].lines[1]
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    # These tests share no files, so when pytest-xdist is installed they are
+    # spread over the workers test by test rather than module by module
+    args = [__file__, "-v"]
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist", "load"]
+    pytest.main(args)
@@ -7,61 +7,106 @@
 
 """Debug string state before line 464"""
 
-content = open("tests/test_duplicate_detection.py", "r").read()
-lines = content.split("\n")
-
-
-def trace_string_state(lines, end_line):
-    """Trace string state up to end_line"""
-    in_string = False
-    string_delimiter = None
-
-    for i in range(end_line + 1):
-        line = lines[i]
-
-        # Check for triple-quoted strings (but not escaped ones)
-        for delimiter in ['"""', "'''"]:
-            # Find all non-escaped occurrences of the delimiter
-            count = 0
-            pos = 0
-            while True:
-                pos = line.find(delimiter, pos)
-                if pos == -1:
-                    break
-                # Check if it's escaped (preceded by odd number of backslashes)
-                num_backslashes = 0
-                check_pos = pos - 1
-                while check_pos >= 0 and line[check_pos] == "\\":
-                    num_backslashes += 1
-                    check_pos -= 1
-                # If even number of backslashes (including 0), it's not escaped
-                if num_backslashes % 2 == 0:
-                    count += 1
-                pos += len(delimiter)
-
-            if count > 0:
-                # Toggle string state for each non-escaped delimiter found
-                for _ in range(count):
-                    old_state = in_string
-                    if not in_string:
-                        in_string = True
-                        string_delimiter = delimiter
-                    elif string_delimiter == delimiter:
-                        in_string = False
-                        string_delimiter = None
-                    print(
-                        f"Line {i}: {old_state} -> {in_string} after {repr(delimiter)}"
-                    )
-
-        if i == end_line:
-            return in_string
-
-    return in_string
+import os
+import re
+import sys
+from itertools import islice
+
+# Triple-quote delimiters
+_DELIMITERS = ('"""', "'''")
+# The same delimiters as they appear in the raw bytes of the file
+_DELIMITER_BYTES = tuple(delimiter.encode() for delimiter in _DELIMITERS)
+# A triple-quote delimiter with the backslashes right before it
+_DELIMITER_RE = re.compile(rb"""(\\*)(\"\"\"|''')""")
+
+# Traces already done, by path: the file's mtime, the in_string state after
+# each traced line, the (line, old, new, delimiter) transitions and the
+# delimiter of the open string at the end of the traced lines
+_traces = {}
+
+
+def _trace_lines(lines, trace):
+    """Extend trace with the string state after each of lines"""
+    states = trace["states"]
+    transitions = trace["transitions"]
+    in_string = states[-1] if states else False
+    string_delimiter = trace["delimiter"]
+
+    for i, line in enumerate(lines, len(states)):
+        # Most lines have no quote at all and cannot change the state
+        if b'"' not in line and b"'" not in line:
+            states.append(in_string)
+            continue
+
+        # Count the triple-quoted string delimiters (but not escaped ones)
+        if b"\\" not in line:
+            # Nothing can be escaped, so every occurrence counts
+            counts = [line.count(delimiter) for delimiter in _DELIMITER_BYTES]
+        else:
+            # One pass over the line finds both delimiters
+            counts = [0, 0]
+            for match in _DELIMITER_RE.finditer(line):
+                # The backslash run is the span before the delimiter, so its
+                # length needs no substring; an odd run escapes the delimiter
+                if (match.start(2) - match.start(1)) % 2 == 0:
+                    # The first byte tells the two delimiters apart
+                    counts[line[match.start(2)] != ord('"')] += 1
+
+        # Toggle string state for each non-escaped delimiter found; a line's
+        # double-quote delimiters are applied before its single-quote ones
+        for delimiter, count in zip(_DELIMITERS, counts):
+            for _ in range(count):
+                old_state = in_string
+                if not in_string:
+                    in_string = True
+                    string_delimiter = delimiter
+                elif string_delimiter == delimiter:
+                    in_string = False
+                    string_delimiter = None
+                transitions.append((i, old_state, in_string, delimiter))
+        states.append(in_string)
+
+    trace["delimiter"] = string_delimiter
+
+
+def trace_string_state(path, end_line, verbose=False):
+    """Trace string state up to end_line, printing each change if verbose"""
+    # A trace is reused until the file changes, and a later end_line only
+    # traces the lines after the ones already done
+    mtime = os.stat(path).st_mtime_ns
+    trace = _traces.get(path)
+    if trace is None or trace["mtime"] != mtime:
+        trace = {"mtime": mtime, "states": [], "transitions": [], "delimiter": None}
+        _traces[path] = trace
+
+    states = trace["states"]
+    if len(states) <= end_line:
+        # Only the lines up to end_line are read, as undecoded bytes: the
+        # delimiters and backslashes are ASCII, so no decoding is needed to
+        # find them, and a trailing newline does not affect the checks
+        with open(path, "rb") as f:
+            _trace_lines(islice(f, len(states), end_line + 1), trace)
+
+    if verbose:
+        transitions = [t for t in trace["transitions"] if t[0] <= end_line]
+        if transitions:
+            sys.stdout.write(
+                "\n".join(
+                    f"Line {i}: {old} -> {new} after {delimiter!r}"
+                    for i, old, new, delimiter in transitions
+                )
+                + "\n"
+            )
+
+    # A file shorter than end_line ends in the state after its last line
+    if not states:
+        return False
+    return states[min(end_line, len(states) - 1)]
 
 
 # Trace up to line 466
 print("Tracing string state from start to line 466:")
 print("=" * 60)
-result = trace_string_state(lines, 466)
+result = trace_string_state("tests/test_duplicate_detection.py", 466, verbose=True)
 print("=" * 60)
 print(f"\nFinal state at line 466: in_string={result}")